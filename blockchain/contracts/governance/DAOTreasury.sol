@@ -44,6 +44,25 @@ contract DAOTreasury is AccessControl {
         emit RewardDistributed(agent, amount);
     }
 
+    function distributeRewards(address[] calldata agents, uint256[] calldata amounts)
+        external
+        onlyRole(MISSION_ROLE)
+    {
+        require(agents.length == amounts.length, "Length mismatch");
+
+        uint256 total = 0;
+        for (uint256 i = 0; i < amounts.length; i++) {
+            total += amounts[i];
+        }
+        require(daoToken.balanceOf(address(this)) >= total, "Insufficient treasury funds");
+
+        for (uint256 i = 0; i < agents.length; i++) {
+            require(daoToken.transfer(agents[i], amounts[i]), "Transfer failed");
+            agentRewards[agents[i]] += amounts[i];
+            emit RewardDistributed(agents[i], amounts[i]);
+        }
+    }
+
     function deposit(uint256 amount) external {
         require(daoToken.transferFrom(msg.sender, address(this), amount), "Transfer failed");
         emit TreasuryDeposit(msg.sender, amount);
@@ -5,15 +5,25 @@ This script provides detailed analysis and visualization of simulation results.
 """
 
 import json
+import sys
+from typing import Optional
 from dao_simulation import DAOSimulation, ProposalState, MissionStatus
+from metrics_recorder import MetricsRecorder
 
 
-def detailed_mission_analysis():
+def _record(recorder: Optional[MetricsRecorder], dao: DAOSimulation):
+    """Capture a metrics row if a recorder was supplied"""
+    if recorder is not None:
+        recorder.record_tick(dao)
+
+
+def detailed_mission_analysis(recorder: Optional[MetricsRecorder] = None):
     """Run a detailed analysis of mission assignment and execution"""
     print("🔍 Detailed Mission Analysis")
     print("=" * 50)
     
     dao = DAOSimulation()
+    _record(recorder, dao)
     
     # Add members
     member1 = dao.add_member("Alice", 10000)
@@ -58,6 +68,7 @@ def detailed_mission_analysis():
     dao.vote_on_proposal(proposal_id, member1, True)
     dao.vote_on_proposal(proposal_id, member2, True)
     dao.finalize_proposal(proposal_id)
+    _record(recorder, dao)
     
     # Find the mission
     mission_id = None
@@ -116,6 +127,7 @@ def detailed_mission_analysis():
         if assigned_agents:
             print(f"\n⚡ Mission Execution Simulation:")
             results = dao.simulate_mission_execution(mission_id, days_to_simulate=20)
+            _record(recorder, dao)
             
             print(f"Final outcome: {results['final_outcome']}")
             print(f"Mission progress: {mission.progress:.1%}")
@@ -137,12 +149,13 @@ def detailed_mission_analysis():
     return dao
 
 
-def test_economic_model():
+def test_economic_model(recorder: Optional[MetricsRecorder] = None):
     """Test the economic incentive model"""
     print("\n\n💰 Economic Model Analysis")
     print("=" * 50)
     
     dao = DAOSimulation()
+    _record(recorder, dao)
     
     # Add members and agents
     member1 = dao.add_member("Investor", 20000)
@@ -190,6 +203,7 @@ def test_economic_model():
                 if assigned:
                     dao.simulate_mission_execution(mid, days_to_simulate=15)
                 break
+        _record(recorder, dao)
     
     # Analyze economic results
     print(f"\nEconomic Results After {len(mission_ids)} Missions:")
@@ -209,12 +223,13 @@ def test_economic_model():
     return dao
 
 
-def governance_stress_test():
+def governance_stress_test(recorder: Optional[MetricsRecorder] = None):
     """Test governance mechanisms under various scenarios"""
     print("\n\n🏛️ Governance Stress Test")
     print("=" * 50)
     
     dao = DAOSimulation()
+    _record(recorder, dao)
     
     # Create diverse member base
     members = []
@@ -289,15 +304,16 @@ def governance_stress_test():
             vote = hash(member_id + proposal_id) % 100 < vote_prob * 100
             dao.vote_on_proposal(proposal_id, member_id, vote)
             
-            voting_power = dao.members[member_id].get_voting_power()
+            voting_power = dao.get_voting_power(member_id)
             print(f"  {name}: {'YES' if vote else 'NO'} (power: {voting_power:,.0f})")
         
         # Finalize and show results
         success = dao.finalize_proposal(proposal_id)
         proposal = dao.proposals[proposal_id]
+        _record(recorder, dao)
         
         total_votes = proposal.for_votes + proposal.against_votes
-        participation = total_votes / sum(m.get_voting_power() for m in dao.members.values())
+        participation = total_votes / sum(dao.get_voting_power(m) for m in dao.members)
         
         print(f"  Result: {'✅ PASSED' if success else '❌ FAILED'}")
         print(f"  For: {proposal.for_votes:,.0f} | Against: {proposal.against_votes:,.0f}")
@@ -307,10 +323,22 @@ def governance_stress_test():
 
 
 if __name__ == "__main__":
+    # Optional: python analyze_simulation.py <metrics_dir> to export per-tick metrics
+    metrics_dir = sys.argv[1] if len(sys.argv) > 1 else None
+    recorders = {
+        name: MetricsRecorder(metrics_dir, run_name=name, reputation_quantiles=True) if metrics_dir else None
+        for name in ("mission_analysis", "economic_model", "governance_stress")
+    }
+    
     # Run detailed analysis
-    dao1 = detailed_mission_analysis()
-    dao2 = test_economic_model()
-    dao3 = governance_stress_test()
+    dao1 = detailed_mission_analysis(recorders["mission_analysis"])
+    dao2 = test_economic_model(recorders["economic_model"])
+    dao3 = governance_stress_test(recorders["governance_stress"])
+    
+    if metrics_dir:
+        for recorder in recorders.values():
+            recorder.flush()
+        print(f"\n📁 Metrics written to {metrics_dir}")
     
     print("\n\n✅ Analysis Complete!")
     print("\nKey insights from simulation:")
@@ -1,14 +1,27 @@
-import uuid
 import time
 import random
 
+from ids import IdAllocator, SequentialIdAllocator
+from money import Wei, bulk_transfer, from_wei, to_wei
+from org_graph import OrganizationGraph
+from profiling import profiled
+from tenancy import TenantRegistry
+
 # --- Data Architecture: Core Data Entities ---
 
 class Wallet:
     """Simulates a cryptocurrency wallet with an address and funds."""
     def __init__(self, address: str, initial_funds: float = 100.0):
         self.address = address
-        self.funds = initial_funds
+        self.funds_wei = to_wei(initial_funds) # Exact balance in smallest units
+
+    @property
+    def funds(self) -> float:
+        return from_wei(self.funds_wei)
+
+    @funds.setter
+    def funds(self, value: float):
+        self.funds_wei = to_wei(value)
 
     def __str__(self):
         return f"Wallet(Addr: {self.address[:8]}..., Funds: {self.funds:.2f})"
@@ -70,6 +83,25 @@ def decrypt_data(encrypted_data: str, agent_id: str) -> str:
         return parts[2][::-1]
     return "[DECRYPTION FAILED]"
 
+# --- Marketplace Rules: Bidding ---
+
+def can_bid(skill_match_ratio: float, funds: float, budget: float) -> bool:
+    """More flexible bidding criteria, shared by Agent and the sharded marketplace."""
+    return (
+        skill_match_ratio >= 0.5 and  # At least 50% skill match
+        funds >= (budget * 0.05) and  # Only need 5% of budget
+        budget >= 100.0  # Minimum task value
+    )
+
+def compute_bid(budget: float, skill_match_ratio: float, spread: float, confidence: float) -> float:
+    """Bid amount based on skill match and agent confidence; spread and confidence are uniform draws in [0, 1)."""
+    base_bid = budget * (0.6 + 0.3 * spread)
+    skill_bonus = skill_match_ratio * 0.1  # Up to 10% bonus for perfect match
+    confidence_factor = 0.9 + 0.2 * confidence  # Agent confidence variation
+
+    bid_amount = base_bid * (1 + skill_bonus) * confidence_factor
+    return min(bid_amount, budget * 0.95)  # Cap at 95% of budget
+
 # --- Application Architecture: Core Components ---
 
 class BlockchainSimulator:
@@ -77,7 +109,7 @@ class BlockchainSimulator:
     Simulates a public blockchain ledger.
     Stores BB LLCs, tasks, bids, and handles "events".
     """
-    def __init__(self):
+    def __init__(self, id_allocator: IdAllocator = None, tenant_ops_per_block: int = None):
         self.blocks = []
         self.current_block_height = 0
         self.bbllcs = {} # {bbllc_name: bbllc_obj}
@@ -85,6 +117,9 @@ class BlockchainSimulator:
         self.wallets = {} # {address: wallet_obj}
         self.auths = {} # {address: auth_obj}
         self.encrypted_on_chain_data = {} # {data_hash: encrypted_payload}
+        self.deferred_tasks = {} # {task_id: bbllc_name} for tasks a tenant's quota pushed to a later block
+        self.ids = id_allocator or SequentialIdAllocator(scramble=True, prefixed=False) # Bare scrambled hex, like the old uuid ids
+        self.tenants = TenantRegistry(tenant_ops_per_block) # Per-BB LLC partitions and cross-tenant indexes
 
     def _add_event(self, event_type: str, data: dict):
         """Internal method to add an event to the blockchain."""
@@ -114,12 +149,55 @@ class BlockchainSimulator:
             "status": "active",
             "treasury_wallet": Wallet(f"BBLLC_Treasury_{bbllc_name}", 500.0)
         }
+        self.tenants.add(bbllc_name, self.bbllcs[bbllc_name])
         self._add_event("BBLLC_CREATED", {"name": bbllc_name, "initiator": initiator_address})
         return True
 
-    def post_task(self, consumer_id: str, description: str, required_skills: list, budget: float, deadline: int, sensitive_details: str = None):
-        """Simulates an Information Consumer posting a task."""
-        task_id = str(uuid.uuid4())
+    def post_task(self, consumer_id: str, description: str, required_skills: list, budget: float, deadline: int, sensitive_details: str = None,
+                  bbllc_name: str = None):
+        """Simulates an Information Consumer posting a task (optionally within a BB LLC tenant).
+        Returns the task id; a task deferred by its tenant's quota keeps that id and stays in
+        self.deferred_tasks until a later block posts it."""
+        task_id = self.ids.next_id("task")
+        if bbllc_name is not None and not self.tenants.admit(bbllc_name):
+            # Tenant over its per-block quota: deferred to a later block
+            self._defer_tasks(bbllc_name, [(task_id, consumer_id, description, required_skills, budget, deadline, sensitive_details)])
+            return task_id
+        self._create_task(task_id, consumer_id, description, required_skills, budget, deadline, sensitive_details, bbllc_name)
+        self._add_event("TASK_POSTED", {"task_id": task_id, "consumer_id": consumer_id, "description_snippet": description[:50]})
+        return task_id
+
+    def post_tasks(self, specs, bbllc_name: str = None) -> list:
+        """Posts many (consumer_id, description, required_skills, budget, deadline[, sensitive_details]) tasks
+        as one batch event and returns their ids. Within a BB LLC tenant, specs beyond its per-block quota
+        are deferred to later blocks (their ids are in self.deferred_tasks until then)."""
+        entries = [(self.ids.next_id("task"),) + tuple(spec) + (None,) * (6 - len(spec)) for spec in specs]
+        self._post_entries(entries, bbllc_name)
+        return [entry[0] for entry in entries]
+
+    def _post_entries(self, entries: list, bbllc_name: str = None):
+        """Creates (task_id, consumer_id, description, required_skills, budget, deadline, sensitive_details)
+        tasks under the tenant's quota, deferring the rest."""
+        if bbllc_name is not None:
+            allowed = self.tenants.admit(bbllc_name, len(entries))
+            self._defer_tasks(bbllc_name, entries[allowed:])
+            entries = entries[:allowed]
+        for entry in entries:
+            self._create_task(*entry, bbllc_name)
+        event = {"count": len(entries)}
+        if bbllc_name is not None:
+            event["bbllc"] = bbllc_name
+        self._add_event("TASKS_POSTED_BATCH", event)
+
+    def _defer_tasks(self, bbllc_name: str, entries: list):
+        self.tenants.get(bbllc_name).backlog.extend(entries)
+        for entry in entries:
+            self.deferred_tasks[entry[0]] = bbllc_name
+
+    def _create_task(self, task_id: str, consumer_id: str, description: str, required_skills: list, budget: float,
+                     deadline: int, sensitive_details: str = None, bbllc_name: str = None):
+        """Records a task on chain, with its sensitive details encrypted, and indexes it under its tenant."""
+        self.deferred_tasks.pop(task_id, None)
         encrypted_details = None
         if sensitive_details:
             # Encrypt sensitive details for authorized agents only
@@ -130,8 +208,17 @@ class BlockchainSimulator:
 
         task = Task(task_id, consumer_id, description, required_skills, budget, deadline, encrypted_details)
         self.tasks[task_id] = task
-        self._add_event("TASK_POSTED", {"task_id": task_id, "consumer_id": consumer_id, "description_snippet": description[:50]})
-        return task_id
+        if bbllc_name is not None:
+            self.tenants.add_task(bbllc_name, task)
+        return task
+
+    def register_wallet(self, wallet: Wallet, bbllc_name: str = None, auth: Authorization = None):
+        """Adds a wallet (and optional authorization) to the chain and, if given, to a BB LLC tenant."""
+        self.wallets[wallet.address] = wallet
+        if auth is not None:
+            self.auths[wallet.address] = auth
+        if bbllc_name is not None:
+            self.tenants.add_wallet(bbllc_name, wallet, auth)
 
     def record_bid(self, task_id: str, agent_id: str, bid_amount: float):
         """Simulates an agent submitting a bid for a task."""
@@ -165,11 +252,29 @@ class BlockchainSimulator:
         """Simulates recording a resource allocation on chain (or reference to it)."""
         self._add_event("RESOURCE_ALLOCATED", {"task_id": task_id, "agent_id": agent_id, "resource_id": resource_id, "duration": duration})
 
+    @profiled("bbllc.transfer_batch")
+    def transfer_funds_batch(self, sources: list, destinations: list, amounts_wei: list) -> bool:
+        """Moves funds between wallets in one all-or-nothing batch (amounts in smallest units)."""
+        balances = {address: self.wallets[address].funds_wei for address in set(sources) | set(destinations)
+                    if address in self.wallets}
+        if len(balances) < len(set(sources) | set(destinations)):
+            return False # Unknown wallet
+        if not bulk_transfer(balances, sources, destinations, amounts_wei):
+            return False
+        for address, funds_wei in balances.items():
+            self.wallets[address].funds_wei = funds_wei
+        self._add_event("FUNDS_TRANSFERRED_BATCH", {"transfers": len(amounts_wei), "total_wei": sum(amounts_wei)})
+        return True
+
+    @profiled("bbllc.block_seal")
     def advance_block(self):
         """Simulates mining a new block."""
         self.current_block_height += 1
         self.blocks.append([])
         print(f"\n--- BLOCKCHAIN ADVANCED TO BLOCK {self.current_block_height} ---")
+        # Replay work deferred by hot tenants under the new block's quotas
+        for bbllc_name, entries in self.tenants.end_block().items():
+            self._post_entries(entries, bbllc_name)
 
 class AgentManagementSystem:
     """
@@ -180,8 +285,9 @@ class AgentManagementSystem:
         self.agents = {} # {agent_id: agent_obj}
         self.blockchain = blockchain
 
-    def provision_agent(self, agent_id: str, agent_type: str, capabilities: list, human_controlled: bool = False, initial_funds: float = 50.0):
-        """Creates and registers an agent."""
+    def provision_agent(self, agent_id: str, agent_type: str, capabilities: list, human_controlled: bool = False,
+                        initial_funds: float = 50.0, bbllc_name: str = None):
+        """Creates and registers an agent, optionally as a member of a BB LLC tenant."""
         if agent_id in self.agents:
             print(f"Agent '{agent_id}' already provisioned.")
             return False
@@ -191,23 +297,70 @@ class AgentManagementSystem:
 
         agent = Agent(agent_id, agent_type, capabilities, self.blockchain, human_controlled, agent_wallet)
         self.agents[agent_id] = agent
+        if bbllc_name is not None:
+            self.blockchain.tenants.add_agent(bbllc_name, agent_id, agent_wallet)
         print(f"AMS: Provisioned {agent_type} Agent '{agent_id}'.")
         return True
 
-    def configure_organization_graph(self, bbllc_name: str, connections: dict):
+    def provision_agents(self, specs, bbllc_name: str = None) -> int:
+        """Quietly provisions many (agent_id, agent_type, capabilities, human_controlled, initial_funds) agents,
+        optionally as members of a BB LLC tenant."""
+        wallets = self.blockchain.wallets
+        funds_cache = {}
+        provisioned = 0
+        for agent_id, agent_type, capabilities, human_controlled, initial_funds in specs:
+            if agent_id in self.agents:
+                continue
+            agent_wallet = Wallet(agent_id + "_wallet", 0)
+            if initial_funds not in funds_cache:
+                funds_cache[initial_funds] = to_wei(initial_funds)
+            agent_wallet.funds_wei = funds_cache[initial_funds]
+            wallets[agent_wallet.address] = agent_wallet
+            self.agents[agent_id] = Agent(agent_id, agent_type, capabilities, self.blockchain,
+                                          human_controlled, agent_wallet, verbose=False)
+            if bbllc_name is not None:
+                self.blockchain.tenants.add_agent(bbllc_name, agent_id, agent_wallet)
+            provisioned += 1
+        event = {"count": provisioned}
+        if bbllc_name is not None:
+            event["bbllc"] = bbllc_name
+        self.blockchain._add_event("AGENTS_PROVISIONED_BATCH", event)
+        return provisioned
+
+    def configure_organization_graph(self, bbllc_name: str, connections: dict,
+                                     reports_to: dict = None, delegations: dict = None):
         """
-        Simulates configuring the organization graph (relationships between agents).
+        Configures the organization graph (relationships between agents) as an OrganizationGraph.
         `connections` example: {'agent1': ['agent2', 'agent3'], 'agent2': ['agent1']}
+        `reports_to` / `delegations` map an agent to its manager / delegate.
         """
         bbllc_info = self.blockchain.bbllcs.get(bbllc_name)
         if not bbllc_info:
             print(f"AMS: BB LLC '{bbllc_name}' not found for organization configuration.")
             return False
 
-        bbllc_info["organization_graph"] = connections
-        print(f"AMS: Configured organization graph for BB LLC '{bbllc_name}'.")
+        graph = OrganizationGraph.from_connections(connections)
+        if reports_to:
+            graph.bulk_load("reports_to", reports_to.items())
+        if delegations:
+            graph.bulk_load("delegates_to", delegations.items())
+        bbllc_info["organization_graph"] = graph
+        print(f"AMS: Configured organization graph for BB LLC '{bbllc_name}' "
+              f"({len(graph)} agents, {graph.edge_count()} connections).")
         return True
 
+    def get_organization_graph(self, bbllc_name: str):
+        """The BB LLC's OrganizationGraph, or None if not configured."""
+        bbllc_info = self.blockchain.bbllcs.get(bbllc_name)
+        return bbllc_info.get("organization_graph") if bbllc_info else None
+
+    def rank_by_proximity(self, bbllc_name: str, anchors: list, candidates: list, max_hops: int = 3) -> list:
+        """Orders candidate agents by graph distance to the anchors (e.g. a task's current team)."""
+        graph = self.get_organization_graph(bbllc_name)
+        if graph is None:
+            return [(agent_id, None) for agent_id in candidates]
+        return graph.rank_by_proximity(anchors, candidates, max_hops)
+
 class ResourceManagementSystem:
     """Manages the allocation and scheduling of external resources."""
     def __init__(self):
@@ -240,7 +393,7 @@ class ResourceManagementSystem:
 class Agent:
     """Base class for AI and Human agents."""
     def __init__(self, agent_id: str, agent_type: str, capabilities: list, blockchain: BlockchainSimulator,
-                 human_controlled: bool, wallet: Wallet):
+                 human_controlled: bool, wallet: Wallet, verbose: bool = True):
         self.agent_id = agent_id
         self.agent_type = agent_type # e.g., "AI_LLM", "Human_Operator"
         self.capabilities = capabilities # e.g., ["data_analysis", "negotiation", "resource_scheduling"]
@@ -248,7 +401,8 @@ class Agent:
         self.human_controlled = human_controlled
         self.wallet = wallet
         self.current_task_id = None
-        print(f"Agent {self.agent_id} initialized (Type: {self.agent_type}, Human Controlled: {self.human_controlled}).")
+        if verbose:
+            print(f"Agent {self.agent_id} initialized (Type: {self.agent_type}, Human Controlled: {self.human_controlled}).")
 
     def monitor_blockchain_for_tasks(self):
         """Simulates agents listening for new tasks."""
@@ -260,6 +414,7 @@ class Agent:
             print(f"Agent {self.agent_id}: Detected {len(new_tasks)} new task(s).")
         return new_tasks
 
+    @profiled("bbllc.bidding")
     def evaluate_and_bid(self, task: Task):
         """Simulates agent evaluating a task and deciding to bid."""
         print(f"Agent {self.agent_id}: Evaluating Task {task.task_id[:6]}...")
@@ -273,21 +428,8 @@ class Agent:
         print(f"  Matching skills: {matching_skills}")
         print(f"  Skill match ratio: {skill_match_ratio:.2f}")
 
-        # More flexible bidding criteria
-        can_bid = (
-            skill_match_ratio >= 0.5 and  # At least 50% skill match
-            self.wallet.funds >= (task.budget * 0.05) and  # Only need 5% of budget
-            task.budget >= 100.0  # Minimum task value
-        )
-
-        if can_bid:
-            # Bid amount based on skill match and agent confidence
-            base_bid = task.budget * random.uniform(0.6, 0.9)
-            skill_bonus = skill_match_ratio * 0.1  # Up to 10% bonus for perfect match
-            confidence_factor = random.uniform(0.9, 1.1)  # Agent confidence variation
-
-            bid_amount = base_bid * (1 + skill_bonus) * confidence_factor
-            bid_amount = min(bid_amount, task.budget * 0.95)  # Cap at 95% of budget
+        if can_bid(skill_match_ratio, self.wallet.funds, task.budget):
+            bid_amount = compute_bid(task.budget, skill_match_ratio, random.random(), random.random())
 
             if self.blockchain.record_bid(task.task_id, self.agent_id, bid_amount):
                 print(f"Agent {self.agent_id}: Bid ${bid_amount:.2f} on Task {task.task_id[:6]} (skill match: {skill_match_ratio:.1%}).")
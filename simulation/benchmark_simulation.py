@@ -0,0 +1,333 @@
+"""
+Benchmark Suite for the Simulation Hot Paths
+
+Times agent assignment, mission execution, voting and finalization, stats
+polling, the BB LLC bidding round (single-process and sharded), multi-tenant
+BB LLC hosting and oracle consensus across a range of population sizes.
+Results are printed (or written with --output) as JSON and can be compared
+against a previous run to catch regressions across commits.
+
+Usage:
+    python benchmark_simulation.py --sizes 100,1000 --output bench.json
+    python benchmark_simulation.py --baseline bench.json --output new.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import random
+import statistics
+import subprocess
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+import profiling
+from dao_simulation import DAOSimulation
+
+CAPABILITIES = ["data_analysis", "research", "reporting", "machine_learning",
+                "web_development", "frontend", "backend", "writing"]
+
+
+def _time(run: Callable[[], None], repeats: int) -> Dict[str, float]:
+    """Run a timed body `repeats` times (setup must happen outside `run`)"""
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        run()
+        samples.append(time.perf_counter() - started)
+    return {"min": min(samples), "median": statistics.median(samples), "repeats": repeats}
+
+
+def _populated_dao(num_agents: int, num_members: int, seed: int) -> DAOSimulation:
+    """A DAO with randomly skilled agents and Pareto-distributed members"""
+    rng = random.Random(seed)
+    random.seed(seed)
+    dao = DAOSimulation()
+    for i in range(num_agents):
+        dao.add_agent(f"Agent_{i}", rng.sample(CAPABILITIES, 3))
+    for i in range(num_members):
+        dao.add_member(f"Member_{i}", rng.paretovariate(1.5) * 1000)
+    return dao
+
+
+def bench_assign_agents(size: int, repeats: int, seed: int) -> Dict[str, float]:
+    """assign_agents_to_mission over `size` agents"""
+    dao = _populated_dao(size, 1, seed)
+    mission_ids = [dao.create_mission("Bench", "Assignment", {"data_analysis"}, 1000.0)
+                   for _ in range(repeats)]
+    pending = iter(mission_ids)
+    return _time(lambda: dao.assign_agents_to_mission(next(pending)), repeats)
+
+
+def bench_batch_assignment(size: int, repeats: int, seed: int) -> Dict[str, float]:
+    """assign_pending_missions for size / 10 missions over `size` agents"""
+    from population import PopulationGenerator
+
+    daos = []
+    for _ in range(repeats):
+        random.seed(seed)
+        dao = DAOSimulation()
+        PopulationGenerator(seed=seed).populate_dao(dao, agents=size, missions=max(1, size // 10))
+        daos.append(dao)
+    pending = iter(daos)
+    return _time(lambda: next(pending).assign_pending_missions(), repeats)
+
+
+def bench_mission_execution(size: int, repeats: int, seed: int) -> Dict[str, float]:
+    """simulate_mission_execution for missions staffed from `size` agents"""
+    dao = _populated_dao(size, 1, seed)
+    mission_ids = []
+    for _ in range(repeats):
+        mission_id = dao.create_mission("Bench", "Execution", {"research"}, 1000.0, max_agents=3)
+        dao.assign_agents_to_mission(mission_id)
+        mission_ids.append(mission_id)
+    pending = iter(mission_ids)
+    return _time(lambda: dao.simulate_mission_execution(next(pending)), repeats)
+
+
+def bench_voting(size: int, repeats: int, seed: int) -> Dict[str, float]:
+    """vote_on_proposal by `size` members followed by finalize_proposal"""
+    dao = _populated_dao(0, size, seed)
+    members = list(dao.members)
+    rng = random.Random(seed)
+    mission_data = {"title": "Bench", "description": "Voting",
+                    "required_capabilities": ["research"], "budget": 100}
+
+    def run():
+        proposal_id = dao.create_proposal(members[0], "Bench", "Voting", mission_data)
+        for member in members:
+            dao.vote_on_proposal(proposal_id, member, rng.random() < 0.6)
+        dao.finalize_proposal(proposal_id)
+    return _time(run, repeats)
+
+
+def bench_bulk_voting(size: int, repeats: int, seed: int) -> Dict[str, float]:
+    """cast_votes by `size` members followed by finalize_proposal"""
+    dao = _populated_dao(0, size, seed)
+    members = list(dao.members)
+    rng = random.Random(seed)
+    mission_data = {"title": "Bench", "description": "Voting",
+                    "required_capabilities": ["research"], "budget": 100}
+
+    def run():
+        proposal_id = dao.create_proposal(members[0], "Bench", "Voting", mission_data)
+        dao.cast_votes([proposal_id] * len(members), members,
+                       [rng.random() < 0.6 for _ in members])
+        dao.finalize_proposal(proposal_id)
+    return _time(run, repeats)
+
+
+def bench_simulation_stats(size: int, repeats: int, seed: int) -> Dict[str, float]:
+    """get_simulation_stats over `size` agents with some completed missions"""
+    dao = _populated_dao(size, 1, seed)
+    for _ in range(10):
+        mission_id = dao.create_mission("Bench", "Stats", {"writing"}, 1000.0)
+        dao.assign_agents_to_mission(mission_id)
+        dao.simulate_mission_execution(mission_id)
+    return _time(dao.get_simulation_stats, repeats)
+
+
+def bench_bidding_round(size: int, repeats: int, seed: int) -> Dict[str, float]:
+    """bbllcDeploymentSim bidding: `size` agents evaluate and bid on a batch of tasks"""
+    import bbllcDeploymentSim as bbllc
+
+    rng = random.Random(seed)
+    random.seed(seed)
+    with contextlib.redirect_stdout(io.StringIO()):
+        blockchain = bbllc.BlockchainSimulator()
+        ams = bbllc.AgentManagementSystem(blockchain)
+        for i in range(size):
+            ams.provision_agent(f"AI_Agent_{i}", "AI_LLM", rng.sample(CAPABILITIES, 3))
+        agents = list(ams.agents.values())
+
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            task_ids = [blockchain.post_task("Bench_Consumer", "Benchmark task",
+                                             rng.sample(CAPABILITIES, 2), 800.0, 0)
+                        for _ in range(5)]
+            for task_id in task_ids:
+                task = blockchain.tasks[task_id]
+                for agent in agents:
+                    agent.evaluate_and_bid(task)
+            blockchain.advance_block()
+    return _time(run, repeats)
+
+
+def bench_multi_tenant(size: int, repeats: int, seed: int) -> Dict[str, float]:
+    """`size` BB LLC tenants x 1k agents: a block of task posting plus cross-tenant queries"""
+    import bbllcDeploymentSim as bbllc
+
+    rng = random.Random(seed)
+    agents_per_tenant, tasks_per_block = 1000, 20
+    with contextlib.redirect_stdout(io.StringIO()):
+        blockchain = bbllc.BlockchainSimulator(tenant_ops_per_block=tasks_per_block)
+        ams = bbllc.AgentManagementSystem(blockchain)
+        names = [f"BBLLC_{t}" for t in range(size)]
+        for t, name in enumerate(names):
+            blockchain.create_bbllc(name, f"Initiator_{t}", {"voting_threshold": 0.6})
+            ams.provision_agents([(f"{name}_Agent_{i}", "AI_LLM", rng.sample(CAPABILITIES, 3), False, 50.0)
+                                  for i in range(agents_per_tenant)], name)
+    hot = names[:max(1, size // 50)]  # A few tenants post far beyond their quota
+
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            for name in names:
+                count = tasks_per_block * 10 if name in hot else tasks_per_block // 2
+                blockchain.post_tasks([(f"{name}_Consumer", "Benchmark task", rng.sample(CAPABILITIES, 2),
+                                        800.0, 0) for _ in range(count)], name)
+            for capability in CAPABILITIES:
+                for task in blockchain.tenants.open_tasks([capability], limit=100):
+                    blockchain.tenants.tenant_of_task(task.task_id)
+                    task.status = "bidding"
+            blockchain.advance_block()
+    return _time(run, repeats)
+
+
+def bench_sharded_block(size: int, repeats: int, seed: int) -> Dict[str, float]:
+    """sharded_simulation: one block of 20 tasks bid on by `size` agents across worker processes"""
+    from sharded_simulation import ShardedMarketplace
+
+    rng = random.Random(seed)
+    market = ShardedMarketplace(seed=seed)
+    market.add_agents((f"AI_Agent_{i}", rng.sample(CAPABILITIES, 3), 50.0, f"BBLLC_{i % 64}")
+                      for i in range(size))
+    market.start()
+
+    def run():
+        market.post_tasks((f"Consumer_{t}", rng.sample(CAPABILITIES, 2), 800.0, f"BBLLC_{t % 64}")
+                          for t in range(20))
+        market.run_block()
+    try:
+        return _time(run, repeats)
+    finally:
+        market.close()
+
+
+def bench_oracle_consensus(size: int, repeats: int, seed: int) -> Dict[str, float]:
+    """OracleAggregator.get_consensus_verification for `size` missions"""
+    from oracle_integration import HumanValidationOracle, MissionVerificationOracle, OracleAggregator
+
+    random.seed(seed)
+    aggregator = OracleAggregator()
+    aggregator.register_oracle("verification", MissionVerificationOracle("verification_oracle_1"))
+    aggregator.register_oracle("human_validation", HumanValidationOracle("human_oracle_1"))
+    deliverables = {"url": "https://example-dao-project.com",
+                    "repository": "https://github.com/dao/project"}
+
+    def run():
+        for i in range(size):
+            aggregator.get_consensus_verification(f"mission_{i}", deliverables, "web_development")
+    try:
+        return _time(run, repeats)
+    finally:
+        aggregator.shutdown()
+
+
+# name -> (benchmark, default sizes)
+BENCHMARKS: Dict[str, Tuple[Callable[[int, int, int], Dict[str, float]], List[int]]] = {
+    "assign_agents_to_mission": (bench_assign_agents, [100, 1000, 10000]),
+    "assign_pending_missions": (bench_batch_assignment, [1000, 10000, 100000]),
+    "simulate_mission_execution": (bench_mission_execution, [100, 1000, 10000]),
+    "vote_and_finalize": (bench_voting, [100, 1000, 10000]),
+    "cast_votes_and_finalize": (bench_bulk_voting, [100, 1000, 10000]),
+    "get_simulation_stats": (bench_simulation_stats, [100, 1000, 10000]),
+    "bbllc_bidding_round": (bench_bidding_round, [10, 100, 1000]),
+    "bbllc_multi_tenant": (bench_multi_tenant, [10, 100, 500]),
+    "sharded_bidding_block": (bench_sharded_block, [1000, 10000, 100000]),
+    "oracle_consensus": (bench_oracle_consensus, [10, 100, 1000]),
+}
+
+
+def run_benchmarks(names: Optional[List[str]] = None, sizes: Optional[List[int]] = None,
+                   repeats: int = 5, seed: int = 42) -> Dict:
+    """Run the selected benchmarks at each size and return a JSON-serializable report"""
+    report = {"metadata": _metadata(repeats, seed), "results": {}}
+    for name in names or BENCHMARKS:
+        benchmark, default_sizes = BENCHMARKS[name]
+        report["results"][name] = {}
+        for size in sizes or default_sizes:
+            report["results"][name][str(size)] = benchmark(size, repeats, seed)
+            print(f"  {name} [{size}]: {report['results'][name][str(size)]['median'] * 1000:.2f} ms")
+    return report
+
+
+def compare_reports(baseline: Dict, current: Dict, tolerance: float = 0.2) -> List[str]:
+    """List benchmarks whose median slowed down by more than `tolerance` versus the baseline"""
+    regressions = []
+    for name, by_size in current["results"].items():
+        for size, timing in by_size.items():
+            previous = baseline.get("results", {}).get(name, {}).get(size)
+            if previous and timing["median"] > previous["median"] * (1 + tolerance):
+                regressions.append(
+                    f"{name} [{size}]: {previous['median'] * 1000:.2f} ms -> "
+                    f"{timing['median'] * 1000:.2f} ms"
+                )
+    return regressions
+
+
+def _metadata(repeats: int, seed: int) -> Dict:
+    """Where and when the benchmarks ran"""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeats": repeats,
+        "seed": seed
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the simulation hot paths")
+    parser.add_argument("--benchmarks", help="Comma-separated subset of: " + ", ".join(BENCHMARKS))
+    parser.add_argument("--sizes", help="Comma-separated population sizes (default: per benchmark)")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write the results JSON here (default: print it)")
+    parser.add_argument("--baseline", help="Previous results JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed slowdown before flagging")
+    parser.add_argument("--profile", help="Also collect profiling spans and write collapsed stacks here")
+    args = parser.parse_args()
+
+    print("⏱️  Simulation Benchmarks")
+    print("=" * 50)
+    if args.profile:
+        profiling.enable(track_allocations=True)
+    report = run_benchmarks(
+        names=args.benchmarks.split(",") if args.benchmarks else None,
+        sizes=[int(size) for size in args.sizes.split(",")] if args.sizes else None,
+        repeats=args.repeats,
+        seed=args.seed
+    )
+    if args.profile:
+        profiler = profiling.disable()
+        report["profile"] = profiler.report()
+    if args.output:
+        with open(args.output, "w") as handle:
+            json.dump(report, handle, indent=2)
+        print(f"\nResults written to {args.output}")
+    else:
+        print("\n" + json.dumps(report, indent=2))
+
+    if args.profile:
+        profiler.write_collapsed(args.profile)
+        print(f"\n{profiler.format_report()}")
+        print(f"\nCollapsed stacks written to {args.profile}")
+
+    if args.baseline:
+        with open(args.baseline) as handle:
+            regressions = compare_reports(json.load(handle), report, args.tolerance)
+        if regressions:
+            print("\n⚠️  Regressions:")
+            for regression in regressions:
+                print(f"  {regression}")
+            raise SystemExit(1)
+        print("\n✅ No regressions against baseline")
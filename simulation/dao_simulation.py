@@ -5,14 +5,25 @@ This simulation models the core functionality of a DAO-operated multi-agent orga
 to test governance, agent coordination, mission assignment, and economic models.
 """
 
+import heapq
+import math
 import random
-import uuid
+from array import array
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set
+from itertools import compress
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
 from enum import Enum
 import json
 from datetime import datetime, timedelta
 
+from ids import DenseIndex, IdAllocator, SequentialIdAllocator
+from money import Wei, from_wei, mul_div, split_proportional, to_wei
+from profiling import profiled
+from treasury_ledger import TreasuryLedger
+from voting_power import DelegatedVoting, TokenWeightedVoting
+
+COORDINATION_KINDS = ('planning', 'problem_solving', 'resource_sharing')
+
 
 class ProposalState(Enum):
     PENDING = "pending"
@@ -32,7 +43,11 @@ class MissionStatus(Enum):
 
 @dataclass
 class Agent:
-    """Represents an AI agent in the organization"""
+    """Represents an AI agent in the organization.
+    
+    Once added to a DAOSimulation, assigning reputation also keeps the DAO's
+    running reputation sum (and so avg_agent_reputation) in step.
+    """
     address: str
     name: str
     capabilities: Set[str]
@@ -41,6 +56,14 @@ class Agent:
     performance_history: List[Dict] = field(default_factory=list)
     active_missions: Set[str] = field(default_factory=set)
     total_earnings: float = 0.0
+    performance_total: float = 0.0  # Running sum of performance_history scores
+    
+    def __setattr__(self, name: str, value):
+        if name == 'reputation':
+            counters = self.__dict__.get('_counters')
+            if counters is not None:
+                counters.reputation_sum += value - self.reputation
+        super().__setattr__(name, value)
     
     def can_perform_mission(self, required_capabilities: Set[str]) -> bool:
         """Check if agent has required capabilities for a mission"""
@@ -65,16 +88,36 @@ class Agent:
 
 @dataclass
 class DAOMember:
-    """Represents a DAO member with voting rights"""
+    """Represents a DAO member with voting rights.
+    
+    Once added to a DAOSimulation, assigning token_balance or reputation also
+    refreshes the member's cached power in the DAO's voting strategy, and
+    voting_history reads the member's ballots from the DAO's vote log.
+    """
     address: str
     name: str
     token_balance: float
     reputation: float = 100.0
-    voting_history: List[Dict] = field(default_factory=list)
+    
+    def __setattr__(self, name: str, value):
+        super().__setattr__(name, value)
+        if name in ('token_balance', 'reputation'):
+            strategy = self.__dict__.get('_voting_strategy')
+            if strategy is not None:
+                strategy.update_member(self)
     
     def get_voting_power(self) -> float:
-        """Calculate voting power based on tokens and reputation"""
+        """Effective voting power under the DAO's voting strategy (token-weighted before joining a DAO)"""
+        strategy = self.__dict__.get('_voting_strategy')
+        if strategy is not None:
+            return strategy.get_power(self.address)
         return self.token_balance * (self.reputation / 100.0)
+    
+    @property
+    def voting_history(self) -> List[Dict]:
+        """Ballots cast by this member, oldest first (read-only view of the DAO's vote log)"""
+        vote_log = self.__dict__.get('_vote_log')
+        return vote_log.history_for(self.address) if vote_log is not None else []
 
 
 @dataclass
@@ -100,7 +143,7 @@ class Mission:
     title: str
     description: str
     required_capabilities: Set[str]
-    budget: float
+    budget: float  # Whole tokens; converted with money.to_wei when rewards are paid
     deadline: datetime
     max_agents: int
     assigned_agents: List[str] = field(default_factory=list)
@@ -110,51 +153,282 @@ class Mission:
     coordination_messages: List[Dict] = field(default_factory=list)
 
 
+class VoteLog:
+    """Append-only columnar record of cast votes"""
+    
+    def __init__(self):
+        self.proposals = DenseIndex()  # Interned ids, indexed by the proposal column
+        self.voters = DenseIndex()
+        
+        self.proposal_column = array('l')
+        self.voter_column = array('l')
+        self.support_column = array('b')
+        self.power_column = array('d')
+        self.timestamp_column = array('d')
+    
+    def __len__(self) -> int:
+        return len(self.power_column)
+    
+    def append(self, proposal_id: str, voters: Sequence[str], supports: Sequence[bool],
+               powers: Sequence[float], timestamp: datetime):
+        """Record a batch of votes on one proposal"""
+        proposal_idx = self.proposals.intern(proposal_id)
+        self.proposal_column.extend([proposal_idx] * len(voters))
+        self.voter_column.extend(map(self.voters.intern, voters))
+        self.support_column.extend(supports)
+        self.power_column.extend(powers)
+        self.timestamp_column.extend([timestamp.timestamp()] * len(voters))
+    
+    def history_for(self, voter: str) -> List[Dict]:
+        """Reconstruct a voter's history (scans the log)"""
+        voter_idx = self.voters.slot(voter)
+        if voter_idx is None:
+            return []
+        return [
+            {
+                'proposal_id': self.proposals.key(self.proposal_column[row]),
+                'support': bool(self.support_column[row]),
+                'voting_power': self.power_column[row],
+                'timestamp': datetime.fromtimestamp(self.timestamp_column[row])
+            }
+            for row, idx in enumerate(self.voter_column) if idx == voter_idx
+        ]
+
+
+class ProposalScheduler:
+    """Min-heap of active proposals ordered by voting_end"""
+    
+    def __init__(self):
+        self._heap: List[Tuple[datetime, int, str]] = []
+        self._sequence = 0  # Tie-breaker keeps creation order for equal deadlines
+    
+    def __len__(self) -> int:
+        return len(self._heap)
+    
+    def schedule(self, proposal: Proposal):
+        """Track a proposal until its voting period ends"""
+        heapq.heappush(self._heap, (proposal.voting_end, self._sequence, proposal.id))
+        self._sequence += 1
+    
+    def pop_due(self, now: datetime) -> List[str]:
+        """Remove and return the ids of proposals whose voting has ended"""
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            due.append(heapq.heappop(self._heap)[2])
+        return due
+    
+    def next_deadline(self) -> Optional[datetime]:
+        """Get the earliest pending voting_end, if any"""
+        return self._heap[0][0] if self._heap else None
+
+
+class SimulationCounters:
+    """Aggregates maintained at mutation points so stats polling is O(1)"""
+    
+    def __init__(self):
+        self.mission_outcomes = {'success': 0, 'partial_success': 0, 'failure': 0, 'in_progress': 0}
+        self.proposal_states = {'succeeded': 0, 'defeated': 0, 'active': 0, 'executed': 0}
+        self.reputation_sum = 0.0
+        self.missions_completed = 0  # Agent-mission completions
+        self.performance_sum = 0.0
+        self.rewards_paid_wei = 0
+        self.failed_settlements = 0  # Settlements refused because they would overdraw the treasury
+        self.agents_busy = 0  # Agents with at least one active mission
+    
+    def proposal_transition(self, old: Optional[ProposalState], new: ProposalState):
+        """Move a proposal between state buckets"""
+        if old is not None:
+            self.proposal_states[old.value] = self.proposal_states.get(old.value, 0) - 1
+        self.proposal_states[new.value] = self.proposal_states.get(new.value, 0) + 1
+    
+    def mission_finished(self, outcome: str):
+        """Move a mission from in-progress to its outcome bucket"""
+        self.mission_outcomes['in_progress'] -= 1
+        self.mission_outcomes[outcome] += 1
+
+
 class DAOSimulation:
     """Main simulation class for the DAO multi-agent organization"""
     
-    def __init__(self):
+    def __init__(self, voting_strategy: Optional[TokenWeightedVoting] = None,
+                 id_allocator: Optional[IdAllocator] = None, columnar: bool = False):
         self.agents: Dict[str, Agent] = {}
         self.members: Dict[str, DAOMember] = {}
         self.proposals: Dict[str, Proposal] = {}
         self.missions: Dict[str, Mission] = {}
-        self.treasury_balance: float = 1000000.0  # Starting treasury
         self.current_time: datetime = datetime.now()
+        self.ledger = TreasuryLedger(opening_balance=to_wei(1000000),  # Starting treasury
+                                     timestamp=self.current_time.timestamp())
+        self.auto_settle_rewards = True  # False queues rewards until settle_rewards()
+        self.vote_log = VoteLog()
+        self.proposal_scheduler = ProposalScheduler()
+        self.voting_strategy = voting_strategy or TokenWeightedVoting()  # Caches voting power
+        self.counters = SimulationCounters()
+        self._agent_order: List[str] = []  # Registration order, for paginated agent stats
+        self.ids = id_allocator or SequentialIdAllocator()  # Deterministic, no uuid4 per entity
+        
+        # Optional struct-of-arrays backend: entities become views over typed columns
+        self.store = None
+        self._agent_cls, self._member_cls = Agent, DAOMember
+        self._mission_cls, self._proposal_cls = Mission, Proposal
+        if columnar:
+            from entity_store import ColumnarStore
+            self.store = ColumnarStore()
+            self._agent_cls, self._member_cls = self.store.new_agent, self.store.new_member
+            self._mission_cls, self._proposal_cls = self.store.new_mission, self.store.new_proposal
+        self.reputation_engine = None  # Set by enable_reputation_engine() for epoch-batched updates
+        self.matcher = None  # Batch assignment engine, created by assign_pending_missions()
+        self.mission_scheduler = None  # Set by enable_mission_scheduler()
+        self.message_bus = None  # Set by enable_message_bus()
+        self.messages_per_agent = 0  # Coordination messages each agent publishes per day
+        self.message_read_limit = None  # Messages each agent can process per day (None = all)
         
         # Simulation parameters
         self.voting_period_days = 7
         self.minimum_quorum = 0.1  # 10% of voting power
         self.success_threshold = 0.5  # 50% of votes
         
+    @property
+    def treasury_balance(self) -> float:
+        """Current treasury balance, as recorded in the ledger"""
+        return from_wei(self.treasury_balance_wei)
+    
+    @treasury_balance.setter
+    def treasury_balance(self, value: float):
+        """Adjust the treasury to a new balance through a ledger entry"""
+        delta = to_wei(value) - self.treasury_balance_wei
+        if delta >= 0:
+            self.ledger.post(TreasuryLedger.EXTERNAL, TreasuryLedger.TREASURY, delta,
+                             "adjustment", self.current_time.timestamp())
+        else:
+            self.ledger.post(TreasuryLedger.TREASURY, TreasuryLedger.EXTERNAL, -delta,
+                             "adjustment", self.current_time.timestamp())
+    
+    @property
+    def treasury_balance_wei(self) -> Wei:
+        """Exact treasury balance in smallest units"""
+        return self.ledger.balance(TreasuryLedger.TREASURY)
+    
     def add_agent(self, name: str, capabilities: List[str], stake: float = 1000.0) -> str:
         """Register a new agent in the DAO"""
-        address = f"agent_{uuid.uuid4().hex[:8]}"
-        agent = Agent(
+        address = self._new_id("agent", self.agents)
+        agent = self._agent_cls(
             address=address,
             name=name,
             capabilities=set(capabilities),
             staked_amount=stake
         )
         self.agents[address] = agent
+        self._agent_order.append(address)
+        self.counters.reputation_sum += agent.reputation
+        agent._counters = self.counters
         return address
     
     def add_member(self, name: str, token_balance: float) -> str:
         """Add a new DAO member"""
-        address = f"member_{uuid.uuid4().hex[:8]}"
-        member = DAOMember(
+        address = self._new_id("member", self.members)
+        member = self._member_cls(
             address=address,
             name=name,
             token_balance=token_balance
         )
         self.members[address] = member
+        member._voting_strategy = self.voting_strategy
+        member._vote_log = self.vote_log
+        self.voting_strategy.update_member(member)
         return address
+
+    def add_agents(self, specs: Iterable[Tuple[str, Sequence[str], float]]) -> List[str]:
+        """Register many (name, capabilities, stake) agents in one pass"""
+        addresses = []
+        reputation_sum = 0.0
+        for name, capabilities, stake in specs:
+            address = self._new_id("agent", self.agents)
+            agent = self._agent_cls(address=address, name=name, capabilities=set(capabilities),
+                                    staked_amount=stake)
+            self.agents[address] = agent
+            addresses.append(address)
+            reputation_sum += agent.reputation
+            agent._counters = self.counters
+        self._agent_order.extend(addresses)
+        self.counters.reputation_sum += reputation_sum
+        return addresses
+
+    def add_members(self, specs: Iterable[Tuple[str, float]]) -> List[str]:
+        """Add many (name, token_balance) members in one pass"""
+        addresses = []
+        update_member = self.voting_strategy.update_member
+        for name, token_balance in specs:
+            address = self._new_id("member", self.members)
+            member = self._member_cls(address=address, name=name, token_balance=token_balance)
+            self.members[address] = member
+            member._voting_strategy = self.voting_strategy
+            member._vote_log = self.vote_log
+            update_member(member)
+            addresses.append(address)
+        return addresses
+
+    def create_missions(self, specs: Iterable[Tuple[str, str, Set[str], float, int, int]]) -> List[str]:
+        """Create many (title, description, capabilities, budget, deadline_days, max_agents) missions.
+        
+        With the mission scheduler enabled, specs refused by backpressure are skipped.
+        """
+        mission_ids = []
+        for title, description, required_capabilities, budget, deadline_days, max_agents in specs:
+            if self.mission_scheduler is not None and not self.mission_scheduler.admit(self):
+                self.mission_scheduler.reject()
+                continue
+            mission_id = self._new_id("mission", self.missions)
+            self.missions[mission_id] = self._mission_cls(
+                id=mission_id,
+                title=title,
+                description=description,
+                required_capabilities=set(required_capabilities),
+                budget=budget,
+                deadline=self.current_time + timedelta(days=deadline_days),
+                max_agents=max_agents
+            )
+            mission_ids.append(mission_id)
+            if self.mission_scheduler is not None:
+                self.mission_scheduler.enqueue(self.missions[mission_id], self.current_time)
+        self.counters.mission_outcomes['in_progress'] += len(mission_ids)
+        return mission_ids
+
+    def _new_id(self, kind: str, table: Dict) -> str:
+        """Next id from the allocator, skipping keys already taken in `table`"""
+        while True:
+            key = self.ids.next_id(kind)
+            if key not in table:
+                return key
+
+    def update_member(self, address: str, token_balance: Optional[float] = None,
+                      reputation: Optional[float] = None) -> bool:
+        """Change a member's holdings (their cached voting power follows through DAOMember's setter)"""
+        member = self.members.get(address)
+        if member is None:
+            return False
+        if token_balance is not None:
+            member.token_balance = token_balance
+        if reputation is not None:
+            member.reputation = reputation
+        return True
+    
+    def delegate_votes(self, delegator: str, delegatee: str) -> bool:
+        """Delegate a member's voting power (requires a DelegatedVoting strategy)"""
+        if not isinstance(self.voting_strategy, DelegatedVoting):
+            return False
+        return self.voting_strategy.delegate(delegator, delegatee)
+    
+    def get_voting_power(self, address: str) -> float:
+        """Effective voting power of a member under the active strategy"""
+        return self.voting_strategy.get_power(address)
     
     def create_proposal(self, proposer: str, title: str, description: str, 
                        mission_data: Dict) -> str:
         """Create a new governance proposal"""
-        proposal_id = f"prop_{uuid.uuid4().hex[:8]}"
+        proposal_id = self._new_id("prop", self.proposals)
         
-        proposal = Proposal(
+        proposal = self._proposal_cls(
             id=proposal_id,
             proposer=proposer,
             title=title,
@@ -166,8 +440,11 @@ class DAOSimulation:
         )
         
         self.proposals[proposal_id] = proposal
+        self.proposal_scheduler.schedule(proposal)
+        self.counters.proposal_transition(None, proposal.state)
         return proposal_id
     
+    @profiled("dao.voting")
     def vote_on_proposal(self, proposal_id: str, voter: str, support: bool) -> bool:
         """Cast a vote on a proposal"""
         if proposal_id not in self.proposals:
@@ -180,8 +457,10 @@ class DAOSimulation:
         if voter not in self.members:
             return False
         
-        member = self.members[voter]
-        voting_power = member.get_voting_power()
+        voting_power = self.voting_strategy.get_power(voter)
+        
+        # A re-vote replaces the voter's earlier ballot
+        self._retract_vote(proposal, voter)
         
         # Record the vote
         proposal.votes[voter] = {
@@ -195,15 +474,76 @@ class DAOSimulation:
         else:
             proposal.against_votes += voting_power
         
-        # Update member's voting history
-        member.voting_history.append({
-            'proposal_id': proposal_id,
-            'support': support,
-            'timestamp': self.current_time
-        })
+        # The vote log is the voting history of record (see get_voting_history)
+        self.vote_log.append(proposal_id, [voter], [support], [voting_power], self.current_time)
         
         return True
     
+    @profiled("dao.voting")
+    def cast_votes(self, proposal_ids: Sequence[str], voters: Sequence[str],
+                   supports: Sequence[bool]) -> int:
+        """Cast many votes from columnar input; returns the number of ballots counted.
+        
+        A voter's last ballot on a proposal wins, both within the batch and over
+        earlier votes from either voting method. Every ballot counted is appended
+        to the vote log, as in vote_on_proposal.
+        """
+        # Group by proposal; later ballots from the same voter overwrite earlier ones
+        ballots: Dict[str, Dict[str, bool]] = {}
+        for proposal_id, voter, support in zip(proposal_ids, voters, supports):
+            proposal_ballots = ballots.get(proposal_id)
+            if proposal_ballots is None:
+                proposal_ballots = ballots[proposal_id] = {}
+            proposal_ballots[voter] = support
+        
+        get_power = self.voting_strategy.get_power
+        counted = 0
+        for proposal_id, proposal_ballots in ballots.items():
+            proposal = self.proposals.get(proposal_id)
+            if proposal is None or proposal.state != ProposalState.ACTIVE:
+                continue
+            
+            batch_voters = [v for v in proposal_ballots if v in self.members]
+            batch_supports = [proposal_ballots[v] for v in batch_voters]
+            batch_powers = [get_power(v) for v in batch_voters]
+            
+            for voter in batch_voters:
+                self._retract_vote(proposal, voter)
+            
+            for_votes = math.fsum(compress(batch_powers, batch_supports))
+            proposal.for_votes += for_votes
+            proposal.against_votes += math.fsum(batch_powers) - for_votes
+            
+            timestamp = self.current_time
+            for voter, support, power in zip(batch_voters, batch_supports, batch_powers):
+                proposal.votes[voter] = {
+                    'support': support,
+                    'voting_power': power,
+                    'timestamp': timestamp
+                }
+            self.vote_log.append(proposal_id, batch_voters, batch_supports, batch_powers, timestamp)
+            counted += len(batch_voters)
+        
+        return counted
+    
+    def get_voting_history(self, voter: str) -> List[Dict]:
+        """Every ballot a member has cast through either voting method, oldest first.
+        
+        Re-votes appear as separate entries; the latest one on a proposal is the one counted.
+        """
+        return self.vote_log.history_for(voter)
+    
+    def _retract_vote(self, proposal: Proposal, voter: str):
+        """Remove a voter's previous ballot from a proposal's tallies"""
+        previous = proposal.votes.get(voter)
+        if previous is None:
+            return
+        if previous['support']:
+            proposal.for_votes -= previous['voting_power']
+        else:
+            proposal.against_votes -= previous['voting_power']
+    
+    @profiled("dao.finalize")
     def finalize_proposal(self, proposal_id: str) -> bool:
         """Finalize a proposal after voting period"""
         if proposal_id not in self.proposals:
@@ -213,29 +553,67 @@ class DAOSimulation:
         if proposal.state != ProposalState.ACTIVE:
             return False
         
+        return self._finalize(proposal, self._total_voting_power())
+    
+    @profiled("dao.advance_time")
+    def advance_time(self, delta: timedelta) -> Dict[str, bool]:
+        """Move the clock forward, finalizing and executing proposals whose voting ended.
+        
+        Returns {proposal_id: passed} for every proposal finalized on the way.
+        Proposals already finalized by hand are skipped.
+        """
+        self.current_time += delta
+        due = self.proposal_scheduler.pop_due(self.current_time)
+        
+        finalized = {}
+        total_voting_power = self._total_voting_power()
+        for proposal_id in due:
+            proposal = self.proposals.get(proposal_id)
+            if proposal is None or proposal.state != ProposalState.ACTIVE:
+                continue
+            finalized[proposal_id] = self._finalize(proposal, total_voting_power)
+        self.dispatch_missions()
+        return finalized
+    
+    def _total_voting_power(self) -> float:
+        """Voting power of the whole membership (maintained incrementally)"""
+        return self.voting_strategy.total_power
+    
+    def _finalize(self, proposal: Proposal, total_voting_power: float) -> bool:
+        """Apply quorum and threshold rules to an active proposal"""
+        proposal_id = proposal.id
         total_votes = proposal.for_votes + proposal.against_votes
-        total_voting_power = sum(m.get_voting_power() for m in self.members.values())
         
         # Check quorum
         if total_votes < total_voting_power * self.minimum_quorum:
-            proposal.state = ProposalState.DEFEATED
+            self._set_proposal_state(proposal, ProposalState.DEFEATED)
             return False
         
         # Check if proposal passed
         if proposal.for_votes > proposal.against_votes and \
            proposal.for_votes > total_votes * self.success_threshold:
-            proposal.state = ProposalState.SUCCEEDED
+            self._set_proposal_state(proposal, ProposalState.SUCCEEDED)
             return self.execute_proposal(proposal_id)
         else:
-            proposal.state = ProposalState.DEFEATED
+            self._set_proposal_state(proposal, ProposalState.DEFEATED)
             return False
     
+    def _set_proposal_state(self, proposal: Proposal, state: ProposalState):
+        """Change a proposal's state and keep the governance counters in step"""
+        self.counters.proposal_transition(proposal.state, state)
+        proposal.state = state
+    
     def execute_proposal(self, proposal_id: str) -> bool:
         """Execute a successful proposal by creating a mission"""
         proposal = self.proposals[proposal_id]
         if proposal.state != ProposalState.SUCCEEDED:
             return False
         
+        # Backpressure: the proposal stays SUCCEEDED and is retried by dispatch_missions()
+        if self.mission_scheduler is not None and not self.mission_scheduler.admit(self):
+            self.mission_scheduler.defer(proposal_id, self.current_time)
+            return False
+        
         mission_data = proposal.mission_data
         mission_id = self.create_mission(
             title=mission_data['title'],
@@ -246,16 +624,20 @@ class DAOSimulation:
             max_agents=mission_data.get('max_agents', 3)
         )
         
-        proposal.state = ProposalState.EXECUTED
+        self._set_proposal_state(proposal, ProposalState.EXECUTED)
         return mission_id is not None
     
     def create_mission(self, title: str, description: str, 
                       required_capabilities: Set[str], budget: float,
-                      deadline_days: int = 30, max_agents: int = 3) -> str:
-        """Create a new mission"""
-        mission_id = f"mission_{uuid.uuid4().hex[:8]}"
+                      deadline_days: int = 30, max_agents: int = 3) -> Optional[str]:
+        """Create a new mission (None if the mission scheduler refuses it under backpressure)"""
+        if self.mission_scheduler is not None and not self.mission_scheduler.admit(self):
+            self.mission_scheduler.reject()
+            return None
+        
+        mission_id = self._new_id("mission", self.missions)
         
-        mission = Mission(
+        mission = self._mission_cls(
             id=mission_id,
             title=title,
             description=description,
@@ -266,8 +648,12 @@ class DAOSimulation:
         )
         
         self.missions[mission_id] = mission
+        self.counters.mission_outcomes['in_progress'] += 1
+        if self.mission_scheduler is not None:
+            self.mission_scheduler.enqueue(mission, self.current_time)
         return mission_id
     
+    @profiled("dao.assignment")
     def assign_agents_to_mission(self, mission_id: str) -> List[str]:
         """Automatically assign best-suited agents to a mission"""
         if mission_id not in self.missions:
@@ -281,34 +667,126 @@ class DAOSimulation:
         qualified_agents = []
         for agent in self.agents.values():
             if agent.can_perform_mission(mission.required_capabilities):
-                # Calculate agent score for this mission
-                capability_scores = [
-                    agent.get_capability_score(cap) 
-                    for cap in mission.required_capabilities
-                ]
-                avg_capability_score = sum(capability_scores) / len(capability_scores)
-                
-                # Factor in reputation and availability
-                availability_bonus = 1.0 if len(agent.active_missions) == 0 else 0.8
-                total_score = (avg_capability_score * 0.6 + 
-                              agent.reputation / 100.0 * 0.4) * availability_bonus
-                
-                qualified_agents.append((agent.address, total_score))
+                qualified_agents.append((agent.address, self._agent_mission_score(agent, mission)))
         
         # Sort by score and select top agents
         qualified_agents.sort(key=lambda x: x[1], reverse=True)
         selected_agents = [addr for addr, _ in qualified_agents[:mission.max_agents]]
         
-        # Assign agents to mission
-        mission.assigned_agents = selected_agents
+        self._assign(mission, selected_agents)
+        return selected_agents
+    
+    def assign_pending_missions(self, time_budget: Optional[float] = None) -> Dict[str, List[str]]:
+        """Staff every CREATED mission together with the batch auction matcher.
+        
+        Missions that win no agents stay CREATED and are re-bid on the next call,
+        starting from the matcher's warm prices.
+        """
+        if self.matcher is None:
+            from mission_matching import AuctionMatcher
+            self.matcher = AuctionMatcher()
+        pending = [m.id for m in self.missions.values() if m.status == MissionStatus.CREATED]
+        self.matcher.solve(self, pending, time_budget)
+        return self.matcher.commit(self)
+    
+    def assign_missions_parallel(self, mission_ids: Optional[Iterable[str]] = None,
+                                 processes: Optional[int] = None) -> Dict[str, List[str]]:
+        """Staff CREATED missions with their top-scored agents, scoring in worker processes.
+        
+        Agents are copied once into shared memory (shared_tables.SharedAgentTable)
+        and every mission is scored against that snapshot, so agent loads are
+        those at the time of the call. Missions no agent qualifies for stay CREATED.
+        """
+        from shared_tables import ParallelScorer, SharedAgentTable
+        if mission_ids is None:
+            mission_ids = [m.id for m in self.missions.values() if m.status == MissionStatus.CREATED]
+        missions = [self.missions[m] for m in mission_ids if self.missions[m].status == MissionStatus.CREATED]
+        if not missions or not self.agents:
+            return {}
+        with SharedAgentTable.from_dao(self) as table, ParallelScorer(table, processes) as scorer:
+            ranked = scorer.score([(m.required_capabilities, m.max_agents) for m in missions])
+        
+        assigned: Dict[str, List[str]] = {}
+        for mission, top in zip(missions, ranked):
+            if top:
+                agent_addrs = [self._agent_order[slot] for slot, _ in top]
+                self._assign(mission, agent_addrs)
+                assigned[mission.id] = agent_addrs
+        return assigned
+    
+    def _agent_mission_score(self, agent: Agent, mission: Mission) -> float:
+        """Suitability of a qualified agent for a mission"""
+        capability_scores = [
+            agent.get_capability_score(cap) 
+            for cap in mission.required_capabilities
+        ]
+        avg_capability_score = sum(capability_scores) / len(capability_scores)
+        
+        # Factor in reputation and availability
+        availability_bonus = 1.0 if len(agent.active_missions) == 0 else 0.8
+        return (avg_capability_score * 0.6 + 
+                agent.reputation / 100.0 * 0.4) * availability_bonus
+    
+    def _assign(self, mission: Mission, agent_addrs: List[str]):
+        """Start a mission with the given agents"""
+        mission.assigned_agents = agent_addrs
         mission.status = MissionStatus.IN_PROGRESS
         
         # Update agent active missions
-        for agent_addr in selected_agents:
-            self.agents[agent_addr].active_missions.add(mission_id)
-        
-        return selected_agents
+        for agent_addr in agent_addrs:
+            agent = self.agents[agent_addr]
+            if not agent.active_missions:
+                self.counters.agents_busy += 1
+            agent.active_missions.add(mission.id)
+            if self.mission_scheduler is not None:
+                self.mission_scheduler.agent_changed(agent)
+    
+    def _release_agent(self, agent: Agent, mission_id: str):
+        """Take a finished mission off an agent"""
+        if mission_id in agent.active_missions:
+            agent.active_missions.discard(mission_id)
+            if not agent.active_missions:
+                self.counters.agents_busy -= 1
+            if self.mission_scheduler is not None:
+                self.mission_scheduler.agent_changed(agent)
+    
+    def enable_mission_scheduler(self, **params):
+        """Queue new missions by (deadline, -budget) and staff them as agents free up"""
+        from mission_scheduler import MissionScheduler
+        self.mission_scheduler = MissionScheduler(**params)
+        for mission in self.missions.values():
+            if mission.status == MissionStatus.CREATED:
+                self.mission_scheduler.enqueue(mission, self.current_time)
+        return self.mission_scheduler
+    
+    def dispatch_missions(self) -> Dict[str, List[str]]:
+        """Expire overdue queued missions, staff the rest in priority order, then
+        execute proposals deferred by backpressure while the scheduler admits them"""
+        scheduler = self.mission_scheduler
+        if scheduler is None:
+            return {}
+        assigned = scheduler.dispatch(self)
+        executed = 0
+        while scheduler.deferred_proposals and scheduler.admit(self):
+            executed += self.execute_proposal(scheduler.pop_deferred())
+        if executed:
+            assigned.update(scheduler.dispatch(self))
+        return assigned
+    
+    def get_mission_queue_metrics(self) -> Dict:
+        """Queue depth, wait times, expiries and backpressure rejections"""
+        if self.mission_scheduler is None:
+            return {}
+        metrics = self.mission_scheduler.metrics(self.current_time)
+        metrics['agent_utilization'] = self.counters.agents_busy / len(self.agents) if self.agents else 0.0
+        return metrics
+    
+    def _expire_mission(self, mission: Mission):
+        """Fail a mission whose deadline passed before it could be staffed"""
+        mission.status = MissionStatus.FAILED
+        self.counters.mission_finished('failure')
 
+    @profiled("dao.execution")
     def simulate_mission_execution(self, mission_id: str, days_to_simulate: int = 30) -> Dict:
         """Simulate mission execution over time"""
         if mission_id not in self.missions:
@@ -329,6 +807,10 @@ class DAOSimulation:
             'final_outcome': None
         }
 
+        if self.message_bus is not None:
+            for agent_addr in mission.assigned_agents:
+                self.message_bus.subscribe(mission.id, agent_addr)
+
         for day in range(days_to_simulate):
             # Calculate daily progress based on agent performance
             daily_progress = 0.0
@@ -351,15 +833,19 @@ class DAOSimulation:
                     results['performance_scores'][agent_addr] = []
                 results['performance_scores'][agent_addr].append(agent_contribution)
 
-            # Coordination events (random)
-            if random.random() < 0.3:  # 30% chance of coordination event
+            # Coordination events: exchanged over the message bus, or random without one
+            coordination_event = None
+            if self.message_bus is not None:
+                coordination_event = self._exchange_coordination_messages(mission, day)
+            elif random.random() < 0.3:  # 30% chance of coordination event
                 coordination_event = {
                     'day': day,
-                    'type': random.choice(['planning', 'problem_solving', 'resource_sharing']),
+                    'type': random.choice(COORDINATION_KINDS),
                     'participants': random.sample(mission.assigned_agents,
                                                 min(2, len(mission.assigned_agents))),
                     'effectiveness': random.uniform(0.5, 1.0)
                 }
+            if coordination_event is not None:
                 results['coordination_events'].append(coordination_event)
 
                 # Coordination bonus
@@ -383,6 +869,9 @@ class DAOSimulation:
         else:
             results['final_outcome'] = 'failure'
             mission.status = MissionStatus.FAILED
+        self.counters.mission_finished(results['final_outcome'])
+        if self.message_bus is not None:
+            mission.coordination_messages = [message._asdict() for message in self.message_bus.close(mission.id)]
 
         # Update agent performance and reputation
         self._update_agent_performance(mission_id, results)
@@ -421,6 +910,18 @@ class DAOSimulation:
                 'outcome': results['final_outcome']
             }
             agent.performance_history.append(performance_record)
+            agent.performance_total += performance_score
+            self.counters.missions_completed += 1
+            self.counters.performance_sum += performance_score
+
+            if self.reputation_engine is not None:
+                # Deferred to the next reputation epoch
+                self.reputation_engine.record_performance(
+                    agent_addr, performance_score, results['final_outcome'] != 'failure',
+                    mission.required_capabilities
+                )
+                self._release_agent(agent, mission_id)
+                continue
 
             # Update reputation (exponential moving average)
             reputation_change = (performance_score - 0.5) * 10  # -5 to +5 change
@@ -428,7 +929,85 @@ class DAOSimulation:
             agent.reputation = max(0, min(200, agent.reputation))  # Clamp between 0-200
 
             # Remove from active missions
-            agent.active_missions.discard(mission_id)
+            self._release_agent(agent, mission_id)
+
+    def enable_message_bus(self, messages_per_agent: int = 4, read_limit: Optional[int] = None, **params):
+        """Model mission coordination as messages between assigned agents on a bounded bus"""
+        from message_bus import MessageBus
+        self.message_bus = MessageBus(**params)
+        self.messages_per_agent = messages_per_agent
+        self.message_read_limit = read_limit
+        return self.message_bus
+
+    def _exchange_coordination_messages(self, mission: Mission, day: int) -> Optional[Dict]:
+        """One day of coordination traffic on the mission's topic, summarized as an event"""
+        bus = self.message_bus
+        team = mission.assigned_agents
+        for agent_addr in team:
+            bus.publish_batch(mission.id, agent_addr, [
+                (random.choice(COORDINATION_KINDS), random.uniform(0.5, 1.0))
+                for _ in range(self.messages_per_agent)
+            ], day)
+
+        received = []
+        participants = []
+        for agent_addr in team:
+            messages = bus.drain(mission.id, agent_addr, self.message_read_limit)
+            if messages:
+                participants.append(agent_addr)
+                received.extend(messages)
+        if not received:
+            return None
+
+        # Effectiveness: quality of what was read, scaled by the share of team traffic that got through
+        expected = self.messages_per_agent * len(team) * (len(team) - 1)
+        quality = sum(message.payload for message in received) / len(received)
+        kinds = [message.kind for message in received]
+        return {
+            'day': day,
+            'type': max(COORDINATION_KINDS, key=kinds.count),
+            'participants': participants,
+            'effectiveness': quality * min(1.0, len(received) / expected),
+            'messages': len(received)
+        }
+
+    def enable_reputation_engine(self, **params):
+        """Switch to epoch-batched reputation (per-skill ratings, decay, slashing)"""
+        from reputation_engine import ReputationEngine
+        self.reputation_engine = ReputationEngine(self.store.agents if self.store else None, **params)
+        return self.reputation_engine
+
+    def slash_agent(self, agent_addr: str, severity: float = 1.0) -> bool:
+        """Queue a stake slash for the next reputation epoch"""
+        if self.reputation_engine is None or agent_addr not in self.agents:
+            return False
+        self.reputation_engine.record_violation(agent_addr, severity)
+        return True
+
+    @profiled("dao.reputation_epoch")
+    def run_reputation_epoch(self) -> Dict:
+        """Apply buffered reputation events to every agent in one batch"""
+        engine = self.reputation_engine
+        if engine is None:
+            return {}
+        if self.store is None:
+            # Object-backed agents: mirror them into the engine's columns and back
+            reputation = engine.table.columns["reputation"]
+            stake = engine.table.columns["staked_amount"]
+            for address, agent in self.agents.items():
+                slot = engine.slot(address)
+                reputation[slot] = agent.reputation
+                stake[slot] = agent.staked_amount
+            report = engine.run_epoch()
+            for address, agent in self.agents.items():
+                slot = engine.table.index.slot(address)
+                agent.reputation = reputation[slot]
+                agent.staked_amount = stake[slot]
+        else:
+            # The engine writes the shared columns directly, bypassing Agent.__setattr__
+            report = engine.run_epoch()
+            self.counters.reputation_sum += report['net_reputation_change']
+        return report
 
     def _distribute_mission_rewards(self, mission_id: str, results: Dict):
         """Distribute rewards to agents based on performance"""
@@ -437,77 +1016,88 @@ class DAOSimulation:
         if results['final_outcome'] == 'failure':
             return  # No rewards for failed missions
 
-        # Calculate reward multiplier based on outcome
-        reward_multiplier = {
-            'success': 1.0,
-            'partial_success': 0.7
-        }.get(results['final_outcome'], 0)
+        # Calculate reward multiplier (as a fraction) based on outcome
+        numerator, denominator = {
+            'success': (1, 1),
+            'partial_success': (7, 10)
+        }.get(results['final_outcome'], (0, 1))
 
-        total_reward = mission.budget * reward_multiplier
+        total_reward = mul_div(to_wei(mission.budget), numerator, denominator)
 
         # Calculate individual rewards based on performance
-        total_performance = sum(
-            sum(scores) for scores in results['performance_scores'].values()
-        )
+        agent_performances = [
+            sum(results['performance_scores'].get(agent_addr, []))
+            for agent_addr in mission.assigned_agents
+        ]
 
-        if total_performance > 0:
-            for agent_addr in mission.assigned_agents:
-                agent = self.agents[agent_addr]
-                agent_performance = sum(results['performance_scores'].get(agent_addr, []))
-                agent_reward = total_reward * (agent_performance / total_performance)
+        if sum(agent_performances) > 0:
+            # Integer split: the agents' shares add up to exactly total_reward
+            agent_rewards = split_proportional(total_reward, agent_performances)
+            for agent_addr, agent_reward in zip(mission.assigned_agents, agent_rewards):
+                # Queue the treasury transfer; paid out at settlement
+                self.ledger.queue_reward(agent_addr, agent_reward, memo=mission_id)
 
-                agent.total_earnings += agent_reward
+        if self.auto_settle_rewards:
+            self.settle_rewards()
 
-                # Deduct from treasury
-                self.treasury_balance -= agent_reward
+    @profiled("dao.settlement")
+    def settle_rewards(self) -> bool:
+        """Pay all queued rewards in one ledger batch; False if it would overdraw the treasury.
+        
+        A refused batch stays queued for the next settlement and is counted in
+        the summary stats as a failed settlement.
+        """
+        paid = self.ledger.settle(self.current_time.timestamp())
+        if paid is None:
+            self.counters.failed_settlements += 1
+            return False
+        self.counters.rewards_paid_wei += sum(paid.values())
+        for agent_addr in paid:
+            # Mirror the exact ledger total rather than accumulating float rewards
+            self.agents[agent_addr].total_earnings = from_wei(self.ledger.total_received(agent_addr))
+        return True
+
+    def get_agent_earnings_history(self, agent_addr: str, limit: Optional[int] = None) -> List[Dict]:
+        """Get the ledger entries paying an agent, without scanning the whole ledger"""
+        return self.ledger.history(agent_addr, limit)
 
     def get_simulation_stats(self) -> Dict:
         """Get comprehensive simulation statistics"""
-        stats = {
+        stats = self.get_summary_stats()
+        stats['agent_stats'] = self.get_agent_stats_page(0, len(self._agent_order))
+        return stats
+
+    def get_summary_stats(self) -> Dict:
+        """Get headline statistics in O(1) from the maintained counters"""
+        counters = self.counters
+        return {
             'treasury_balance': self.treasury_balance,
             'total_agents': len(self.agents),
             'total_members': len(self.members),
             'total_proposals': len(self.proposals),
             'total_missions': len(self.missions),
-            'agent_stats': {},
-            'mission_stats': {},
-            'governance_stats': {}
+            'total_votes': len(self.vote_log),
+            'avg_agent_reputation': counters.reputation_sum / len(self.agents) if self.agents else 0,
+            'avg_performance': counters.performance_sum / counters.missions_completed if counters.missions_completed else 0,
+            'total_rewards_paid': from_wei(counters.rewards_paid_wei),
+            'failed_settlements': counters.failed_settlements,
+            'pending_rewards': len(self.ledger.pending_rewards),
+            'mission_stats': dict(counters.mission_outcomes),
+            'governance_stats': dict(counters.proposal_states)
         }
 
-        # Agent statistics
-        for addr, agent in self.agents.items():
-            stats['agent_stats'][addr] = {
+    def get_agent_stats_page(self, offset: int = 0, limit: int = 100) -> Dict[str, Dict]:
+        """Get per-agent statistics for agents [offset, offset + limit) in registration order"""
+        page = {}
+        for addr in self._agent_order[offset:offset + limit]:
+            agent = self.agents[addr]
+            missions_completed = len(agent.performance_history)
+            page[addr] = {
                 'name': agent.name,
                 'reputation': agent.reputation,
                 'total_earnings': agent.total_earnings,
-                'missions_completed': len(agent.performance_history),
-                'avg_performance': sum(p['score'] for p in agent.performance_history) / len(agent.performance_history) if agent.performance_history else 0,
+                'missions_completed': missions_completed,
+                'avg_performance': agent.performance_total / missions_completed if missions_completed else 0,
                 'capabilities': list(agent.capabilities)
             }
-
-        # Mission statistics
-        mission_outcomes = {'success': 0, 'partial_success': 0, 'failure': 0, 'in_progress': 0}
-        for mission in self.missions.values():
-            if mission.status == MissionStatus.COMPLETED:
-                # Determine outcome based on progress
-                if mission.progress >= 1.0:
-                    mission_outcomes['success'] += 1
-                elif mission.progress >= 0.7:
-                    mission_outcomes['partial_success'] += 1
-                else:
-                    mission_outcomes['failure'] += 1
-            elif mission.status == MissionStatus.FAILED:
-                mission_outcomes['failure'] += 1
-            else:
-                mission_outcomes['in_progress'] += 1
-
-        stats['mission_stats'] = mission_outcomes
-
-        # Governance statistics
-        proposal_outcomes = {'succeeded': 0, 'defeated': 0, 'active': 0, 'executed': 0}
-        for proposal in self.proposals.values():
-            proposal_outcomes[proposal.state.value] += 1
-
-        stats['governance_stats'] = proposal_outcomes
-
-        return stats
+        return page
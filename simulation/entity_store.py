@@ -0,0 +1,208 @@
+"""
+Struct-of-Arrays Entity Store for DAOSimulation
+
+Optional columnar backend: the numeric and status fields of agents, members,
+missions and proposals live in typed array columns indexed by dense int slots
+(see ids.DenseIndex), and the dataclass objects handed out by DAOSimulation are
+thin views whose fields read and write those columns. Existing code that works
+with Agent/DAOMember/Mission/Proposal objects keeps working, while
+population-wide aggregates (reputation and voting-power sums, status counts)
+run as single passes over contiguous columns, and ReputationEngine updates
+agents in place by sharing the agent table.
+
+Columns are stdlib arrays. When NumPy is installed, ColumnTable.numpy() exposes
+a zero-copy ndarray over a column for fully vectorized math.
+"""
+
+import math
+from array import array
+from operator import mul
+from typing import Dict, Iterable, List
+
+from dao_simulation import Agent, DAOMember, Mission, MissionStatus, Proposal, ProposalState
+from ids import DenseIndex
+
+AGENT_COLUMNS = {"reputation": 'd', "staked_amount": 'd', "total_earnings": 'd', "performance_total": 'd'}
+MEMBER_COLUMNS = {"token_balance": 'd', "reputation": 'd'}
+MISSION_COLUMNS = {"budget": 'd', "progress": 'd', "status": 'b'}
+PROPOSAL_COLUMNS = {"for_votes": 'd', "against_votes": 'd', "state": 'b'}
+
+
+class ColumnTable:
+    """Typed array columns for one entity kind; rows are addressed by slot"""
+
+    def __init__(self, schema: Dict[str, str]):
+        self.index = DenseIndex()
+        self.columns: Dict[str, array] = {name: array(typecode) for name, typecode in schema.items()}
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def add(self, key: str) -> int:
+        """Append a zeroed row for `key` and return its slot"""
+        slot = self.index.intern(key)
+        if slot == len(next(iter(self.columns.values()))):
+            for column in self.columns.values():
+                column.append(0)
+        return slot
+
+    def column(self, name: str) -> array:
+        return self.columns[name]
+
+    def gather(self, name: str, slots: Iterable[int]) -> List:
+        return list(map(self.columns[name].__getitem__, slots))
+
+    def scatter(self, name: str, slots: Iterable[int], values: Iterable):
+        column = self.columns[name]
+        for slot, value in zip(slots, values):
+            column[slot] = value
+
+    def sum(self, name: str) -> float:
+        return math.fsum(self.columns[name])
+
+    def numpy(self, name: str):
+        """Zero-copy NumPy view of a column (invalidated by the next add); requires NumPy"""
+        import numpy as np
+        return np.frombuffer(self.columns[name], dtype=self.columns[name].typecode)
+
+
+def _column_field(name: str) -> property:
+    """A dataclass field stored in the view's table column"""
+    def fget(self):
+        return self._table.columns[name][self._slot]
+
+    def fset(self, value):
+        self._table.columns[name][self._slot] = value
+    return property(fget, fset)
+
+
+def _enum_field(name: str, enum_cls) -> property:
+    """An enum field stored as its position in a byte column"""
+    members = list(enum_cls)
+    positions = {member: i for i, member in enumerate(members)}
+
+    def fget(self):
+        return members[self._table.columns[name][self._slot]]
+
+    def fset(self, value):
+        self._table.columns[name][self._slot] = positions[value]
+    return property(fget, fset)
+
+
+class AgentView(Agent):
+    """Agent whose numeric fields live in the store's agent columns"""
+
+    reputation = _column_field("reputation")
+    staked_amount = _column_field("staked_amount")
+    total_earnings = _column_field("total_earnings")
+    performance_total = _column_field("performance_total")
+
+    def __init__(self, table: ColumnTable, slot: int, **fields):
+        self._table = table
+        self._slot = slot
+        super().__init__(**fields)
+
+
+class MemberView(DAOMember):
+    """DAOMember whose holdings live in the store's member columns"""
+
+    token_balance = _column_field("token_balance")
+    reputation = _column_field("reputation")
+
+    def __init__(self, table: ColumnTable, slot: int, **fields):
+        self._table = table
+        self._slot = slot
+        super().__init__(**fields)
+
+
+class MissionView(Mission):
+    """Mission whose budget, progress and status live in the store's mission columns"""
+
+    budget = _column_field("budget")
+    progress = _column_field("progress")
+    status = _enum_field("status", MissionStatus)
+
+    def __init__(self, table: ColumnTable, slot: int, **fields):
+        self._table = table
+        self._slot = slot
+        super().__init__(**fields)
+
+
+class ProposalView(Proposal):
+    """Proposal whose tallies and state live in the store's proposal columns"""
+
+    for_votes = _column_field("for_votes")
+    against_votes = _column_field("against_votes")
+    state = _enum_field("state", ProposalState)
+
+    def __init__(self, table: ColumnTable, slot: int, **fields):
+        self._table = table
+        self._slot = slot
+        super().__init__(**fields)
+
+
+class ColumnarStore:
+    """Column tables for every entity kind, plus population-wide operations"""
+
+    def __init__(self):
+        self.agents = ColumnTable(AGENT_COLUMNS)
+        self.members = ColumnTable(MEMBER_COLUMNS)
+        self.missions = ColumnTable(MISSION_COLUMNS)
+        self.proposals = ColumnTable(PROPOSAL_COLUMNS)
+
+    # Entity construction (keyword arguments are the dataclass fields)
+
+    def new_agent(self, **fields) -> AgentView:
+        return AgentView(self.agents, self.agents.add(fields["address"]), **fields)
+
+    def new_member(self, **fields) -> MemberView:
+        return MemberView(self.members, self.members.add(fields["address"]), **fields)
+
+    def new_mission(self, **fields) -> MissionView:
+        return MissionView(self.missions, self.missions.add(fields["id"]), **fields)
+
+    def new_proposal(self, **fields) -> ProposalView:
+        return ProposalView(self.proposals, self.proposals.add(fields["id"]), **fields)
+
+    # Population-wide operations
+
+    def total_reputation(self) -> float:
+        return self.agents.sum("reputation")
+
+    def voting_power_sum(self) -> float:
+        """Sum of token_balance * reputation / 100 over all members"""
+        members = self.members.columns
+        return math.fsum(map(mul, members["token_balance"], members["reputation"])) / 100.0
+
+    def status_counts(self) -> Dict[str, Dict[str, int]]:
+        """Mission statuses and proposal states counted straight from their byte columns"""
+        mission_status = self.missions.columns["status"]
+        proposal_state = self.proposals.columns["state"]
+        return {
+            "missions": {status.value: mission_status.count(i) for i, status in enumerate(MissionStatus)},
+            "proposals": {state.value: proposal_state.count(i) for i, state in enumerate(ProposalState)}
+        }
+
+
+if __name__ == "__main__":
+    import time
+
+    from dao_simulation import DAOSimulation
+    from population import PopulationGenerator
+
+    print("🧱 Columnar Entity Store")
+    print("=" * 50)
+    size = 200000
+    for columnar in (False, True):
+        dao = DAOSimulation(columnar=columnar)
+        PopulationGenerator(seed=11).populate_dao(dao, agents=size, members=size)
+        started = time.perf_counter()
+        if columnar:
+            power = dao.store.voting_power_sum()
+            reputation = dao.store.total_reputation()
+        else:
+            power = math.fsum(m.token_balance * m.reputation for m in dao.members.values()) / 100.0
+            reputation = math.fsum(a.reputation for a in dao.agents.values())
+        elapsed = time.perf_counter() - started
+        print(f"{'columnar' if columnar else 'objects ':>8}: voting power {power:,.0f}, "
+              f"reputation {reputation:,.0f} over {size:,} entities in {elapsed * 1000:.1f} ms")
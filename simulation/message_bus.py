@@ -0,0 +1,182 @@
+"""
+Bounded Coordination Message Bus
+
+In-process pub/sub between the agents assigned to a mission. Each mission is a
+topic; every subscriber has a bounded inbox per topic, so memory stays
+constant however many messages flow. When an inbox is full the topic's policy
+decides what happens:
+- "drop_oldest": the new message evicts the oldest unread one
+- "drop_newest": the new message is dropped for that subscriber
+- "block": backpressure, the publisher is told how much was accepted and the
+  rest is refused for every subscriber
+
+Messages are published and drained in batches (one subscriber lookup and one
+deque extend per recipient per batch). A short per-topic history keeps the
+most recent messages for inspection, e.g. Mission.coordination_messages.
+"""
+
+from collections import deque
+from itertools import islice
+from typing import Any, Deque, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+POLICIES = ("drop_oldest", "drop_newest", "block")
+
+
+class Message(NamedTuple):
+    topic: str
+    sender: str
+    kind: str
+    payload: Any = None
+    time: float = 0.0
+
+
+class Topic:
+    """Subscriber inboxes and recent history for one topic"""
+
+    def __init__(self, queue_size: int, policy: str, history: int):
+        self.queue_size = queue_size
+        self.policy = policy
+        self.inboxes: Dict[str, Deque[Message]] = {}
+        self.history: Deque[Message] = deque(maxlen=history)
+
+
+class MessageBus:
+    """Pub/sub with per-topic bounded inboxes, drop/backpressure policies and batching"""
+
+    def __init__(self, queue_size: int = 256, policy: str = "drop_oldest", history: int = 32):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown policy {policy!r}; expected one of {POLICIES}")
+        self.queue_size = queue_size  # Default inbox capacity per subscriber
+        self.policy = policy  # Default overflow policy
+        self.history = history  # Recent messages kept per topic
+        self.topics: Dict[str, Topic] = {}
+
+        self.published = 0  # Messages accepted from publishers
+        self.delivered = 0  # Messages placed in an inbox
+        self.dropped = 0  # Inbox entries lost to drop_oldest/drop_newest
+        self.refused = 0  # Messages refused by backpressure
+        self.consumed = 0  # Messages drained by subscribers
+
+    def open(self, topic: str, queue_size: Optional[int] = None, policy: Optional[str] = None) -> Topic:
+        """Create a topic (or return the existing one) with its own capacity and policy"""
+        existing = self.topics.get(topic)
+        if existing is not None:
+            return existing
+        policy = policy or self.policy
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown policy {policy!r}; expected one of {POLICIES}")
+        created = self.topics[topic] = Topic(queue_size or self.queue_size, policy, self.history)
+        return created
+
+    def close(self, topic: str) -> List[Message]:
+        """Remove a topic and its inboxes; returns its recent history"""
+        closed = self.topics.pop(topic, None)
+        return list(closed.history) if closed is not None else []
+
+    def subscribe(self, topic: str, subscriber: str):
+        state = self.open(topic)
+        if subscriber not in state.inboxes:
+            maxlen = state.queue_size if state.policy == "drop_oldest" else None
+            state.inboxes[subscriber] = deque(maxlen=maxlen)
+
+    def unsubscribe(self, topic: str, subscriber: str):
+        state = self.topics.get(topic)
+        if state is not None:
+            state.inboxes.pop(subscriber, None)
+
+    def subscribers(self, topic: str) -> List[str]:
+        state = self.topics.get(topic)
+        return list(state.inboxes) if state is not None else []
+
+    def publish(self, topic: str, sender: str, kind: str, payload: Any = None, time: float = 0.0) -> bool:
+        """Publish one message to every other subscriber; False if refused by backpressure"""
+        return self.publish_batch(topic, sender, [(kind, payload)], time) == 1
+
+    def publish_batch(self, topic: str, sender: str, messages: Iterable[Tuple[str, Any]],
+                      time: float = 0.0) -> int:
+        """Publish (kind, payload) pairs in order; returns how many were accepted"""
+        state = self.topics.get(topic)
+        if state is None:
+            return 0
+        batch = [Message(topic, sender, kind, payload, time) for kind, payload in messages]
+        recipients = [inbox for subscriber, inbox in state.inboxes.items() if subscriber != sender]
+        size = state.queue_size
+
+        if state.policy == "block":
+            room = min((size - len(inbox) for inbox in recipients), default=len(batch))
+            accepted = max(0, min(len(batch), room))
+            self.refused += len(batch) - accepted
+            batch = batch[:accepted]
+            for inbox in recipients:
+                inbox.extend(batch)
+            self.delivered += accepted * len(recipients)
+        elif state.policy == "drop_newest":
+            for inbox in recipients:
+                room = max(0, size - len(inbox))
+                inbox.extend(islice(batch, room))
+                kept = min(room, len(batch))
+                self.delivered += kept
+                self.dropped += len(batch) - kept
+        else:  # drop_oldest: the deque's maxlen evicts from the front
+            for inbox in recipients:
+                self.dropped += max(0, len(inbox) + len(batch) - size)
+                inbox.extend(batch)
+            self.delivered += len(batch) * len(recipients)
+
+        state.history.extend(batch)
+        self.published += len(batch)
+        return len(batch)
+
+    def drain(self, topic: str, subscriber: str, max_messages: Optional[int] = None) -> List[Message]:
+        """Take up to max_messages (all if None) from a subscriber's inbox, oldest first"""
+        state = self.topics.get(topic)
+        inbox = state.inboxes.get(subscriber) if state is not None else None
+        if not inbox:
+            return []
+        count = len(inbox) if max_messages is None else min(max_messages, len(inbox))
+        popleft = inbox.popleft
+        drained = [popleft() for _ in range(count)]
+        self.consumed += count
+        return drained
+
+    def pending(self, topic: str, subscriber: str) -> int:
+        state = self.topics.get(topic)
+        inbox = state.inboxes.get(subscriber) if state is not None else None
+        return len(inbox) if inbox is not None else 0
+
+    def stats(self) -> Dict:
+        return {
+            "topics": len(self.topics),
+            "queued": sum(len(inbox) for state in self.topics.values() for inbox in state.inboxes.values()),
+            "published": self.published,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "refused": self.refused,
+            "consumed": self.consumed
+        }
+
+
+if __name__ == "__main__":
+    import time
+
+    print("📨 Coordination Message Bus")
+    print("=" * 50)
+    for policy in POLICIES:
+        bus = MessageBus(queue_size=64, policy=policy)
+        missions, team, per_agent = 2000, 5, 100
+        started = time.perf_counter()
+        for m in range(missions):
+            topic = f"mission_{m}"
+            agents = [f"agent_{m}_{a}" for a in range(team)]
+            for agent in agents:
+                bus.subscribe(topic, agent)
+            for agent in agents:
+                bus.publish_batch(topic, agent, [("planning", i) for i in range(per_agent)])
+            for agent in agents:
+                bus.drain(topic, agent, max_messages=32)
+            bus.close(topic)
+        elapsed = time.perf_counter() - started
+        stats = bus.stats()
+        print(f"{policy:>11}: {stats['published']:,} published, {stats['delivered']:,} delivered, "
+              f"{stats['dropped']:,} dropped, {stats['refused']:,} refused in {elapsed:.2f}s "
+              f"({stats['delivered'] / elapsed:,.0f} deliveries/s)")
@@ -0,0 +1,171 @@
+"""
+Columnar Metrics Recorder for Simulation Runs
+
+Captures per-tick time series (treasury, reputation distribution, mission
+outcomes, votes) into array-backed column buffers and flushes them in parts to
+Parquet or Arrow when pyarrow is installed, to .npy when NumPy is, and to CSV
+otherwise, so long parameter sweeps can be analyzed without re-running them.
+
+Reputation quantiles are opt-in per recorder (every row carries the same
+columns) and estimated from a fixed-size random sample of agents, so recording
+stays cheap for large populations.
+"""
+
+import csv
+import os
+import random
+from array import array
+from typing import Dict, List, Optional
+
+
+class MetricsRecorder:
+    """Per-tick column buffers with part-wise flushing to disk"""
+
+    FORMATS = ("auto", "parquet", "arrow", "npy", "csv")
+
+    def __init__(self, output_dir: Optional[str] = None, run_name: str = "run",
+                 flush_rows: int = 100000, fmt: str = "auto", reputation_quantiles: bool = False,
+                 quantile_sample: int = 10000, seed: int = 0):
+        if fmt not in self.FORMATS:
+            raise ValueError(f"Unknown metrics format '{fmt}'; expected one of {self.FORMATS}")
+        self.output_dir = output_dir
+        self.run_name = run_name
+        self.flush_rows = flush_rows  # Flush a part automatically once this many rows are buffered
+        self.fmt = fmt
+        self.reputation_quantiles = reputation_quantiles  # Add sampled reputation quantiles to every row
+        self.quantile_sample = quantile_sample  # Agents sampled per tick for reputation quantiles
+        self._rng = random.Random(seed)
+        self.columns: Dict[str, array] = {}
+        self.parts_written: List[str] = []
+        self.rows_flushed = 0
+        self._tick = 0
+        self._last_vote_count = 0
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def record(self, **values: float):
+        """Append one row; every row must carry the same metric names"""
+        if not self.columns:
+            self.columns = {name: array('d') for name in values}
+        elif values.keys() != self.columns.keys():
+            raise ValueError("Metric names must be identical for every recorded row")
+        for name, value in values.items():
+            self.columns[name].append(value)
+
+        if self.output_dir is not None and len(self) >= self.flush_rows:
+            self.flush()
+
+    def record_tick(self, dao, tick: Optional[int] = None):
+        """Capture a DAOSimulation snapshot as one row (with sampled reputation quantiles if enabled)"""
+        if tick is None:
+            tick = self._tick
+        self._tick = tick + 1
+
+        summary = dao.get_summary_stats()
+        missions = summary['mission_stats']
+        governance = summary['governance_stats']
+        votes_total = summary['total_votes']
+        row = {
+            'tick': tick,
+            'sim_time': dao.current_time.timestamp(),
+            'treasury_balance': summary['treasury_balance'],
+            'total_rewards_paid': summary['total_rewards_paid'],
+            'agents': summary['total_agents'],
+            'members': summary['total_members'],
+            'missions_success': missions['success'],
+            'missions_partial_success': missions['partial_success'],
+            'missions_failure': missions['failure'],
+            'missions_in_progress': missions['in_progress'],
+            'proposals_active': governance.get('active', 0),
+            'proposals_succeeded': governance.get('succeeded', 0),
+            'proposals_defeated': governance.get('defeated', 0),
+            'proposals_executed': governance.get('executed', 0),
+            'votes_total': votes_total,
+            'votes_this_tick': votes_total - self._last_vote_count,
+            'reputation_mean': summary['avg_agent_reputation']
+        }
+        self._last_vote_count = votes_total
+
+        if self.reputation_quantiles:
+            order = dao._agent_order
+            if len(order) > self.quantile_sample:
+                order = [order[i] for i in self._rng.sample(range(len(order)), self.quantile_sample)]
+            reputations = sorted(dao.agents[address].reputation for address in order)
+            for label, q in (('min', 0.0), ('p10', 0.1), ('p50', 0.5), ('p90', 0.9), ('max', 1.0)):
+                row[f'reputation_{label}'] = _quantile(reputations, q)
+        self.record(**row)
+
+    def flush(self, output_dir: Optional[str] = None) -> Optional[str]:
+        """Write buffered rows as a new part file and clear the buffers; returns its path"""
+        output_dir = output_dir or self.output_dir
+        if output_dir is None:
+            raise ValueError("No output directory configured for metrics flush")
+        if not len(self):
+            return None
+
+        os.makedirs(output_dir, exist_ok=True)
+        stem = os.path.join(output_dir, f"{self.run_name}.part{len(self.parts_written):05d}")
+        fmt = self._resolve_format()
+        if fmt == "parquet":
+            path = self._write_arrow(stem + ".parquet", parquet=True)
+        elif fmt == "arrow":
+            path = self._write_arrow(stem + ".arrow", parquet=False)
+        elif fmt == "npy":
+            path = self._write_npy(stem + ".npy")
+        else:
+            path = self._write_csv(stem + ".csv")
+
+        self.parts_written.append(path)
+        self.rows_flushed += len(self)
+        self.columns = {name: array('d') for name in self.columns}
+        return path
+
+    def _resolve_format(self) -> str:
+        """Pick the richest format whose library is importable"""
+        if self.fmt != "auto":
+            return self.fmt
+        try:
+            import pyarrow  # noqa: F401
+            return "parquet"
+        except ImportError:
+            pass
+        try:
+            import numpy  # noqa: F401
+            return "npy"
+        except ImportError:
+            return "csv"
+
+    def _write_arrow(self, path: str, parquet: bool) -> str:
+        import pyarrow as pa
+        table = pa.table({name: pa.array(column, type=pa.float64())
+                          for name, column in self.columns.items()})
+        if parquet:
+            import pyarrow.parquet as pq
+            pq.write_table(table, path)
+        else:
+            import pyarrow.feather as feather
+            feather.write_feather(table, path)
+        return path
+
+    def _write_npy(self, path: str) -> str:
+        import numpy as np
+        record = np.zeros(len(self), dtype=[(name, 'f8') for name in self.columns])
+        for name, column in self.columns.items():
+            record[name] = np.frombuffer(column, dtype='f8')
+        np.save(path, record)
+        return path
+
+    def _write_csv(self, path: str) -> str:
+        with open(path, 'w', newline='') as handle:
+            writer = csv.writer(handle)
+            writer.writerow(self.columns.keys())
+            writer.writerows(zip(*self.columns.values()))
+        return path
+
+
+def _quantile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank quantile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
@@ -0,0 +1,237 @@
+"""
+Global Mission-to-Agent Matching
+
+Assigns a whole batch of pending missions at once with a capacity-constrained
+auction (Bertsekas): every open mission slot bids for its most profitable
+candidate agent (value minus the agent's price), agents hold at most
+`capacity - active missions` slots, and an agent at capacity evicts its lowest
+bid, which rebids. Prices only rise during a solve, so it terminates, and they
+are kept (decayed) across solves as a warm start, so missions that arrive later
+are matched against the current market instead of from scratch.
+
+Only plausible edges are considered: a capability inverted index yields, per
+mission, a bounded list of agents having every required capability, taken in
+reputation order while skipping agents already heavily demanded, so large
+batches spread over the population instead of all bidding for the same few.
+"""
+
+import heapq
+import time
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from dao_simulation import MissionStatus
+
+
+class CapabilityIndex:
+    """Capability -> agent addresses, kept in sync with DAOSimulation._agent_order"""
+
+    def __init__(self):
+        self.postings: Dict[str, List[str]] = {}
+        self.indexed = 0  # Number of agents from the registration order already indexed
+
+    def sync(self, dao):
+        """Index agents registered since the last sync"""
+        for address in dao._agent_order[self.indexed:]:
+            for capability in dao.agents[address].capabilities:
+                self.postings.setdefault(capability, []).append(address)
+        self.indexed = len(dao._agent_order)
+
+    def rank(self, agents: Dict):
+        """Order every posting list by descending reputation"""
+        for postings in self.postings.values():
+            postings.sort(key=lambda address: agents[address].reputation, reverse=True)
+
+    def shortest(self, required: Iterable[str]) -> List[str]:
+        """The most selective posting list among the required capabilities"""
+        lists = [self.postings.get(capability, []) for capability in required]
+        return min(lists, key=len) if lists else []
+
+
+class AuctionMatcher:
+    """Batch mission assignment by auction with agent capacities and warm-start prices"""
+
+    def __init__(self, capacity: int = 2, epsilon: float = 0.05, candidate_limit: int = 32,
+                 oversubscription: int = 4, price_decay: float = 0.5):
+        self.capacity = capacity  # Max concurrent missions per agent
+        self.epsilon = epsilon  # Minimum bid increment
+        self.candidate_limit = candidate_limit  # Candidate agents per mission
+        self.oversubscription = oversubscription  # Candidate lists an agent may sit on per unit of capacity
+        self.price_decay = price_decay  # Applied to prices on commit
+        self.index = CapabilityIndex()
+        self.prices: Dict[str, float] = {}
+        self._reset()
+
+    def _reset(self):
+        self.edges: Dict[str, List[Tuple[str, float]]] = {}  # Mission -> (agent, value)
+        self.slot_mission: List[str] = []
+        self.slot_agent: List[Optional[str]] = []
+        self.holders: Dict[str, List[Tuple[float, int]]] = {}  # Agent -> min-heap of (bid, slot)
+        self.mission_agents: Dict[str, Set[str]] = {}
+        self.full: Set[str] = set()  # Agents with no capacity left for this batch
+        self.demand: Dict[str, int] = {}  # Candidate lists each agent appears on
+        self.cursors: Dict[frozenset, int] = {}  # Requirement set -> first posting not yet ruled out
+        self.overflow: Dict[frozenset, List[str]] = {}  # Qualified agents passed over for high demand
+        self.overflow_pos: Dict[frozenset, int] = {}
+        self.queue: deque = deque()
+        self.bids = 0
+
+    def solve(self, dao, mission_ids: Iterable[str], time_budget: Optional[float] = None) -> Dict:
+        """Add missions to the pending batch and re-run the auction from the current state"""
+        started = time.perf_counter()
+        new = [m for m in mission_ids if m not in self.edges]
+        if new:
+            self.index.sync(dao)
+            self.index.rank(dao.agents)
+            for mission_id in new:
+                self._add_mission(dao, dao.missions[mission_id])
+
+        deadline = started + time_budget if time_budget is not None else None
+        completed = self._run(dao, deadline)
+        return {
+            "missions": len(self.edges),
+            "slots": len(self.slot_mission),
+            "filled": sum(agent is not None for agent in self.slot_agent),
+            "bids": self.bids,
+            "completed": completed,
+            "seconds": time.perf_counter() - started
+        }
+
+    def commit(self, dao) -> Dict[str, List[str]]:
+        """Assign every pending mission that won at least one agent; returns the assignments.
+        
+        Missions no longer CREATED and agents that reached capacity since the solve are skipped.
+        """
+        won: Dict[str, List[str]] = {}
+        for slot, agent in enumerate(self.slot_agent):
+            if agent is not None:
+                won.setdefault(self.slot_mission[slot], []).append(agent)
+        assigned: Dict[str, List[str]] = {}
+        for mission_id, agents in won.items():
+            mission = dao.missions.get(mission_id)
+            if mission is None or mission.status != MissionStatus.CREATED:
+                continue
+            agents = [a for a in agents if len(dao.agents[a].active_missions) < self.capacity]
+            if agents:
+                dao._assign(mission, agents)
+                assigned[mission_id] = agents
+        for agent in self.prices:
+            self.prices[agent] *= self.price_decay
+        self._reset()
+        return assigned
+
+    def _add_mission(self, dao, mission):
+        """Collect the mission's candidate edges and open its slots"""
+        agents = dao.agents
+        required = mission.required_capabilities
+        key = frozenset(required)
+        postings = self.index.shortest(required)
+        limit = self.capacity * self.oversubscription
+        candidates = []
+        cursor = self.cursors.get(key, 0)
+        overflow = self.overflow.setdefault(key, [])
+        advancing = True  # Leading postings ruled out for this requirement set are skipped for good
+        for position in range(cursor, len(postings)):
+            address = postings[position]
+            agent = agents[address]
+            if len(agent.active_missions) >= self.capacity or not agent.can_perform_mission(required):
+                if advancing:
+                    cursor = position + 1
+                continue
+            if self.demand.get(address, 0) >= limit:
+                if advancing:
+                    cursor = position + 1
+                    overflow.append(address)
+                continue
+            advancing = False
+            candidates.append((address, dao._agent_mission_score(agent, mission)))
+            self.demand[address] = self.demand.get(address, 0) + 1
+            if len(candidates) >= self.candidate_limit:
+                break
+        self.cursors[key] = cursor
+
+        # Scarce skills: let the mission contest agents already in demand (round-robin), so it
+        # still bids and the auction's prices decide who gets them
+        if len(candidates) < mission.max_agents and overflow:
+            chosen = {address for address, _ in candidates}
+            start = self.overflow_pos.get(key, 0)
+            for step in range(min(len(overflow), self.candidate_limit)):
+                address = overflow[(start + step) % len(overflow)]
+                if address not in chosen:
+                    candidates.append((address, dao._agent_mission_score(agents[address], mission)))
+            self.overflow_pos[key] = (start + self.candidate_limit) % len(overflow)
+
+        self.edges[mission.id] = candidates
+        self.mission_agents[mission.id] = set()
+        for _ in range(min(mission.max_agents, len(candidates))):
+            self.queue.append(len(self.slot_mission))
+            self.slot_mission.append(mission.id)
+            self.slot_agent.append(None)
+
+    def _run(self, dao, deadline: Optional[float]) -> bool:
+        """Process bids until every slot is placed or priced out; False if the budget ran out"""
+        prices = self.prices
+        epsilon = self.epsilon
+        while self.queue:
+            if deadline is not None and self.bids % 256 == 0 and time.perf_counter() > deadline:
+                return False
+            slot = self.queue.popleft()
+            mission_id = self.slot_mission[slot]
+            taken = self.mission_agents[mission_id]
+
+            best_agent, best_profit, second_profit = None, 0.0, 0.0  # Staying unassigned is worth 0
+            for agent, value in self.edges[mission_id]:
+                if agent in taken or agent in self.full:
+                    continue
+                profit = value - prices.get(agent, 0.0)
+                if profit > best_profit:
+                    best_agent, best_profit, second_profit = agent, profit, best_profit
+                elif profit > second_profit:
+                    second_profit = profit
+            if best_agent is None:
+                continue  # Priced out: the slot stays open
+
+            self.bids += 1
+            bid = prices.get(best_agent, 0.0) + best_profit - second_profit + epsilon
+            holders = self.holders.setdefault(best_agent, [])
+            heapq.heappush(holders, (bid, slot))
+            taken.add(best_agent)
+            self.slot_agent[slot] = best_agent
+
+            capacity = max(self.capacity - len(dao.agents[best_agent].active_missions), 0)
+            if capacity == 0:
+                self.full.add(best_agent)  # Filled up outside the auction: stop bidding for it
+            while len(holders) > capacity:
+                _, evicted = heapq.heappop(holders)
+                self.mission_agents[self.slot_mission[evicted]].discard(best_agent)
+                self.slot_agent[evicted] = None
+                self.queue.append(evicted)
+            if holders and len(holders) >= capacity:
+                prices[best_agent] = holders[0][0]
+        return True
+
+
+if __name__ == "__main__":
+    import random
+
+    from dao_simulation import DAOSimulation
+    from population import PopulationGenerator
+
+    print("🧩 Batch Mission Matching")
+    print("=" * 50)
+    random.seed(3)
+    num_agents, num_missions = 100000, 10000
+    dao = DAOSimulation()
+    PopulationGenerator(seed=3).populate_dao(dao, agents=num_agents, missions=num_missions)
+    pending = list(dao.missions)
+    matcher = AuctionMatcher()
+
+    stats = matcher.solve(dao, pending[:num_missions // 2])
+    print(f"First half: {stats['filled']:,}/{stats['slots']:,} slots, {stats['bids']:,} bids, "
+          f"{stats['seconds']:.2f}s")
+    stats = matcher.solve(dao, pending)
+    print(f"Re-solve with all {num_missions:,} missions: {stats['filled']:,}/{stats['slots']:,} slots, "
+          f"{stats['bids']:,} bids, {stats['seconds']:.2f}s")
+    assigned = matcher.commit(dao)
+    load = max(len(agent.active_missions) for agent in dao.agents.values())
+    print(f"Committed {len(assigned):,} missions; busiest agent holds {load} missions")
@@ -0,0 +1,203 @@
+"""
+Mission Scheduler with Priorities, Deadlines and Backpressure
+
+Keeps CREATED missions in a heap ordered by (deadline, -budget): the most
+urgent, then the best funded, is staffed first. Each dispatch expires missions
+whose deadline has passed (they fail), then walks the queue in priority order
+and staffs every mission for which enough idle qualified agents exist; the rest
+wait for agents to free up. When the agent pool is saturated and a backlog has
+built up, admit() refuses new missions: create_mission returns None and
+execute_proposal defers the proposal, which DAOSimulation.dispatch_missions
+executes once admit() passes again.
+
+Dispatch does not re-sort the agent pool. Per capability the scheduler keeps
+the idle agents ranked by reputation; DAOSimulation._assign/_release_agent
+call agent_changed, which files an agent in or out of those rankings, and only
+those agents are re-ranked. Staffing stops as soon as every agent is busy.
+
+Queue depth, wait times (simulated time from enqueue to assignment),
+assignments, expiries and rejections are exposed through metrics().
+"""
+
+import heapq
+import math
+from bisect import bisect_left, insort
+from collections import deque
+from datetime import datetime
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+from dao_simulation import MissionStatus
+
+
+class MissionScheduler:
+    """Priority queue of pending missions, dispatched as agents become idle"""
+
+    def __init__(self, max_queue_depth: int = 10000, saturation: float = 0.9,
+                 saturated_backlog: int = 10, candidates_per_slot: int = 4,
+                 wait_window: int = 1000):
+        self.max_queue_depth = max_queue_depth  # Hard cap on queued missions
+        self.saturation = saturation  # Share of busy agents at which the pool counts as saturated
+        self.saturated_backlog = saturated_backlog  # Queue depth tolerated while saturated
+        self.candidates_per_slot = candidates_per_slot  # Idle candidates scored per open slot
+
+        self._heap: List[Tuple[datetime, float, int, str]] = []
+        self._sequence = 0
+        self.enqueued_at: Dict[str, datetime] = {}
+        self.deferred_proposals: Dict[str, datetime] = {}  # Proposals refused by backpressure, oldest first
+
+        self.idle: Dict[str, List[Tuple[float, int, str]]] = {}  # Capability -> sorted (-reputation, slot, address)
+        self._rank_key: Dict[str, Tuple[float, int, str]] = {}  # Latest ranking key per agent
+        self._filed: Dict[str, Tuple[float, int, str]] = {}  # Idle agents -> key they are filed under
+        self._changed: Set[str] = set()  # Agents to re-rank at the next dispatch
+        self.indexed = 0  # Agents from DAOSimulation._agent_order already ranked
+
+        self.assigned = 0
+        self.expired = 0
+        self.rejected = 0
+        self.waits = deque(maxlen=wait_window)  # Recent wait times in seconds
+        self.total_wait = 0.0
+
+    def __len__(self) -> int:
+        return len(self.enqueued_at)
+
+    def enqueue(self, mission, now: datetime):
+        """Queue a CREATED mission"""
+        heapq.heappush(self._heap, (mission.deadline, -mission.budget, self._sequence, mission.id))
+        self._sequence += 1
+        self.enqueued_at[mission.id] = now
+
+    def admit(self, dao) -> bool:
+        """Whether a new mission may be queued (False applies backpressure)"""
+        if len(self) >= self.max_queue_depth:
+            return False
+        if dao.agents and dao.counters.agents_busy / len(dao.agents) >= self.saturation:
+            return len(self) < self.saturated_backlog
+        return True
+
+    def reject(self):
+        self.rejected += 1
+
+    def defer(self, proposal_id: str, now: datetime):
+        """Refuse a proposal's mission for now; it is retried by pop_deferred() order"""
+        self.rejected += 1
+        self.deferred_proposals.setdefault(proposal_id, now)
+
+    def pop_deferred(self) -> Optional[str]:
+        """The longest-deferred proposal, removed from the queue (None if empty)"""
+        if not self.deferred_proposals:
+            return None
+        proposal_id = next(iter(self.deferred_proposals))
+        del self.deferred_proposals[proposal_id]
+        return proposal_id
+
+    def agent_changed(self, agent):
+        """Note an agent whose load changed: idle sets now, ranking at the next dispatch"""
+        self._changed.add(agent.address)
+        if agent.address in self._rank_key:
+            self._mark(agent)
+
+    def dispatch(self, dao) -> Dict[str, List[str]]:
+        """Expire overdue missions, then staff queued missions in priority order"""
+        now = dao.current_time
+        self._refresh(dao)
+
+        # Overdue missions sit at the front of the deadline-ordered heap
+        while self._heap and self._heap[0][0] <= now:
+            mission_id = heapq.heappop(self._heap)[3]
+            mission = dao.missions.get(mission_id)
+            self.enqueued_at.pop(mission_id, None)
+            if mission is not None and mission.status == MissionStatus.CREATED:
+                dao._expire_mission(mission)
+                self.expired += 1
+
+        assigned: Dict[str, List[str]] = {}
+        deferred = []
+        unstaffable: Set[FrozenSet[str]] = set()  # Requirement sets no idle agent can cover
+        while self._heap and dao.counters.agents_busy < len(dao.agents):
+            entry = heapq.heappop(self._heap)
+            mission_id = entry[3]
+            mission = dao.missions.get(mission_id)
+            if mission is None or mission.status != MissionStatus.CREATED:
+                self.enqueued_at.pop(mission_id, None)  # Staffed or cancelled elsewhere
+                continue
+
+            requirement = frozenset(mission.required_capabilities)
+            agents = [] if requirement in unstaffable else self._idle_agents(dao, mission)
+            if not agents:
+                unstaffable.add(requirement)  # Agents only get busier during this dispatch
+                deferred.append(entry)  # Wait for qualified agents to free up
+                continue
+            dao._assign(mission, agents)
+            assigned[mission_id] = agents
+            wait = (now - self.enqueued_at.pop(mission_id)).total_seconds()
+            self.waits.append(wait)
+            self.total_wait += wait
+            self.assigned += 1
+
+        for entry in deferred:
+            heapq.heappush(self._heap, entry)
+        return assigned
+
+    def metrics(self, now: datetime) -> Dict:
+        """Queue depth and wait-time statistics (seconds of simulated time)"""
+        recent = sorted(self.waits)
+        oldest = min(self.enqueued_at.values(), default=None)
+        return {
+            "queue_depth": len(self),
+            "oldest_wait": (now - oldest).total_seconds() if oldest is not None else 0.0,
+            "mean_wait": self.total_wait / self.assigned if self.assigned else 0.0,
+            "p50_wait": recent[len(recent) // 2] if recent else 0.0,
+            "p95_wait": recent[min(len(recent) - 1, math.ceil(0.95 * len(recent)) - 1)] if recent else 0.0,
+            "assigned": self.assigned,
+            "expired": self.expired,
+            "rejected": self.rejected,
+            "deferred_proposals": len(self.deferred_proposals)
+        }
+
+    def _refresh(self, dao):
+        """Rank newly registered agents and re-rank those whose load changed"""
+        order = dao._agent_order
+        for slot in range(self.indexed, len(order)):
+            self._rank_key[order[slot]] = (0.0, slot, order[slot])
+            self._changed.add(order[slot])
+        self.indexed = len(order)
+
+        for address in self._changed:
+            agent = dao.agents[address]
+            self._rank_key[address] = (-agent.reputation, self._rank_key[address][1], address)
+            self._mark(agent)
+        self._changed.clear()
+
+    def _mark(self, agent):
+        """File an idle agent in the rankings of its capabilities, or take a busy one out"""
+        address = agent.address
+        key = self._rank_key[address]
+        filed = self._filed.get(address)
+        idle = not agent.active_missions
+        if filed is not None and (not idle or filed != key):
+            for capability in agent.capabilities:
+                ranked = self.idle[capability]
+                del ranked[bisect_left(ranked, filed)]
+            del self._filed[address]
+            filed = None
+        if idle and filed is None:
+            for capability in agent.capabilities:
+                insort(self.idle.setdefault(capability, []), key)
+            self._filed[address] = key
+
+    def _idle_agents(self, dao, mission) -> List[str]:
+        """Best idle qualified agents for a mission (empty if none are free)"""
+        required = mission.required_capabilities
+        if not required:
+            return []
+        ranked = min((self.idle.get(capability, []) for capability in required), key=len)
+        wanted = mission.max_agents * self.candidates_per_slot
+        candidates = []
+        for _, _, address in ranked:
+            agent = dao.agents[address]
+            if not agent.can_perform_mission(required):
+                continue
+            candidates.append((dao._agent_mission_score(agent, mission), address))
+            if len(candidates) >= wanted:
+                break
+        return [address for _, address in heapq.nlargest(mission.max_agents, candidates)]
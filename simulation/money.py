@@ -0,0 +1,158 @@
+"""
+Fixed-Point Money for the Economic Model
+
+Amounts are plain Python ints counted in wei-style smallest units (18 decimals,
+matching the Solidity uint256 token contracts). Integer addition and
+subtraction are exact, so conservation checks hold after any number of
+transfers. Floats are only used at the edges: parsing user-facing amounts and
+displaying balances. Mission.budget is such an edge: it stays a float in whole
+tokens and is converted once, with to_wei, when mission rewards are paid out.
+"""
+
+import math
+import random
+import time
+from typing import Dict, List, MutableMapping, Sequence, Union
+
+DECIMALS = 18
+WEI = 10 ** DECIMALS
+
+Wei = int  # Type alias for amounts in smallest units
+
+
+def to_wei(amount: Union[int, float, str]) -> Wei:
+    """Convert a decimal amount to smallest units, rounding half away from zero.
+
+    Floats are converted through their shortest decimal representation, so
+    to_wei(0.1) is exactly 10**17. Infinities and NaN raise ValueError.
+    """
+    if isinstance(amount, int):
+        return amount * WEI
+    if isinstance(amount, float) and not math.isfinite(amount):
+        raise ValueError(f"Cannot convert non-finite amount {amount!r} to wei")
+
+    text = repr(float(amount)) if isinstance(amount, float) else str(amount).strip()
+    negative = text.startswith('-')
+    text = text.lstrip('+-')
+    if text.lower() in ('inf', 'infinity', 'nan'):
+        raise ValueError(f"Cannot convert non-finite amount {amount!r} to wei")
+
+    mantissa, _, exponent = text.lower().partition('e')
+    whole, _, fraction = mantissa.partition('.')
+    digits = int((whole or '0') + fraction)
+    scale = int(exponent or 0) - len(fraction) + DECIMALS
+
+    if scale >= 0:
+        value = digits * 10 ** scale
+    else:
+        value, remainder = divmod(digits, 10 ** -scale)
+        if 2 * remainder >= 10 ** -scale:
+            value += 1
+    return -value if negative else value
+
+
+def from_wei(amount: Wei) -> float:
+    """Convert smallest units to a float for display (correctly rounded)"""
+    return amount / WEI
+
+
+def format_wei(amount: Wei, places: int = 2) -> str:
+    """Render an amount with a fixed number of decimal places, without going through float"""
+    negative = amount < 0
+    units, remainder = divmod(abs(amount), WEI)
+    fraction = str(remainder).rjust(DECIMALS, '0')[:places]
+    text = f"{units:,}" + (f".{fraction}" if places else "")
+    return f"-{text}" if negative else text
+
+
+def mul_div(amount: Wei, numerator: int, denominator: int) -> Wei:
+    """amount * numerator / denominator, rounded down"""
+    return amount * numerator // denominator
+
+
+def split_proportional(total: Wei, weights: Sequence[float]) -> List[Wei]:
+    """Split `total` by `weights` so the parts sum to exactly `total`.
+
+    Uses largest-remainder apportionment over integer-scaled weights.
+    """
+    int_weights = [round(w * 10 ** 12) for w in weights]
+    weight_sum = sum(int_weights)
+    if weight_sum <= 0:
+        return [0] * len(weights)
+
+    parts = []
+    remainders = []
+    for i, weight in enumerate(int_weights):
+        part, remainder = divmod(total * weight, weight_sum)
+        parts.append(part)
+        remainders.append((remainder, i))
+
+    shortfall = total - sum(parts)
+    for _, i in sorted(remainders, reverse=True)[:shortfall]:
+        parts[i] += 1
+    return parts
+
+
+def bulk_transfer(balances: MutableMapping[str, Wei], sources: Sequence[str],
+                  destinations: Sequence[str], amounts: Sequence[Wei]) -> bool:
+    """Apply many transfers atomically: all succeed, or none if any source would overdraw"""
+    debits: Dict[str, Wei] = {}
+    for source, amount in zip(sources, amounts):
+        if amount < 0:
+            return False
+        debits[source] = debits.get(source, 0) + amount
+
+    for source, debit in debits.items():
+        if balances.get(source, 0) < debit:
+            return False
+
+    for source, debit in debits.items():
+        balances[source] -= debit
+    for destination, amount in zip(destinations, amounts):
+        balances[destination] = balances.get(destination, 0) + amount
+    return True
+
+
+def benchmark_money_arithmetic(num_transfers: int = 1000000, seed: int = 42) -> Dict[str, float]:
+    """Compare float and fixed-point reward distribution for speed and conservation drift"""
+    rng = random.Random(seed)
+    rewards = [rng.uniform(0.01, 500.0) for _ in range(num_transfers)]
+    rewards_wei = [to_wei(r) for r in rewards]
+    recipients = [rng.randrange(1000) for _ in range(num_transfers)]
+
+    opening = 10 ** 9
+    started = time.perf_counter()
+    treasury = float(opening)
+    earnings = [0.0] * 1000
+    for agent, reward in zip(recipients, rewards):
+        treasury -= reward
+        earnings[agent] += reward
+    float_seconds = time.perf_counter() - started
+    float_drift = abs((treasury + sum(earnings)) - opening)
+
+    started = time.perf_counter()
+    treasury_wei = opening * WEI
+    earnings_wei = [0] * 1000
+    for agent, reward in zip(recipients, rewards_wei):
+        treasury_wei -= reward
+        earnings_wei[agent] += reward
+    int_seconds = time.perf_counter() - started
+    int_drift = from_wei(abs((treasury_wei + sum(earnings_wei)) - opening * WEI))
+
+    return {
+        "transfers": num_transfers,
+        "float_seconds": float_seconds,
+        "fixed_point_seconds": int_seconds,
+        "float_conservation_drift": float_drift,
+        "fixed_point_conservation_drift": int_drift
+    }
+
+
+if __name__ == "__main__":
+    print("💱 Fixed-Point vs Float Money Benchmark")
+    print("=" * 50)
+    result = benchmark_money_arithmetic()
+    print(f"Transfers: {result['transfers']:,}")
+    print(f"Float path: {result['float_seconds']:.3f}s, drift {result['float_conservation_drift']:.3e}")
+    print(f"Fixed-point path: {result['fixed_point_seconds']:.3f}s, "
+          f"drift {result['fixed_point_conservation_drift']:.3e}")
@@ -0,0 +1,172 @@
+"""
+Weighted Oracle Consensus
+
+Incremental, reputation-weighted consensus over many oracle reports. Each
+report is folded into running weighted sums as it arrives; scored reports
+that sit far from the median (by median absolute deviation) are excluded
+before the final decision, so a fan-out may only stop early on reports whose
+inclusion no later score can change. Oracle accuracy is scored leave-one-out:
+each oracle is compared with the consensus of the other oracles, so its own
+vote cannot make it look accurate.
+"""
+
+from bisect import insort
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+
+@dataclass
+class OracleReport:
+    """A single oracle's verdict on a mission"""
+    oracle_id: str
+    verified: bool
+    confidence: float
+    weight: float
+    score: Optional[float] = None
+
+
+class OracleAccuracyTracker:
+    """Tracks how often each oracle agrees with the consensus of the other oracles"""
+
+    def __init__(self, prior_agreements: float = 1.0, prior_disagreements: float = 1.0,
+                 min_weight: float = 0.05):
+        self.prior_agreements = prior_agreements
+        self.prior_disagreements = prior_disagreements
+        self.min_weight = min_weight
+        self.agreements: Dict[str, float] = {}
+        self.observations: Dict[str, float] = {}
+
+    def weight(self, oracle_id: str) -> float:
+        """Consensus weight for an oracle: its smoothed historical accuracy"""
+        agreed = self.agreements.get(oracle_id, 0.0) + self.prior_agreements
+        seen = self.observations.get(oracle_id, 0.0) + self.prior_agreements + self.prior_disagreements
+        return max(self.min_weight, agreed / seen)
+
+    def record(self, oracle_id: str, agreed: bool):
+        """Record whether an oracle's verdict matched the outcome reached without it"""
+        self.observations[oracle_id] = self.observations.get(oracle_id, 0.0) + 1.0
+        if agreed:
+            self.agreements[oracle_id] = self.agreements.get(oracle_id, 0.0) + 1.0
+
+    def get_accuracy(self) -> Dict[str, float]:
+        """Get the current weight of every oracle seen so far"""
+        return {oracle_id: self.weight(oracle_id) for oracle_id in self.observations}
+
+
+class StreamingConsensus:
+    """Weighted consensus for one mission, updated as each oracle report arrives"""
+
+    def __init__(self, threshold: float = 0.7, outlier_cutoff: float = 3.5,
+                 min_reports_for_outliers: int = 3):
+        self.threshold = threshold
+        self.outlier_cutoff = outlier_cutoff  # Modified z-score beyond which a score is an outlier
+        self.min_reports_for_outliers = min_reports_for_outliers
+
+        self.reports: List[OracleReport] = []
+        self.weight_total = 0.0
+        self.weight_verified = 0.0
+        self.weighted_confidence = 0.0
+        self._sorted_scores: List[float] = []
+
+    def add(self, report: OracleReport):
+        """Fold a report into the running weighted sums"""
+        self.reports.append(report)
+        self.weight_total += report.weight
+        self.weighted_confidence += report.weight * report.confidence
+        if report.verified:
+            self.weight_verified += report.weight
+        if report.score is not None:
+            insort(self._sorted_scores, report.score)
+
+    def outliers(self) -> List[OracleReport]:
+        """Reports whose score deviates from the median by more than the MAD cutoff"""
+        scores = self._sorted_scores
+        if len(scores) < self.min_reports_for_outliers:
+            return []
+
+        median = _median(scores)
+        mad = _median(sorted(abs(score - median) for score in scores))
+        if mad == 0:
+            return []
+
+        # 0.6745 scales MAD to the standard deviation of a normal distribution
+        return [r for r in self.reports
+                if r.score is not None and
+                abs(0.6745 * (r.score - median) / mad) > self.outlier_cutoff]
+
+    def is_settled(self, outstanding_weight: float, outstanding_reports: Optional[int] = None) -> bool:
+        """Check whether the outcome holds however the outstanding oracles answer.
+
+        Outlier exclusion is not monotone: later scores move the median and MAD,
+        so a report excluded now may count again and an included one may drop
+        out. Unless too few reports remain for outlier rejection ever to apply,
+        scored reports are treated like outstanding ones, able to count for
+        either side or not at all.
+        """
+        scored = [r for r in self.reports if r.score is not None]
+        if outstanding_reports is not None and \
+                len(scored) + outstanding_reports < self.min_reports_for_outliers:
+            scored = []
+        weight, verified, confidence = self._totals(scored)
+        uncertain = outstanding_weight + sum(r.weight for r in scored)
+        total = weight + uncertain
+        if total <= 0:
+            return False
+
+        # Approved even if every uncertain report rejects with zero confidence
+        if verified / total >= self.threshold and confidence / total >= self.threshold:
+            return True
+
+        # Rejected even if every uncertain report verifies with full confidence
+        return ((verified + uncertain) / total < self.threshold or
+                (confidence + uncertain) / total < self.threshold)
+
+    def result(self) -> Dict:
+        """Get the weighted consensus over the non-outlier reports"""
+        outliers = self.outliers()
+        weight, verified, confidence = self._totals(outliers)
+        if weight <= 0:
+            return {"consensus": False, "confidence": 0.0, "consensus_ratio": 0.0,
+                    "outliers": [r.oracle_id for r in outliers]}
+
+        avg_confidence = confidence / weight
+        consensus_ratio = verified / weight
+        return {
+            "consensus": self._decide(weight, verified, confidence),
+            "confidence": avg_confidence,
+            "consensus_ratio": consensus_ratio,
+            "outliers": [r.oracle_id for r in outliers]
+        }
+
+    def verdict_without(self, report: OracleReport,
+                        outliers: Optional[List[OracleReport]] = None) -> Optional[bool]:
+        """Consensus over the other non-outlier reports (None if they carry no weight)"""
+        outliers = self.outliers() if outliers is None else outliers
+        excluded = outliers if any(r is report for r in outliers) else outliers + [report]
+        weight, verified, confidence = self._totals(excluded)
+        if weight <= 0:
+            return None
+        return self._decide(weight, verified, confidence)
+
+    def _decide(self, weight: float, verified: float, confidence: float) -> bool:
+        return verified / weight >= self.threshold and confidence / weight >= self.threshold
+
+    def _totals(self, excluded: List[OracleReport]) -> Tuple[float, float, float]:
+        """Running sums with the excluded reports' contributions removed"""
+        weight = self.weight_total
+        verified = self.weight_verified
+        confidence = self.weighted_confidence
+        for report in excluded:
+            weight -= report.weight
+            confidence -= report.weight * report.confidence
+            if report.verified:
+                verified -= report.weight
+        return weight, verified, confidence
+
+
+def _median(sorted_values: List[float]) -> float:
+    """Median of an already sorted list"""
+    middle = len(sorted_values) // 2
+    if len(sorted_values) % 2:
+        return sorted_values[middle]
+    return (sorted_values[middle - 1] + sorted_values[middle]) / 2
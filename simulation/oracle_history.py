@@ -0,0 +1,178 @@
+"""
+Bounded Time-Series Storage for Oracle Observations
+
+Oracle observations (prices, verification scores, reputation readings) are kept
+in fixed-capacity ring buffers of array-backed columns so long-running
+simulations use constant memory, while window queries stay cheap.
+"""
+
+import math
+import time
+from array import array
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+@dataclass
+class RetentionPolicy:
+    """Limits on how much history a series keeps"""
+    capacity: int = 10000  # Maximum number of observations
+    max_age: Optional[float] = 86400.0  # Seconds; None keeps everything that fits
+
+
+class ObservationSeries:
+    """Ring buffer of (timestamp, value, confidence, volume) observations"""
+
+    def __init__(self, policy: Optional[RetentionPolicy] = None):
+        self.policy = policy or RetentionPolicy()
+        capacity = self.policy.capacity
+        self.timestamps = array('d', bytes(8 * capacity))
+        self.values = array('d', bytes(8 * capacity))
+        self.confidences = array('d', bytes(8 * capacity))
+        self.volumes = array('d', bytes(8 * capacity))
+        self._start = 0  # Physical index of the oldest observation
+        self._size = 0
+        self.dropped = 0  # Observations discarded by the retention policy
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, timestamp: float, value: float, confidence: float = 1.0, volume: float = 0.0):
+        """Record an observation; timestamps are expected in non-decreasing order"""
+        capacity = self.policy.capacity
+        if self._size == capacity:
+            pos = self._start
+            self._start = (self._start + 1) % capacity
+            self.dropped += 1
+        else:
+            pos = (self._start + self._size) % capacity
+            self._size += 1
+
+        self.timestamps[pos] = timestamp
+        self.values[pos] = value
+        self.confidences[pos] = confidence
+        self.volumes[pos] = volume
+
+        if self.policy.max_age is not None:
+            self.apply_retention(timestamp)
+
+    def apply_retention(self, now: Optional[float] = None):
+        """Drop observations older than the policy's max_age"""
+        if self.policy.max_age is None or not self._size:
+            return
+        now = time.time() if now is None else now
+        expired = self._bisect(now - self.policy.max_age)
+        if expired:
+            self._start = (self._start + expired) % self.policy.capacity
+            self._size -= expired
+            self.dropped += expired
+
+    def latest(self) -> Optional[Tuple[float, float, float, float]]:
+        """Get the most recent observation"""
+        if not self._size:
+            return None
+        pos = (self._start + self._size - 1) % self.policy.capacity
+        return (self.timestamps[pos], self.values[pos], self.confidences[pos], self.volumes[pos])
+
+    def window(self, since: float) -> Iterator[Tuple[float, float, float, float]]:
+        """Iterate observations with timestamp >= since, oldest first"""
+        for column_slices in zip(*(self._slices(column, since) for column in
+                                   (self.timestamps, self.values, self.confidences, self.volumes))):
+            yield from zip(*column_slices)
+
+    def rolling_mean(self, seconds: float, now: Optional[float] = None) -> Optional[float]:
+        """Mean value over the last `seconds`"""
+        now = time.time() if now is None else now
+        values = self._slices(self.values, now - seconds)
+        count = sum(len(part) for part in values)
+        if not count:
+            return None
+        return math.fsum(math.fsum(part) for part in values) / count
+
+    def vwap(self, seconds: float, now: Optional[float] = None) -> Optional[float]:
+        """Volume-weighted average value over the last `seconds`"""
+        now = time.time() if now is None else now
+        since = now - seconds
+        volume = 0.0
+        notional = 0.0
+        for values, volumes in zip(self._slices(self.values, since), self._slices(self.volumes, since)):
+            volume += math.fsum(volumes)
+            notional += math.fsum(map(float.__mul__, values, volumes))
+        return notional / volume if volume > 0 else None
+
+    def downsample(self, bucket_seconds: float, since: float = float('-inf')) -> "ObservationSeries":
+        """Aggregate into fixed-width buckets (mean value/confidence, summed volume)"""
+        buckets: List[Tuple[float, float, float, float]] = []
+        bucket = None
+        count = value_sum = confidence_sum = volume_sum = 0.0
+
+        for timestamp, value, confidence, volume in self.window(since):
+            key = math.floor(timestamp / bucket_seconds) * bucket_seconds
+            if key != bucket:
+                if count:
+                    buckets.append((bucket, value_sum / count, confidence_sum / count, volume_sum))
+                bucket = key
+                count = value_sum = confidence_sum = volume_sum = 0.0
+            count += 1
+            value_sum += value
+            confidence_sum += confidence
+            volume_sum += volume
+        if count:
+            buckets.append((bucket, value_sum / count, confidence_sum / count, volume_sum))
+
+        rollup = ObservationSeries(RetentionPolicy(capacity=max(1, len(buckets)), max_age=None))
+        for row in buckets:
+            rollup.append(*row)
+        return rollup
+
+    def _bisect(self, since: float) -> int:
+        """Count of observations (oldest first) with timestamp < since"""
+        low, high = 0, self._size
+        capacity = self.policy.capacity
+        while low < high:
+            mid = (low + high) // 2
+            if self.timestamps[(self._start + mid) % capacity] < since:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    def _slices(self, column: array, since: float) -> List[array]:
+        """Contiguous column slices covering observations with timestamp >= since"""
+        first = self._bisect(since)
+        if first >= self._size:
+            return []
+        capacity = self.policy.capacity
+        begin = (self._start + first) % capacity
+        end = begin + (self._size - first)
+        if end <= capacity:
+            return [column[begin:end]]
+        return [column[begin:], column[:end - capacity]]
+
+
+class ObservationStore:
+    """Collection of observation series keyed by metric name"""
+
+    def __init__(self, policy: Optional[RetentionPolicy] = None):
+        self.policy = policy or RetentionPolicy()
+        self.series: Dict[str, ObservationSeries] = {}
+
+    def __len__(self) -> int:
+        return sum(len(series) for series in self.series.values())
+
+    def record(self, key: str, timestamp: float, value: float,
+               confidence: float = 1.0, volume: float = 0.0):
+        """Append an observation to the series for `key`"""
+        series = self.series.get(key)
+        if series is None:
+            series = self.series[key] = ObservationSeries(self.policy)
+        series.append(timestamp, value, confidence, volume)
+
+    def get(self, key: str) -> Optional[ObservationSeries]:
+        """Get the series for `key`, if any observations were recorded"""
+        return self.series.get(key)
+
+    def apply_retention(self, now: Optional[float] = None):
+        """Apply the age limit to every series"""
+        for series in self.series.values():
+            series.apply_retention(now)
@@ -7,11 +7,20 @@ and real-world integration for the DAO system.
 
 import random
 import json
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from functools import partial
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from enum import Enum
 from dataclasses import dataclass
 
+from oracle_consensus import OracleAccuracyTracker, OracleReport, StreamingConsensus
+from oracle_history import ObservationStore, RetentionPolicy
+from profiling import profiled, traced
+
 
 class OracleType(Enum):
     PERFORMANCE_VERIFICATION = "performance_verification"
@@ -41,24 +50,229 @@ class OracleData:
     verification_status: VerificationStatus = VerificationStatus.PENDING
 
 
+# Seconds a cached result stays fresh, per oracle type
+DEFAULT_ORACLE_TTLS = {
+    OracleType.MARKET_DATA: 5.0,
+    OracleType.REPUTATION_FEED: 300.0,
+    OracleType.EXTERNAL_API: 60.0,
+    OracleType.IOT_SENSOR: 1.0,
+}
+
+
+class OracleCache:
+    """LRU cache of oracle results with per-oracle-type TTLs and stale-while-revalidate"""
+    
+    def __init__(self, max_entries: int = 10000, default_ttl: float = 30.0,
+                 ttls: Optional[Dict[OracleType, float]] = None, stale_ttl: float = 30.0,
+                 refresh_workers: int = 2, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.ttls = {**DEFAULT_ORACLE_TTLS, **(ttls or {})}
+        self.stale_ttl = stale_ttl  # Extra window in which a stale result is served while refreshing
+        self.refresh_workers = refresh_workers
+        self.clock = clock
+        
+        self._entries: "OrderedDict[Tuple, Tuple[OracleData, float]]" = OrderedDict()
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self._executor = None
+        
+        # Counters for sizing the cache against upstream cost
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.evictions = 0
+    
+    def get_or_fetch(self, oracle_id: str, method: str, args: Tuple, oracle_type: OracleType,
+                     fetch: Callable[[], OracleData]) -> OracleData:
+        """Return a cached oracle result, fetching or revalidating it as needed"""
+        key = (oracle_id, method, args)
+        now = self.clock()
+        ttl = self.ttls.get(oracle_type, self.default_ttl)
+        
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, stored_at = entry
+                age = now - stored_at
+                if age <= ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                if age <= ttl + self.stale_ttl:
+                    self._entries.move_to_end(key)
+                    self.stale_hits += 1
+                    if key not in self._refreshing:
+                        self._refreshing.add(key)
+                        self._get_executor().submit(self._refresh, key, fetch)
+                    return value
+            self.misses += 1
+        
+        value = fetch()
+        self._store(key, value)
+        return value
+    
+    def invalidate(self, oracle_id: Optional[str] = None):
+        """Drop cached results, optionally only those of one oracle"""
+        with self._lock:
+            if oracle_id is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if k[0] == oracle_id]:
+                    del self._entries[key]
+    
+    def get_stats(self) -> Dict:
+        """Get hit/miss counters and current occupancy"""
+        with self._lock:
+            lookups = self.hits + self.stale_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "refreshes": self.refreshes,
+                "evictions": self.evictions,
+                "hit_ratio": (self.hits + self.stale_hits) / lookups if lookups else 0.0
+            }
+    
+    def shutdown(self):
+        """Release the background refresh pool"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+    
+    def _store(self, key: Tuple, value: OracleData, refreshed: bool = False):
+        """Insert a result, evicting the least recently used entries beyond capacity"""
+        with self._lock:
+            if refreshed:
+                self.refreshes += 1
+            self._entries[key] = (value, self.clock())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def _refresh(self, key: Tuple, fetch: Callable[[], OracleData]):
+        """Revalidate a stale entry in the background"""
+        try:
+            self._store(key, fetch(), refreshed=True)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Lazily create the background refresh pool"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.refresh_workers,
+                                                thread_name_prefix="oracle_cache")
+        return self._executor
+
+
 class MissionVerificationOracle:
     """Oracle for verifying mission completion and quality"""
     
-    def __init__(self, oracle_id: str):
+    verification_role = "automated"  # Consulted by OracleAggregator.get_consensus_verification
+    
+    def __init__(self, oracle_id: str, max_workers: int = 5, history_limit: int = 1000,
+                 retention: Optional[RetentionPolicy] = None):
         self.oracle_id = oracle_id
-        self.verification_history = []
+        self.verification_history = deque(maxlen=history_limit)  # Most recent full reports
+        self.score_history = ObservationStore(retention)  # Overall scores per verification type
+        self.max_workers = max_workers  # 1 runs the check probes sequentially
+        self._executor = None
+    
+    def _run_checks(self, probes: Dict[Any, Tuple[Callable, Any]]) -> Dict[Any, float]:
+        """Run independent check probes, concurrently when a worker pool is configured"""
+        if self.max_workers <= 1:
+            return {name: probe(arg) for name, (probe, arg) in probes.items()}
+        
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                thread_name_prefix=self.oracle_id)
+        futures = {name: self._executor.submit(probe, arg) for name, (probe, arg) in probes.items()}
+        return {name: future.result() for name, future in futures.items()}
+    
+    def shutdown(self):
+        """Release the check worker pool"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+    
+    # (check name, probe method, deliverable field) for each verification type
+    WEB_DEVELOPMENT_CHECKS = (
+        ("website_accessible", "_check_website_accessibility", "url"),
+        ("responsive_design", "_check_responsive_design", "url"),
+        ("performance_score", "_check_performance_metrics", "url"),
+        ("security_scan", "_check_security_vulnerabilities", "url"),
+        ("code_quality", "_check_code_quality", "repository")
+    )
+    DATA_ANALYSIS_CHECKS = (
+        ("data_accuracy", "_validate_data_accuracy", "dataset"),
+        ("analysis_methodology", "_check_analysis_methods", "methodology"),
+        ("visualization_quality", "_assess_visualizations", "charts"),
+        ("insights_relevance", "_evaluate_insights", "insights"),
+        ("reproducibility", "_check_reproducibility", "code")
+    )
+    
+    def verification_call(self, mission_id: str, deliverables: Dict,
+                          mission_type: str) -> Optional[Callable[[], OracleData]]:
+        """Deferred verification of a mission, or None for unsupported mission types"""
+        verify = {
+            "web_development": self.verify_web_development_mission,
+            "data_analysis": self.verify_data_analysis_mission
+        }.get(mission_type)
+        return partial(verify, mission_id, deliverables) if verify is not None else None
     
     def verify_web_development_mission(self, mission_id: str, deliverables: Dict) -> OracleData:
         """Verify a web development mission completion"""
         
         # Simulate checking deliverables
-        checks = {
-            "website_accessible": self._check_website_accessibility(deliverables.get("url")),
-            "responsive_design": self._check_responsive_design(deliverables.get("url")),
-            "performance_score": self._check_performance_metrics(deliverables.get("url")),
-            "security_scan": self._check_security_vulnerabilities(deliverables.get("url")),
-            "code_quality": self._check_code_quality(deliverables.get("repository"))
-        }
+        checks = self._run_checks(self._plan_checks(self.WEB_DEVELOPMENT_CHECKS, deliverables))
+        return self._web_development_report(mission_id, deliverables, checks)
+    
+    def verify_data_analysis_mission(self, mission_id: str, deliverables: Dict) -> OracleData:
+        """Verify a data analysis mission completion"""
+        
+        checks = self._run_checks(self._plan_checks(self.DATA_ANALYSIS_CHECKS, deliverables))
+        return self._data_analysis_report(mission_id, deliverables, checks)
+    
+    def verify_web_development_missions(self, missions: List[Tuple[str, Dict]]) -> List[OracleData]:
+        """Verify many web development missions, running each distinct check once"""
+        return self._verify_batch(missions, self.WEB_DEVELOPMENT_CHECKS, self._web_development_report)
+    
+    def verify_data_analysis_missions(self, missions: List[Tuple[str, Dict]]) -> List[OracleData]:
+        """Verify many data analysis missions, running each distinct check once"""
+        return self._verify_batch(missions, self.DATA_ANALYSIS_CHECKS, self._data_analysis_report)
+    
+    def _plan_checks(self, check_specs: Tuple, deliverables: Dict) -> Dict[str, Tuple[Callable, Any]]:
+        """Map each check name to its probe and the deliverable it inspects"""
+        return {name: (getattr(self, probe), deliverables.get(field))
+                for name, probe, field in check_specs}
+    
+    def _verify_batch(self, missions: List[Tuple[str, Dict]], check_specs: Tuple,
+                      build_report: Callable[[str, Dict, Dict], OracleData]) -> List[OracleData]:
+        """Run the deduplicated checks of a batch on the worker pool, then build each report"""
+        jobs = {}  # (probe, deliverable) -> probe call shared by every mission that needs it
+        plans = []
+        for mission_id, deliverables in missions:
+            plan = {}
+            for name, probe, field in check_specs:
+                value = deliverables.get(field)
+                key = (probe, _deliverable_key(value))
+                if key not in jobs:
+                    jobs[key] = (getattr(self, probe), value)
+                plan[name] = key
+            plans.append(plan)
+        
+        results = self._run_checks(jobs)
+        return [
+            build_report(mission_id, deliverables, {name: results[key] for name, key in plan.items()})
+            for (mission_id, deliverables), plan in zip(missions, plans)
+        ]
+    
+    def _web_development_report(self, mission_id: str, deliverables: Dict, checks: Dict) -> OracleData:
+        """Score web development checks and record the verification"""
         
         # Calculate overall score
         scores = [score for score in checks.values() if isinstance(score, (int, float))]
@@ -80,19 +294,11 @@ class MissionVerificationOracle:
             verification_status=VerificationStatus.VERIFIED if overall_score > 0.7 else VerificationStatus.FAILED
         )
         
-        self.verification_history.append(verification_data)
+        self._record_verification(verification_data)
         return verification_data
     
-    def verify_data_analysis_mission(self, mission_id: str, deliverables: Dict) -> OracleData:
-        """Verify a data analysis mission completion"""
-        
-        checks = {
-            "data_accuracy": self._validate_data_accuracy(deliverables.get("dataset")),
-            "analysis_methodology": self._check_analysis_methods(deliverables.get("methodology")),
-            "visualization_quality": self._assess_visualizations(deliverables.get("charts")),
-            "insights_relevance": self._evaluate_insights(deliverables.get("insights")),
-            "reproducibility": self._check_reproducibility(deliverables.get("code"))
-        }
+    def _data_analysis_report(self, mission_id: str, deliverables: Dict, checks: Dict) -> OracleData:
+        """Score data analysis checks and record the verification"""
         
         overall_score = sum(checks.values()) / len(checks)
         
@@ -112,9 +318,17 @@ class MissionVerificationOracle:
             verification_status=VerificationStatus.VERIFIED if overall_score > 0.75 else VerificationStatus.FAILED
         )
         
-        self.verification_history.append(verification_data)
+        self._record_verification(verification_data)
         return verification_data
     
+    def _record_verification(self, verification_data: OracleData):
+        """Keep the report and its score in the bounded history stores"""
+        self.verification_history.append(verification_data)
+        self.score_history.record(verification_data.data["verification_type"],
+                                  verification_data.timestamp.timestamp(),
+                                  verification_data.data["overall_score"],
+                                  verification_data.confidence_score)
+    
     def _check_website_accessibility(self, url: str) -> float:
         """Simulate website accessibility check"""
         return random.uniform(0.7, 1.0)
@@ -156,15 +370,41 @@ class MissionVerificationOracle:
         return random.uniform(0.7, 1.0)
 
 
+def _deliverable_key(value: Any) -> Any:
+    """Hashable identity of a deliverable (URL, repository, dataset, chart list...)"""
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return json.dumps(value, sort_keys=True, default=str)
+
+
 class MarketDataOracle:
     """Oracle for providing market and economic data"""
     
-    def __init__(self, oracle_id: str):
+    def __init__(self, oracle_id: str, cache: Optional[OracleCache] = None,
+                 retention: Optional[RetentionPolicy] = None):
         self.oracle_id = oracle_id
-        self.price_history = []
+        self.price_history = ObservationStore(retention)  # Price series per token symbol
+        self.cache = cache
     
     def get_token_price(self, token_symbol: str) -> OracleData:
         """Get current token price"""
+        if self.cache is not None:
+            return self.cache.get_or_fetch(self.oracle_id, "get_token_price", (token_symbol,),
+                                           OracleType.MARKET_DATA,
+                                           partial(self._fetch_token_price, token_symbol))
+        return self._fetch_token_price(token_symbol)
+    
+    def get_market_sentiment(self) -> OracleData:
+        """Get overall market sentiment"""
+        if self.cache is not None:
+            return self.cache.get_or_fetch(self.oracle_id, "get_market_sentiment", (),
+                                           OracleType.MARKET_DATA, self._fetch_market_sentiment)
+        return self._fetch_market_sentiment()
+    
+    def _fetch_token_price(self, token_symbol: str) -> OracleData:
+        """Query the upstream exchange for a token price"""
         # Simulate price data
         base_price = {"DAO": 10.0, "ETH": 2000.0, "BTC": 45000.0}.get(token_symbol, 1.0)
         current_price = base_price * random.uniform(0.95, 1.05)
@@ -183,11 +423,22 @@ class MarketDataOracle:
             source="crypto_exchange_api"
         )
         
-        self.price_history.append(price_data)
+        self.price_history.record(token_symbol, price_data.timestamp.timestamp(), current_price,
+                                  price_data.confidence_score, price_data.data["volume_24h"])
         return price_data
     
-    def get_market_sentiment(self) -> OracleData:
-        """Get overall market sentiment"""
+    def get_rolling_price(self, token_symbol: str, minutes: float = 60.0) -> Optional[float]:
+        """Get the mean observed price over the last N minutes"""
+        series = self.price_history.get(token_symbol)
+        return series.rolling_mean(minutes * 60) if series else None
+    
+    def get_vwap(self, token_symbol: str, minutes: float = 60.0) -> Optional[float]:
+        """Get the volume-weighted average observed price over the last N minutes"""
+        series = self.price_history.get(token_symbol)
+        return series.vwap(minutes * 60) if series else None
+    
+    def _fetch_market_sentiment(self) -> OracleData:
+        """Query the upstream sentiment feed"""
         sentiment_score = random.uniform(-1.0, 1.0)  # -1 (bearish) to 1 (bullish)
         
         return OracleData(
@@ -207,10 +458,17 @@ class MarketDataOracle:
 class HumanValidationOracle:
     """Oracle for human expert validation of complex tasks"""
     
+    verification_role = "human"  # Consulted alongside automated verifiers
+    
     def __init__(self, oracle_id: str):
         self.oracle_id = oracle_id
         self.validators = ["expert_1", "expert_2", "expert_3"]
     
+    def verification_call(self, mission_id: str, deliverables: Dict,
+                          mission_type: str) -> Optional[Callable[[], OracleData]]:
+        """Deferred human validation of a mission"""
+        return partial(self.request_human_validation, mission_id, deliverables, mission_type)
+    
     def request_human_validation(self, mission_id: str, deliverables: Dict, 
                                validation_type: str) -> OracleData:
         """Request human expert validation"""
@@ -250,11 +508,20 @@ class HumanValidationOracle:
 class ReputationOracle:
     """Oracle for external reputation and credibility data"""
     
-    def __init__(self, oracle_id: str):
+    def __init__(self, oracle_id: str, cache: Optional[OracleCache] = None):
         self.oracle_id = oracle_id
+        self.cache = cache
     
     def get_external_reputation(self, agent_address: str) -> OracleData:
         """Get agent reputation from external sources"""
+        if self.cache is not None:
+            return self.cache.get_or_fetch(self.oracle_id, "get_external_reputation", (agent_address,),
+                                           OracleType.REPUTATION_FEED,
+                                           partial(self._fetch_external_reputation, agent_address))
+        return self._fetch_external_reputation(agent_address)
+    
+    def _fetch_external_reputation(self, agent_address: str) -> OracleData:
+        """Query the external reputation sources"""
         
         # Simulate external reputation sources
         sources = {
@@ -284,62 +551,155 @@ class ReputationOracle:
 class OracleAggregator:
     """Aggregates data from multiple oracles for consensus"""
     
-    def __init__(self):
+    def __init__(self, max_workers: int = 8, default_timeout: float = 10.0,
+                 accuracy: Optional[OracleAccuracyTracker] = None):
         self.oracles = {}
         self.consensus_threshold = 0.7
-    
-    def register_oracle(self, oracle_id: str, oracle_instance):
-        """Register an oracle with the aggregator"""
+        self.default_timeout = default_timeout  # Seconds to wait for each oracle
+        self.oracle_timeouts: Dict[str, float] = {}
+        self.accuracy = accuracy or OracleAccuracyTracker()  # Historical accuracy drives weights
+        self.learn_from_consensus = True
+        self.max_workers = max_workers  # Shared pool; also holds oracle calls that outlived their timeout
+        self._executor = None
+    
+    def register_oracle(self, oracle_id: str, oracle_instance, timeout: Optional[float] = None):
+        """Register an oracle with the aggregator.
+        
+        Oracles with a verification_role ("automated" or "human") and a
+        verification_call(mission_id, deliverables, mission_type) method take
+        part in get_consensus_verification.
+        """
         self.oracles[oracle_id] = oracle_instance
+        if timeout is not None:
+            self.oracle_timeouts[oracle_id] = timeout
     
+    def shutdown(self):
+        """Release the oracle worker pool"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+    
+    @profiled("oracle.consensus")
     def get_consensus_verification(self, mission_id: str, deliverables: Dict, 
                                  mission_type: str) -> Dict:
         """Get consensus verification from multiple oracles"""
         
-        verifications = []
-        
-        # Get verifications from relevant oracles
-        if "verification" in self.oracles:
-            if mission_type == "web_development":
-                verification = self.oracles["verification"].verify_web_development_mission(
-                    mission_id, deliverables
-                )
-            elif mission_type == "data_analysis":
-                verification = self.oracles["verification"].verify_data_analysis_mission(
-                    mission_id, deliverables
-                )
-            else:
-                verification = None
-            
-            if verification:
-                verifications.append(verification)
+        # Any oracle declaring a verification_role takes part: automated verifiers for the
+        # mission types they support, human validators alongside (not after) them
+        automated, human = {}, {}
+        for oracle_id, oracle in self.oracles.items():
+            role = getattr(oracle, "verification_role", None)
+            if role is None:
+                continue
+            call = oracle.verification_call(mission_id, deliverables, mission_type)
+            if call is not None:
+                (human if role == "human" else automated)[oracle_id] = call
+        calls = {**automated, **human} if automated else {}
         
-        # Get human validation for complex tasks
-        if "human_validation" in self.oracles and len(verifications) > 0:
-            human_verification = self.oracles["human_validation"].request_human_validation(
-                mission_id, deliverables, mission_type
-            )
-            verifications.append(human_verification)
+        consensus = StreamingConsensus(threshold=self.consensus_threshold)
+        verifications, timed_out, failed, early_exit = self._fan_out(calls, consensus)
         
         # Calculate consensus
         if not verifications:
-            return {"consensus": False, "confidence": 0.0, "verifications": []}
-        
-        avg_confidence = sum(v.confidence_score for v in verifications) / len(verifications)
-        verified_count = sum(1 for v in verifications 
-                           if v.verification_status == VerificationStatus.VERIFIED)
-        consensus_ratio = verified_count / len(verifications)
+            return {"consensus": False, "confidence": 0.0, "verifications": [],
+                    "timed_out": timed_out, "failed": failed}
         
-        consensus_reached = (consensus_ratio >= self.consensus_threshold and 
-                           avg_confidence >= self.consensus_threshold)
+        result = consensus.result()
+        if self.learn_from_consensus:
+            outliers = consensus.outliers()
+            for report in consensus.reports:
+                verdict = consensus.verdict_without(report, outliers)
+                if verdict is not None:
+                    self.accuracy.record(report.oracle_id, report.verified == verdict)
         
         return {
-            "consensus": consensus_reached,
-            "confidence": avg_confidence,
-            "consensus_ratio": consensus_ratio,
+            "consensus": result["consensus"],
+            "confidence": result["confidence"],
+            "consensus_ratio": result["consensus_ratio"],
             "verifications": [v.data for v in verifications],
-            "recommendation": "approve" if consensus_reached else "reject"
+            "recommendation": "approve" if result["consensus"] else "reject",
+            "weights": {r.oracle_id: r.weight for r in consensus.reports},
+            "outliers": result["outliers"],
+            "timed_out": timed_out,
+            "failed": failed,
+            "early_exit": early_exit
         }
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Lazily create the shared oracle worker pool"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                thread_name_prefix="oracle_aggregator")
+        return self._executor
+    
+    def _fan_out(self, calls: Dict[str, Callable[[], OracleData]], consensus: StreamingConsensus
+                 ) -> Tuple[List[OracleData], List[str], List[str], bool]:
+        """Query oracles concurrently, stopping once the consensus outcome is settled.
+        
+        Calls that time out, or are left behind by an early exit, are cancelled
+        only if they have not started: a running oracle call cannot be
+        interrupted and keeps its worker until it returns, so max_workers should
+        leave room for slow oracles beyond one verification's panel.
+        """
+        if not calls:
+            return [], [], [], False
+        
+        executor = self._get_executor()
+        started = time.monotonic()
+        pending = {executor.submit(traced(f"oracle.call.{name}", call)): name
+                   for name, call in calls.items()}
+        deadlines = {
+            future: started + self.oracle_timeouts.get(name, self.default_timeout)
+            for future, name in pending.items()
+        }
+        weights = {name: self.accuracy.weight(name) for name in calls}
+        outstanding_weight = sum(weights.values())
+        
+        verifications = []
+        timed_out = []
+        failed = []
+        
+        while pending:
+            wait_for = max(0.0, min(deadlines[f] for f in pending) - time.monotonic())
+            done, _ = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+            
+            for future in done:
+                name = pending.pop(future)
+                outstanding_weight -= weights[name]
+                if future.exception() is not None:
+                    failed.append(name)
+                elif future.result() is not None:
+                    verification = future.result()
+                    verifications.append(verification)
+                    consensus.add(_to_report(name, verification, weights[name]))
+            
+            # Drop oracles that missed their deadline
+            now = time.monotonic()
+            for future in [f for f in pending if deadlines[f] <= now]:
+                future.cancel()
+                name = pending.pop(future)
+                outstanding_weight -= weights[name]
+                timed_out.append(name)
+            
+            # Quorum early exit: stop waiting once outstanding answers cannot flip the result
+            if pending and consensus.is_settled(outstanding_weight, len(pending)):
+                for future in pending:
+                    future.cancel()
+                return verifications, timed_out, failed, True
+        
+        return verifications, timed_out, failed, False
+
+
+def _to_report(oracle_id: str, verification: OracleData, weight: float) -> OracleReport:
+    """Convert an oracle result into a consensus report"""
+    score = verification.data.get("overall_score", verification.data.get("average_score"))
+    return OracleReport(
+        oracle_id=oracle_id,
+        verified=verification.verification_status == VerificationStatus.VERIFIED,
+        confidence=verification.confidence_score,
+        weight=weight,
+        score=score
+    )
 
 
 # Example usage and testing
@@ -379,17 +739,49 @@ def demonstrate_oracle_integration():
     print(f"Confidence score: {consensus['confidence']:.2f}")
     print(f"Recommendation: {consensus['recommendation']}")
     
+    # Add a panel of independent verifiers; weights follow each oracle's track record
+    for i in range(2, 6):
+        aggregator.register_oracle(f"verification_{i}", MissionVerificationOracle(f"verification_oracle_{i}"))
+    for _ in range(20):
+        aggregator.get_consensus_verification("mission_123", web_deliverables, "web_development")
+    panel = aggregator.get_consensus_verification("mission_124", web_deliverables, "web_development")
+    print(f"Panel consensus: {panel['consensus']} across {len(panel['weights'])} oracles")
+    print(f"Panel outliers rejected: {len(panel['outliers'])}")
+    
+    # Test end-of-epoch batch verification (shared repository checked once)
+    epoch_missions = [
+        (f"mission_{200 + i}", {"url": f"https://dao-site-{i % 3}.example.com",
+                                "repository": "https://github.com/dao/project"})
+        for i in range(12)
+    ]
+    batch = verification_oracle.verify_web_development_missions(epoch_missions)
+    verified = sum(1 for v in batch if v.verification_status == VerificationStatus.VERIFIED)
+    print(f"Batch verification: {verified}/{len(batch)} missions verified")
+    
     # Test market data
     print(f"\n💰 Testing Market Data:")
     dao_price = market_oracle.get_token_price("DAO")
     print(f"DAO Token Price: ${dao_price.data['price_usd']:.2f}")
     print(f"24h Change: {dao_price.data['24h_change']:.1%}")
+    for _ in range(99):
+        market_oracle.get_token_price("DAO")
+    print(f"DAO 60-minute VWAP: ${market_oracle.get_vwap('DAO'):.2f}")
     
     # Test reputation data
     print(f"\n⭐ Testing Reputation Data:")
     reputation_data = reputation_oracle.get_external_reputation("agent_123")
     print(f"External Reputation Score: {reputation_data.data['weighted_reputation']:.2f}")
     
+    # Test cached oracle lookups
+    print(f"\n🗄️  Testing Oracle Cache:")
+    cache = OracleCache(max_entries=1000)
+    cached_market_oracle = MarketDataOracle("market_oracle_2", cache=cache)
+    for _ in range(1000):
+        cached_market_oracle.get_token_price("DAO")
+    cache_stats = cache.get_stats()
+    print(f"Cache hits: {cache_stats['hits']}, misses: {cache_stats['misses']}")
+    print(f"Upstream price queries: {len(cached_market_oracle.price_history)}")
+    
     return aggregator
 
 
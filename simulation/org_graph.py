@@ -0,0 +1,339 @@
+"""
+Organization Graph Store
+
+Relationships between agents of a BB LLC, kept per relation in compressed
+sparse row (CSR) form: an offsets array and a targets array over dense int
+node slots (ids.DenseIndex), for both edge directions, with each node's
+targets in slot order. Incremental updates go
+to a small delta (added lists, removed set) that traversals merge on the fly,
+and are folded into the arrays once the delta grows past a fraction of the
+graph, so queries never rebuild the graph.
+
+Relations used by the simulation:
+- "connects": the collaboration links passed to configure_organization_graph
+- "reports_to": agent -> manager (reporting chains, direct reports)
+- "delegates_to": agent -> delegate (delegation chains, delegators)
+"""
+
+from array import array
+from bisect import bisect_left
+from collections import deque
+from itertools import repeat
+from operator import add, floordiv, itemgetter, mod, mul
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from ids import DenseIndex
+
+RELATIONS = ("connects", "reports_to", "delegates_to")
+
+
+class _Adjacency:
+    """One direction of one relation: CSR arrays plus a delta of edge updates"""
+
+    def __init__(self):
+        self.offsets = array('l', [0])
+        self.targets = array('l')
+        self.added: Dict[int, List[int]] = {}
+        self.removed: Set[Tuple[int, int]] = set()
+        self.delta = 0  # Pending updates since the last compaction
+
+    def load(self, node_count: int, codes: List[int]):
+        """Build the CSR arrays from sorted edge codes (source * node_count + target)"""
+        self.offsets = array('l', [bisect_left(codes, node * node_count) for node in range(node_count + 1)])
+        self.targets = array('l', map(mod, codes, repeat(node_count)))
+        self.added, self.removed, self.delta = {}, set(), 0
+
+    def codes(self, node_count: int) -> List[int]:
+        """Sorted edge codes of the current edges, pending updates included"""
+        return sorted(node * node_count + target for node in range(node_count)
+                      for target in self.neighbors(node))
+
+    def neighbors(self, node: int) -> List[int]:
+        offsets = self.offsets
+        if node + 1 < len(offsets):
+            base = self.targets[offsets[node]:offsets[node + 1]]
+            if self.removed:
+                base = [target for target in base if (node, target) not in self.removed]
+            else:
+                base = list(base)
+        else:
+            base = []
+        extra = self.added.get(node)
+        return base + extra if extra else base
+
+    def has(self, source: int, target: int) -> bool:
+        if target in self.added.get(source, ()):
+            return True
+        offsets = self.offsets
+        if source + 1 >= len(offsets) or (source, target) in self.removed:
+            return False
+        return target in self.targets[offsets[source]:offsets[source + 1]]
+
+    def add(self, source: int, target: int):
+        if (source, target) in self.removed:
+            self.removed.discard((source, target))
+        else:
+            self.added.setdefault(source, []).append(target)
+        self.delta += 1
+
+    def remove(self, source: int, target: int):
+        extra = self.added.get(source)
+        if extra and target in extra:
+            extra.remove(target)
+        else:
+            self.removed.add((source, target))
+        self.delta += 1
+
+
+class OrganizationGraph:
+    """Directed, labelled agent relationships with traversal queries over CSR arrays"""
+
+    def __init__(self, compact_ratio: float = 0.1):
+        self.index = DenseIndex()
+        self.compact_ratio = compact_ratio  # Delta size (share of edges) that triggers compaction
+        self.out: Dict[str, _Adjacency] = {}
+        self.into: Dict[str, _Adjacency] = {}
+        self.edge_counts: Dict[str, int] = {}
+
+    @classmethod
+    def from_connections(cls, connections: Dict[str, Iterable[str]], relation: str = "connects",
+                         **params) -> 'OrganizationGraph':
+        """Build from an adjacency dict such as {'agent1': ['agent2', 'agent3']}"""
+        graph = cls(**params)
+        graph.add_nodes(connections)
+        graph.bulk_load(relation, ((source, target) for source, targets in connections.items()
+                                   for target in targets))
+        return graph
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, agent: str) -> bool:
+        return agent in self.index
+
+    def add_nodes(self, agents: Iterable[str]):
+        for agent in agents:
+            self.index.intern(agent)
+
+    def edge_count(self, relation: str = "connects") -> int:
+        return self.edge_counts.get(relation, 0)
+
+    # Updates
+
+    def bulk_load(self, relation: str, edges: Iterable[Tuple[str, str]]):
+        """Replace a relation's edges wholesale (duplicates are dropped)"""
+        pairs = list(edges)
+        sources = self.index.intern_all(map(itemgetter(0), pairs))
+        targets = self.index.intern_all(map(itemgetter(1), pairs))
+        nodes = len(self.index)
+        forward = sorted(set(map(add, map(mul, sources, repeat(nodes)), targets)))
+        sources = list(map(floordiv, forward, repeat(nodes)))
+        targets = list(map(mod, forward, repeat(nodes)))
+        self._direction(self.out, relation).load(nodes, forward)
+        self._direction(self.into, relation).load(nodes, sorted(map(add, map(mul, targets, repeat(nodes)), sources)))
+        self.edge_counts[relation] = len(forward)
+
+    def add_edge(self, relation: str, source: str, target: str) -> bool:
+        """Add one edge; False if it already exists"""
+        source_slot, target_slot = self.index.intern(source), self.index.intern(target)
+        out = self._direction(self.out, relation)
+        if out.has(source_slot, target_slot):
+            return False
+        out.add(source_slot, target_slot)
+        self._direction(self.into, relation).add(target_slot, source_slot)
+        self.edge_counts[relation] = self.edge_counts.get(relation, 0) + 1
+        self._maybe_compact(relation)
+        return True
+
+    def remove_edge(self, relation: str, source: str, target: str) -> bool:
+        """Remove one edge; False if it does not exist"""
+        source_slot, target_slot = self.index.slot(source), self.index.slot(target)
+        out = self.out.get(relation)
+        if out is None or source_slot is None or target_slot is None or not out.has(source_slot, target_slot):
+            return False
+        out.remove(source_slot, target_slot)
+        self.into[relation].remove(target_slot, source_slot)
+        self.edge_counts[relation] -= 1
+        self._maybe_compact(relation)
+        return True
+
+    def set_manager(self, agent: str, manager: Optional[str]):
+        """Point an agent's single reports_to edge at a new manager (None to clear)"""
+        for current in self.neighbors(agent, "reports_to"):
+            self.remove_edge("reports_to", agent, current)
+        if manager is not None:
+            self.add_edge("reports_to", agent, manager)
+
+    def compact(self, relation: Optional[str] = None):
+        """Fold pending updates into the CSR arrays"""
+        for name in ([relation] if relation is not None else list(self.out)):
+            nodes = len(self.index)
+            for directions in (self.out, self.into):
+                adjacency = directions[name]
+                adjacency.load(nodes, adjacency.codes(nodes))
+
+    # Queries
+
+    def neighbors(self, agent: str, relation: str = "connects", direction: str = "out") -> List[str]:
+        """Direct neighbors along a relation ("out", "in" or "both")"""
+        slot = self.index.slot(agent)
+        if slot is None:
+            return []
+        keys = self.index.keys
+        return [keys[node] for node in self._neighbor_slots(slot, (relation,), direction)]
+
+    def reporting_chain(self, agent: str) -> List[str]:
+        """Managers from the agent's direct manager up to the top (stops on a cycle)"""
+        return self._follow(agent, "reports_to")
+
+    def direct_reports(self, agent: str) -> List[str]:
+        return self.neighbors(agent, "reports_to", "in")
+
+    def subordinates(self, agent: str, max_depth: Optional[int] = None) -> List[str]:
+        """Everyone whose reporting chain passes through the agent"""
+        return list(self.k_hop(agent, max_depth, ("reports_to",), "in"))
+
+    def delegation_chain(self, agent: str) -> List[str]:
+        """Delegates followed transitively; the last entry holds the agent's delegated authority"""
+        return self._follow(agent, "delegates_to")
+
+    def final_delegate(self, agent: str) -> str:
+        chain = self.delegation_chain(agent)
+        return chain[-1] if chain else agent
+
+    def delegators(self, agent: str) -> List[str]:
+        """Agents whose delegation chain reaches this agent"""
+        return list(self.k_hop(agent, None, ("delegates_to",), "in"))
+
+    def k_hop(self, agent: str, k: Optional[int] = 2, relations: Iterable[str] = RELATIONS,
+              direction: str = "both") -> Dict[str, int]:
+        """Agents within k hops (unbounded if k is None) mapped to their distance, excluding the agent"""
+        start = self.index.slot(agent)
+        if start is None:
+            return {}
+        relations = tuple(relations)
+        distance = {start: 0}
+        frontier = [start]
+        hops = 0
+        while frontier and (k is None or hops < k):
+            hops += 1
+            following = []
+            for node in frontier:
+                for neighbor in self._neighbor_slots(node, relations, direction):
+                    if neighbor not in distance:
+                        distance[neighbor] = hops
+                        following.append(neighbor)
+            frontier = following
+        del distance[start]
+        keys = self.index.keys
+        return {keys[node]: hops for node, hops in distance.items()}
+
+    def distance(self, source: str, target: str, max_hops: int = 6,
+                 relations: Iterable[str] = RELATIONS) -> Optional[int]:
+        """Undirected hop count between two agents, or None if farther than max_hops"""
+        start, goal = self.index.slot(source), self.index.slot(target)
+        if start is None or goal is None:
+            return None
+        if start == goal:
+            return 0
+        relations = tuple(relations)
+        seen = {start}
+        queue = deque([(start, 0)])
+        while queue:
+            node, hops = queue.popleft()
+            if hops == max_hops:
+                continue
+            for neighbor in self._neighbor_slots(node, relations, "both"):
+                if neighbor == goal:
+                    return hops + 1
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    queue.append((neighbor, hops + 1))
+        return None
+
+    def rank_by_proximity(self, anchors: Iterable[str], candidates: Iterable[str],
+                          max_hops: int = 3) -> List[Tuple[str, int]]:
+        """Candidates ordered by hop distance to the nearest anchor (unreachable ones last)"""
+        distances: Dict[str, int] = {}
+        for anchor in anchors:
+            distances[anchor] = 0
+            for agent, hops in self.k_hop(anchor, max_hops).items():
+                if hops < distances.get(agent, max_hops + 1):
+                    distances[agent] = hops
+        ranked = [(agent, distances.get(agent, max_hops + 1)) for agent in candidates]
+        ranked.sort(key=lambda item: item[1])
+        return ranked
+
+    def _direction(self, directions: Dict[str, _Adjacency], relation: str) -> _Adjacency:
+        adjacency = directions.get(relation)
+        if adjacency is None:
+            adjacency = directions[relation] = _Adjacency()
+        return adjacency
+
+    def _neighbor_slots(self, node: int, relations: Tuple[str, ...], direction: str) -> List[int]:
+        found: List[int] = []
+        for relation in relations:
+            if direction in ("out", "both") and relation in self.out:
+                found += self.out[relation].neighbors(node)
+            if direction in ("in", "both") and relation in self.into:
+                found += self.into[relation].neighbors(node)
+        return found
+
+    def _follow(self, agent: str, relation: str) -> List[str]:
+        """Walk a functional relation (first out-edge) until it ends or cycles"""
+        node = self.index.slot(agent)
+        adjacency = self.out.get(relation)
+        if node is None or adjacency is None:
+            return []
+        seen = {node}
+        chain = []
+        while True:
+            following = adjacency.neighbors(node)
+            if not following or following[0] in seen:
+                break
+            node = following[0]
+            seen.add(node)
+            chain.append(self.index.keys[node])
+        return chain
+
+    def _maybe_compact(self, relation: str):
+        adjacency = self.out[relation]
+        if adjacency.delta > max(1024, self.compact_ratio * self.edge_counts[relation]):
+            self.compact(relation)
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    print("🕸️ Organization Graph")
+    print("=" * 50)
+    rng = random.Random(9)
+    size = 100000
+    agents = [f"agent_{i:06d}" for i in range(size)]
+    graph = OrganizationGraph()
+    graph.add_nodes(agents)
+
+    started = time.perf_counter()
+    graph.bulk_load("reports_to", ((agents[i], agents[(i - 1) // 8]) for i in range(1, size)))
+    graph.bulk_load("connects", ((agents[i], agents[rng.randrange(size)]) for i in range(size) for _ in range(10)))
+    graph.bulk_load("delegates_to", ((agents[i], agents[rng.randrange(i)]) for i in range(1, size, 50)))
+    print(f"Bulk load: {graph.edge_count('connects') + graph.edge_count('reports_to'):,} edges in "
+          f"{time.perf_counter() - started:.2f}s")
+
+    started = time.perf_counter()
+    for _ in range(20000):
+        graph.add_edge("connects", agents[rng.randrange(size)], agents[rng.randrange(size)])
+    print(f"20,000 incremental edges: {time.perf_counter() - started:.2f}s")
+
+    leaf = agents[-1]
+    started = time.perf_counter()
+    chain = graph.reporting_chain(leaf)
+    team = graph.subordinates(agents[1])
+    nearby = graph.k_hop(leaf, 2)
+    hops = graph.distance(leaf, agents[size // 2])
+    print(f"Reporting chain of {leaf}: {len(chain)} managers up to {chain[-1]}")
+    print(f"{agents[1]} manages {len(team):,} agents; {len(nearby):,} agents within 2 hops of {leaf}; "
+          f"distance to {agents[size // 2]}: {hops}")
+    print(f"Delegation: {agents[-49]} -> {graph.final_delegate(agents[-49])}")
+    print(f"Queries: {(time.perf_counter() - started) * 1000:.1f} ms")
@@ -0,0 +1,163 @@
+"""
+Synthetic Population Generator for Large-Scale Scenarios
+
+Draws agents, members, missions and marketplace tasks from distributions
+instead of hand-coded lists:
+- capability popularity follows a Zipf law (a few skills are everywhere, most are niche)
+- member token balances follow a Pareto law (a few whales, a long tail of small holders)
+- missions are drawn from a weighted mix of mission types
+
+Specs are produced lazily and fed to the bulk constructors
+(DAOSimulation.add_agents/add_members/create_missions,
+AgentManagementSystem.provision_agents, BlockchainSimulator.post_tasks), which
+skip uuid4 and per-object printing, so millions of entities can be built.
+"""
+
+import random
+import time
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Ordered from most to least popular
+DEFAULT_CAPABILITIES = [
+    "data_analysis", "research", "reporting", "machine_learning", "web_development",
+    "writing", "visualization", "backend", "frontend", "statistical_modeling",
+    "report_generation", "project_management", "quality_assurance", "optimization",
+    "coordination", "mathematical_modeling", "security_audit", "smart_contracts",
+    "translation", "legal_review"
+]
+
+
+@dataclass(frozen=True)
+class MissionType:
+    """A template missions are drawn from"""
+    name: str
+    capabilities: Tuple[str, ...]
+    budget_range: Tuple[float, float]
+    max_agents: int = 3
+    deadline_days: int = 30
+
+
+DEFAULT_MISSION_MIX: Dict[MissionType, float] = {
+    MissionType("Market Analysis", ("data_analysis", "research"), (1000.0, 5000.0)): 0.35,
+    MissionType("Website Build", ("web_development", "frontend"), (3000.0, 12000.0)): 0.25,
+    MissionType("Model Training", ("machine_learning", "data_analysis"), (5000.0, 20000.0), 4, 45): 0.15,
+    MissionType("Research Report", ("research", "writing", "reporting"), (500.0, 3000.0), 2): 0.2,
+    MissionType("Contract Audit", ("security_audit", "smart_contracts"), (8000.0, 30000.0), 2, 14): 0.05,
+}
+
+
+class PopulationGenerator:
+    """Seeded source of agent, member, mission and task specs"""
+
+    def __init__(self, seed: int = 42, capabilities: Sequence[str] = DEFAULT_CAPABILITIES,
+                 zipf_exponent: float = 1.1, capabilities_per_agent: Tuple[int, int] = (2, 5),
+                 pareto_alpha: float = 1.5, min_balance: float = 100.0,
+                 stake_range: Tuple[float, float] = (500.0, 2000.0),
+                 mission_mix: Optional[Dict[MissionType, float]] = None):
+        self.rng = random.Random(seed)
+        self.capabilities = list(capabilities)
+        self.capabilities_per_agent = (capabilities_per_agent[0],
+                                       min(capabilities_per_agent[1], len(self.capabilities)))
+        self.pareto_alpha = pareto_alpha
+        self.min_balance = min_balance
+        self.stake_range = stake_range
+
+        # Zipf: the capability of rank r is drawn with weight 1 / r**s
+        self._capability_cum_weights = list(accumulate(
+            1.0 / rank ** zipf_exponent for rank in range(1, len(self.capabilities) + 1)))
+
+        mix = mission_mix or DEFAULT_MISSION_MIX
+        self.mission_types = list(mix)
+        self._mission_cum_weights = list(accumulate(mix.values()))
+
+    def sample_capabilities(self, count: int) -> List[str]:
+        """Draw `count` distinct capabilities by Zipfian popularity"""
+        chosen = set()
+        while len(chosen) < count:
+            chosen.update(self.rng.choices(self.capabilities, cum_weights=self._capability_cum_weights,
+                                           k=count - len(chosen)))
+        return list(chosen)
+
+    def token_balance(self) -> float:
+        """Pareto-distributed token balance"""
+        return self.min_balance * self.rng.paretovariate(self.pareto_alpha)
+
+    def agent_specs(self, count: int) -> Iterator[Tuple[str, List[str], float]]:
+        """(name, capabilities, stake) for DAOSimulation.add_agents"""
+        low, high = self.capabilities_per_agent
+        for i in range(count):
+            yield (f"Agent_{i}", self.sample_capabilities(self.rng.randint(low, high)),
+                   self.rng.uniform(*self.stake_range))
+
+    def member_specs(self, count: int) -> Iterator[Tuple[str, float]]:
+        """(name, token_balance) for DAOSimulation.add_members"""
+        for i in range(count):
+            yield f"Member_{i}", self.token_balance()
+
+    def mission_specs(self, count: int) -> Iterator[Tuple[str, str, set, float, int, int]]:
+        """(title, description, capabilities, budget, deadline_days, max_agents) for create_missions"""
+        types = self.rng.choices(self.mission_types, cum_weights=self._mission_cum_weights, k=count)
+        for i, mission_type in enumerate(types):
+            yield (f"{mission_type.name} #{i}", f"Generated {mission_type.name.lower()} mission",
+                   set(mission_type.capabilities), round(self.rng.uniform(*mission_type.budget_range), 2),
+                   mission_type.deadline_days, mission_type.max_agents)
+
+    def marketplace_agent_specs(self, count: int, initial_funds: float = 50.0,
+                                human_fraction: float = 0.05) -> Iterator[Tuple[str, str, List[str], bool, float]]:
+        """(agent_id, agent_type, capabilities, human_controlled, initial_funds) for provision_agents"""
+        low, high = self.capabilities_per_agent
+        for i in range(count):
+            human = self.rng.random() < human_fraction
+            yield (f"{'Human_Expert' if human else 'AI_Agent'}_{i}", "Human_Operator" if human else "AI_LLM",
+                   self.sample_capabilities(self.rng.randint(low, high)), human, initial_funds)
+
+    def task_specs(self, count: int, deadline: int = 0) -> Iterator[Tuple[str, str, List[str], float, int]]:
+        """(consumer_id, description, required_skills, budget, deadline) for BlockchainSimulator.post_tasks"""
+        types = self.rng.choices(self.mission_types, cum_weights=self._mission_cum_weights, k=count)
+        for i, mission_type in enumerate(types):
+            low, high = mission_type.budget_range
+            yield (f"Consumer_{i % 1000}", f"{mission_type.name} task {i}", list(mission_type.capabilities),
+                   round(self.rng.uniform(low, high) / 10, 2), deadline)
+
+    def populate_dao(self, dao, agents: int = 0, members: int = 0, missions: int = 0) -> Dict[str, List[str]]:
+        """Bulk-load a DAOSimulation; returns the new ids by entity kind"""
+        return {
+            "agents": dao.add_agents(self.agent_specs(agents)),
+            "members": dao.add_members(self.member_specs(members)),
+            "missions": dao.create_missions(self.mission_specs(missions))
+        }
+
+    def populate_marketplace(self, ams, agents: int = 0, tasks: int = 0,
+                             initial_funds: float = 50.0) -> List[str]:
+        """Bulk-load a bbllcDeploymentSim marketplace; returns the new task ids"""
+        ams.provision_agents(self.marketplace_agent_specs(agents, initial_funds))
+        return ams.blockchain.post_tasks(self.task_specs(tasks))
+
+
+if __name__ == "__main__":
+    import contextlib
+    import io
+
+    from bbllcDeploymentSim import AgentManagementSystem, BlockchainSimulator
+    from dao_simulation import DAOSimulation
+
+    print("👥 Synthetic Population Generator")
+    print("=" * 50)
+    for size in (10000, 100000):
+        generator = PopulationGenerator(seed=7)
+        started = time.perf_counter()
+        dao = DAOSimulation()
+        generator.populate_dao(dao, agents=size, members=size, missions=size // 10)
+        dao_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            blockchain = BlockchainSimulator()
+            generator.populate_marketplace(AgentManagementSystem(blockchain), agents=size, tasks=size // 10)
+        marketplace_seconds = time.perf_counter() - started
+
+        balances = sorted((m.token_balance for m in dao.members.values()), reverse=True)
+        print(f"{size:,} agents/members: DAO {dao_seconds:.2f}s, marketplace {marketplace_seconds:.2f}s; "
+              f"top 1% of members hold {sum(balances[:size // 100]) / sum(balances):.0%} of tokens")
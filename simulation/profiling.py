@@ -0,0 +1,241 @@
+"""
+Opt-in Profiling Spans for the Simulation Hot Paths
+
+Named spans (assignment, execution, voting, bidding, block sealing, oracle
+calls) record call counts, log-bucketed latency histograms (p50/p99) and,
+optionally, net tracemalloc allocations. Self time per span stack is kept so a
+run can be dumped as a flamegraph-compatible collapsed-stack file.
+
+Profiling is off by default: instrumented functions then pay one global lookup
+per call. Enable it around a run:
+
+    profiler = profiling.enable(track_allocations=True)
+    ...run the simulation...
+    profiling.disable()
+    print(profiler.report())
+    profiler.write_collapsed("run.folded")  # flamegraph.pl run.folded > run.svg
+"""
+
+import math
+import threading
+import time
+import tracemalloc
+from array import array
+from functools import wraps
+from typing import Callable, Dict, List, Optional
+
+BUCKETS_PER_OCTAVE = 8  # Histogram resolution: ~9% relative error on percentiles
+MAX_BUCKET = 64 * BUCKETS_PER_OCTAVE  # Durations are bucketed in nanoseconds
+
+
+class SpanStats:
+    """Aggregates for one span name"""
+
+    def __init__(self):
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.allocated_bytes = 0
+        self.histogram = array('l', [0]) * (MAX_BUCKET + 1)
+
+    def add(self, seconds: float, allocated: int):
+        self.count += 1
+        self.total_seconds += seconds
+        if seconds > self.max_seconds:
+            self.max_seconds = seconds
+        self.allocated_bytes += allocated
+        nanoseconds = seconds * 1e9
+        bucket = int(math.log2(nanoseconds) * BUCKETS_PER_OCTAVE) if nanoseconds > 1 else 0
+        self.histogram[min(bucket, MAX_BUCKET)] += 1
+
+    def percentile(self, q: float) -> float:
+        """Upper edge (seconds) of the histogram bucket holding the q-th quantile"""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for bucket, hits in enumerate(self.histogram):
+            seen += hits
+            if seen >= rank:
+                return min(2 ** ((bucket + 1) / BUCKETS_PER_OCTAVE) / 1e9, self.max_seconds)
+        return self.max_seconds
+
+    def summary(self) -> Dict:
+        return {
+            "count": self.count,
+            "total_seconds": self.total_seconds,
+            "mean_seconds": self.total_seconds / self.count if self.count else 0.0,
+            "p50_seconds": self.percentile(0.5),
+            "p99_seconds": self.percentile(0.99),
+            "max_seconds": self.max_seconds,
+            "allocated_bytes": self.allocated_bytes
+        }
+
+
+class _Span:
+    """Context manager for one active span"""
+
+    __slots__ = ("profiler", "name", "started", "child_seconds", "allocated_at")
+
+    def __init__(self, profiler: "Profiler", name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.child_seconds = 0.0
+        self.allocated_at = tracemalloc.get_traced_memory()[0] if self.profiler.track_allocations else 0
+        self.profiler._stack().append(self)
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self.started
+        allocated = (tracemalloc.get_traced_memory()[0] - self.allocated_at
+                     if self.profiler.track_allocations else 0)
+        stack = self.profiler._stack()
+        path = ";".join(span.name for span in stack)
+        stack.pop()
+        if stack:
+            stack[-1].child_seconds += elapsed
+        self.profiler._record(self.name, path, elapsed, elapsed - self.child_seconds, allocated)
+        return False
+
+
+class _NullSpan:
+    """Shared no-op span used while profiling is disabled"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+NULL_SPAN = _NullSpan()
+
+
+class Profiler:
+    """Collects span statistics across threads"""
+
+    def __init__(self, track_allocations: bool = False):
+        self.track_allocations = track_allocations
+        self.spans: Dict[str, SpanStats] = {}
+        self.self_seconds: Dict[str, float] = {}  # Collapsed stack path -> self time
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._started_tracemalloc = False
+
+    def span(self, name: str) -> _Span:
+        return _Span(self, name)
+
+    def start(self):
+        if self.track_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def stop(self):
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def reset(self):
+        with self._lock:
+            self.spans.clear()
+            self.self_seconds.clear()
+
+    def report(self) -> Dict[str, Dict]:
+        """Per-span summaries, slowest total first"""
+        with self._lock:
+            ordered = sorted(self.spans.items(), key=lambda item: item[1].total_seconds, reverse=True)
+            return {name: stats.summary() for name, stats in ordered}
+
+    def collapsed_stacks(self) -> List[str]:
+        """Lines of 'outer;inner <self microseconds>' for flamegraph tooling"""
+        with self._lock:
+            return [f"{path} {max(1, round(seconds * 1e6))}"
+                    for path, seconds in sorted(self.self_seconds.items())]
+
+    def write_collapsed(self, path: str) -> str:
+        with open(path, "w") as handle:
+            handle.write("\n".join(self.collapsed_stacks()) + "\n")
+        return path
+
+    def format_report(self) -> str:
+        lines = [f"{'span':<28}{'calls':>9}{'total ms':>12}{'p50 µs':>11}{'p99 µs':>11}{'alloc KiB':>11}"]
+        for name, stats in self.report().items():
+            lines.append(f"{name:<28}{stats['count']:>9}{stats['total_seconds'] * 1e3:>12.2f}"
+                         f"{stats['p50_seconds'] * 1e6:>11.1f}{stats['p99_seconds'] * 1e6:>11.1f}"
+                         f"{stats['allocated_bytes'] / 1024:>11.1f}")
+        return "\n".join(lines)
+
+    def _stack(self) -> List[_Span]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _record(self, name: str, path: str, elapsed: float, self_time: float, allocated: int):
+        with self._lock:
+            stats = self.spans.get(name)
+            if stats is None:
+                stats = self.spans[name] = SpanStats()
+            stats.add(elapsed, allocated)
+            self.self_seconds[path] = self.self_seconds.get(path, 0.0) + self_time
+
+
+_active: Optional[Profiler] = None
+
+
+def enable(track_allocations: bool = False) -> Profiler:
+    """Start collecting spans into a fresh global profiler"""
+    global _active
+    disable()
+    _active = Profiler(track_allocations)
+    _active.start()
+    return _active
+
+
+def disable() -> Optional[Profiler]:
+    """Stop collecting; returns the profiler that was active (its data stays readable)"""
+    global _active
+    profiler, _active = _active, None
+    if profiler is not None:
+        profiler.stop()
+    return profiler
+
+
+def get_profiler() -> Optional[Profiler]:
+    return _active
+
+
+def span(name: str):
+    """Context manager timing a block under `name` (a shared no-op when disabled)"""
+    profiler = _active
+    return profiler.span(name) if profiler is not None else NULL_SPAN
+
+
+def profiled(name: str):
+    """Decorator timing every call of a function under `name`"""
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            profiler = _active
+            if profiler is None:
+                return func(*args, **kwargs)
+            with profiler.span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def traced(name: str, func: Callable) -> Callable:
+    """Wrap a callable (e.g. one submitted to a worker pool) in a span, if profiling is on"""
+    if _active is None:
+        return func
+
+    def call(*args, **kwargs):
+        with span(name):
+            return func(*args, **kwargs)
+    return call
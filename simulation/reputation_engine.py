@@ -0,0 +1,215 @@
+"""
+Epoch-Batched Reputation Engine
+
+Mission results and violations are buffered as they happen and applied to the
+whole agent population once per epoch:
+- reputation moves by the same EMA step DAOSimulation used per mission
+  (weight * (score - 0.5) * sensitivity), clamped to [low, high]
+- per-skill ratings (0-100, as in ReputationSystem.sol's skillRatings) follow
+  the scores of the missions that used each skill
+- agents inactive for more than `grace_epochs` decay toward `decay_target`
+- queued violations slash a fraction of stake and a reputation penalty
+
+State lives in array columns indexed by the agent slots of an
+entity_store.ColumnTable, so an epoch is a handful of passes over contiguous
+columns. Sharing DAOSimulation's columnar agent table updates agents in place.
+"""
+
+import math
+from array import array
+from typing import Dict, Iterable, Optional
+
+from entity_store import ColumnTable
+
+
+class ReputationEngine:
+    """Buffers reputation events and applies them per epoch over array columns"""
+
+    def __init__(self, table: Optional[ColumnTable] = None, ema_weight: float = 0.1,
+                 sensitivity: float = 10.0, low: float = 0.0, high: float = 200.0,
+                 skill_weight: float = 0.2, default_skill_rating: float = 50.0,
+                 decay_half_life: float = 20.0, decay_target: float = 100.0, grace_epochs: int = 3,
+                 slash_fraction: float = 0.1, slash_penalty: float = 10.0):
+        # Needs "reputation" and "staked_amount" columns; shares them when given the DAO's table
+        self.table = table if table is not None else ColumnTable({"reputation": 'd', "staked_amount": 'd'})
+        self.ema_weight = ema_weight
+        self.sensitivity = sensitivity
+        self.low = low
+        self.high = high
+        self.skill_weight = skill_weight
+        self.default_skill_rating = default_skill_rating
+        self.decay_factor = 0.5 ** (1.0 / decay_half_life)  # Per inactive epoch
+        self.decay_target = decay_target
+        self.grace_epochs = grace_epochs
+        self.slash_fraction = slash_fraction
+        self.slash_penalty = slash_penalty
+
+        self.epoch = 0
+        self.last_active = array('l')
+        self.missions_completed = array('l')
+        self.missions_successful = array('l')
+        self.skills: Dict[str, array] = {}  # Skill -> rating per agent slot
+
+        # Buffered events
+        self._event_slot = array('l')
+        self._event_score = array('d')
+        self._event_success = array('b')
+        self._skill_events: Dict[str, array] = {}  # Skill -> event rows that used it
+        self._slash_slot = array('l')
+        self._slash_severity = array('d')
+
+    def slot(self, address: str) -> int:
+        """The agent's row, registering it (zeroed) if new"""
+        slot = self.table.add(address)
+        self._grow()
+        return slot
+
+    def record_performance(self, address: str, score: float, success: bool,
+                           skills: Iterable[str] = ()):
+        """Buffer a mission result for the next epoch"""
+        row = len(self._event_slot)
+        self._event_slot.append(self.slot(address))
+        self._event_score.append(score)
+        self._event_success.append(success)
+        for skill in skills:
+            events = self._skill_events.get(skill)
+            if events is None:
+                events = self._skill_events[skill] = array('l')
+            events.append(row)
+
+    def record_violation(self, address: str, severity: float = 1.0):
+        """Buffer a stake slash (severity 1.0 slashes slash_fraction of stake)"""
+        self._slash_slot.append(self.slot(address))
+        self._slash_severity.append(severity)
+
+    def pending_events(self) -> int:
+        return len(self._event_slot) + len(self._slash_slot)
+
+    def run_epoch(self) -> Dict:
+        """Apply buffered events, decay and slashing to the whole population"""
+        self.epoch += 1
+        self._grow()
+        reputation = self.table.columns["reputation"]
+        stake = self.table.columns["staked_amount"]
+        reputation_before = math.fsum(reputation)
+
+        # Mission results: net EMA step per agent, then clamp once
+        steps: Dict[int, float] = {}
+        step_scale = self.ema_weight * self.sensitivity
+        for slot, score, success in zip(self._event_slot, self._event_score, self._event_success):
+            steps[slot] = steps.get(slot, 0.0) + (score - 0.5) * step_scale
+            self.missions_completed[slot] += 1
+            self.missions_successful[slot] += success
+            self.last_active[slot] = self.epoch
+        low, high = self.low, self.high
+        for slot, step in steps.items():
+            reputation[slot] = min(high, max(low, reputation[slot] + step))
+
+        # Per-skill ratings
+        keep = 1.0 - self.skill_weight
+        for skill, rows in self._skill_events.items():
+            ratings = self._skill_column(skill)
+            for row in rows:
+                slot = self._event_slot[row]
+                rating = min(100.0, self._event_score[row] * 100.0)
+                ratings[slot] = ratings[slot] * keep + rating * self.skill_weight
+
+        # Inactivity decay toward the target, in one pass over the population
+        cutoff = self.epoch - self.grace_epochs
+        target, factor = self.decay_target, self.decay_factor
+        decayed = sum(1 for last in self.last_active if last < cutoff)
+        if decayed:
+            reputation[:] = array('d', [
+                target + (rep - target) * factor if last < cutoff else rep
+                for rep, last in zip(reputation, self.last_active)
+            ])
+
+        # Slashing
+        slashed_stake = 0.0
+        for slot, severity in zip(self._slash_slot, self._slash_severity):
+            amount = stake[slot] * min(1.0, self.slash_fraction * severity)
+            stake[slot] -= amount
+            slashed_stake += amount
+            reputation[slot] = min(high, max(low, reputation[slot] - self.slash_penalty * severity))
+
+        report = {
+            "epoch": self.epoch,
+            "agents_updated": len(steps),
+            "agents_decayed": decayed,
+            "agents_slashed": len(set(self._slash_slot)),
+            "stake_slashed": slashed_stake,
+            "net_reputation_change": math.fsum(reputation) - reputation_before
+        }
+        self._clear_events()
+        return report
+
+    def skill_rating(self, address: str, skill: str) -> float:
+        """An agent's 0-100 rating for a skill (the default if never rated)"""
+        slot = self.table.index.slot(address)
+        ratings = self.skills.get(skill)
+        if slot is None or ratings is None:
+            return self.default_skill_rating
+        return ratings[slot]
+
+    def success_rate(self, address: str) -> float:
+        """missionsSuccessful / missionsCompleted, as in ReputationSystem.sol"""
+        slot = self.table.index.slot(address)
+        if slot is None or not self.missions_completed[slot]:
+            return 0.0
+        return self.missions_successful[slot] / self.missions_completed[slot]
+
+    def _skill_column(self, skill: str) -> array:
+        ratings = self.skills.get(skill)
+        if ratings is None:
+            ratings = self.skills[skill] = array('d', [self.default_skill_rating]) * len(self.last_active)
+        return ratings
+
+    def _grow(self):
+        """Extend the engine's per-agent columns to the table's size"""
+        missing = len(self.table) - len(self.last_active)
+        if missing <= 0:
+            return
+        self.last_active.extend(array('l', [self.epoch]) * missing)
+        self.missions_completed.extend(array('l', [0]) * missing)
+        self.missions_successful.extend(array('l', [0]) * missing)
+        for ratings in self.skills.values():
+            ratings.extend(array('d', [self.default_skill_rating]) * missing)
+
+    def _clear_events(self):
+        self._event_slot = array('l')
+        self._event_score = array('d')
+        self._event_success = array('b')
+        self._skill_events = {}
+        self._slash_slot = array('l')
+        self._slash_severity = array('d')
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    from ids import DenseIndex
+
+    print("⭐ Reputation Engine Epoch Benchmark")
+    print("=" * 50)
+    size = 1000000
+    rng = random.Random(5)
+    table = ColumnTable({"reputation": 'd', "staked_amount": 'd'})
+    table.index = DenseIndex(f"agent_{i:08x}" for i in range(size))
+    table.columns["reputation"] = array('d', [100.0]) * size
+    table.columns["staked_amount"] = array('d', [1000.0]) * size
+    engine = ReputationEngine(table, grace_epochs=0)
+
+    addresses = table.index.keys
+    for _ in range(100000):
+        engine.record_performance(rng.choice(addresses), rng.random() * 1.2, rng.random() < 0.7,
+                                  rng.sample(["research", "data_analysis", "writing", "frontend"], 2))
+    for _ in range(1000):
+        engine.record_violation(rng.choice(addresses), rng.uniform(0.5, 2.0))
+
+    started = time.perf_counter()
+    report = engine.run_epoch()
+    elapsed = time.perf_counter() - started
+    print(f"Epoch over {size:,} agents: {elapsed:.3f}s")
+    for key, value in report.items():
+        print(f"  {key}: {value:,.2f}" if isinstance(value, float) else f"  {key}: {value:,}")
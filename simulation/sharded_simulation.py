@@ -0,0 +1,428 @@
+"""
+Sharded Marketplace Simulation
+
+Runs the BB LLC bidding marketplace across worker processes. Agents are
+partitioned into shards by BB LLC or by capability hash (crc32, so placement
+is the same in every process); each shard owns its agents' capabilities and
+balances. Per block the coordinator:
+
+1. sends every shard that holds a relevant skill one batch with the block's
+   tasks
+2. collects one batch of bids per shard, which covers bids for tasks homed on
+   other shards, over multiprocessing queues
+3. merges deterministically: all bids sorted by (task, amount, agent), and the
+   lowest bid wins, as in InformationConsumer.review_bids_and_negotiate
+4. sends each shard one settlement batch crediting its winning agents
+
+With shared_memory=True the agents live in a shared_tables.SharedAgentTable.
+Shards attach to it instead of receiving pickled agent lists, and settlements
+are written straight into its funds column, so step 4 needs no messages.
+
+Bids use the same rules as Agent.evaluate_and_bid (can_bid/compute_bid), with
+the random draws derived from (seed, task, agent). The outcome therefore does
+not depend on the shard count or on message arrival order. Shards exchange
+batches only once per block. If a shard process dies, the coordinator raises
+RuntimeError instead of waiting for its reply forever.
+"""
+
+import multiprocessing
+import os
+import queue
+import time
+import zlib
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from bbllcDeploymentSim import can_bid, compute_bid
+from money import Wei, from_wei, to_wei
+
+PARTITIONS = ("bbllc", "capability")
+LIVENESS_POLL = 1.0  # Seconds between shard-process liveness checks while awaiting replies
+
+_M64 = (1 << 64) - 1
+
+
+def _mix(value: int) -> int:
+    """splitmix64 finalizer: a well-spread 64-bit hash of an int"""
+    value = (value + 0x9E3779B97F4A7C15) & _M64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _M64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _M64
+    return value ^ (value >> 31)
+
+
+def shard_of(key: str, num_shards: int) -> int:
+    return zlib.crc32(key.encode()) % num_shards
+
+
+class Shard:
+    """One partition of agents: bids on a block's tasks and applies settlements"""
+
+    def __init__(self, shard_id: int, agents: Sequence[Tuple[int, Tuple[str, ...], Wei]], seed: int):
+        self.shard_id = shard_id
+        self.seed = _mix(seed)
+        self.funds: Dict[int, Wei] = {}
+        self.as_tokens = from_wei  # How a funds entry converts to a token amount
+        self.by_skill: Dict[str, List[int]] = {}
+        for agent, capabilities, funds_wei in agents:
+            self.funds[agent] = funds_wei
+            for capability in capabilities:
+                self.by_skill.setdefault(capability, []).append(agent)
+
+    @classmethod
+    def from_table(cls, shard_id: int, table, seed: int) -> 'Shard':
+        """A shard reading its agents from a shared_tables.SharedAgentTable (funds in tokens, kept by the coordinator)"""
+        shard = cls(shard_id, (), seed)
+        shard.funds = table.columns["funds"]
+        shard.as_tokens = float
+        masks = table.columns["capabilities"]
+        for agent, owner in enumerate(table.columns["shard"]):
+            if owner == shard_id:
+                for bit, capability in enumerate(table.vocabulary):
+                    if masks[agent] >> bit & 1:
+                        shard.by_skill.setdefault(capability, []).append(agent)
+        return shard
+
+    def bid(self, tasks: Sequence[Tuple[int, Tuple[str, ...], float]]) -> List[Tuple[int, Wei, int]]:
+        """(task, bid_wei, agent) for every eligible agent of this shard"""
+        bids = []
+        seed = self.seed
+        for task, required, budget in tasks:
+            matches: Dict[int, int] = {}
+            for skill in required:
+                for agent in self.by_skill.get(skill, ()):
+                    matches[agent] = matches.get(agent, 0) + 1
+            for agent, matched in matches.items():
+                ratio = matched / len(required)
+                if not can_bid(ratio, self.as_tokens(self.funds[agent]), budget):
+                    continue
+                draw = _mix(seed ^ (task << 32) ^ agent)
+                amount = compute_bid(budget, ratio, (draw >> 32) / 2 ** 32, (draw & 0xFFFFFFFF) / 2 ** 32)
+                bids.append((task, to_wei(amount), agent))
+        return bids
+
+    def settle(self, credits: Iterable[Tuple[int, Wei]]):
+        for agent, amount in credits:
+            self.funds[agent] += amount
+
+    def total_funds(self) -> Wei:
+        return sum(self.funds.values())
+
+
+def _shard_worker(shard_id: int, agents, seed: int, inbox, outbox, table_spec: Optional[Dict] = None):
+    """Worker process loop: ("block", n, tasks) -> bids, ("settle", credits), ("stop",) -> funds"""
+    table = None
+    if table_spec is not None:
+        from shared_tables import SharedAgentTable
+        table = SharedAgentTable.attach(table_spec)
+        shard = Shard.from_table(shard_id, table, seed)
+    else:
+        shard = Shard(shard_id, agents, seed)
+    while True:
+        message = inbox.get()
+        kind = message[0]
+        if kind == "block":
+            outbox.put(("bids", shard_id, message[1], shard.bid(message[2])))
+        elif kind == "settle":
+            shard.settle(message[1])
+        elif kind == "stop":
+            if table is not None:
+                shard.funds = {}  # Balances live with the coordinator
+                table.close()
+            outbox.put(("funds", shard_id, shard.funds))
+            return
+
+
+class ShardedMarketplace:
+    """Coordinator: routes task batches to shards and merges their bids block by block"""
+
+    def __init__(self, num_shards: Optional[int] = None, partition: str = "bbllc", seed: int = 42,
+                 processes: bool = True, mp_context: Optional[str] = None, shared_memory: bool = False):
+        if partition not in PARTITIONS:
+            raise ValueError(f"Unknown partition {partition!r}; expected one of {PARTITIONS}")
+        self.num_shards = num_shards or os.cpu_count() or 1
+        self.partition = partition
+        self.seed = seed
+        self.processes = processes  # False runs the same shard logic in-process
+        self.mp_context = mp_context
+        self.shared_memory = shared_memory  # Agent tables in shared memory instead of pickled to each shard
+        self.table = None
+        self._balances: List[Wei] = []  # Exact balances when the shards read funds from the shared table
+
+        self.agent_ids: List[str] = []
+        self.agent_shard: List[int] = []
+        self._pending_agents: List[List[Tuple[int, Tuple[str, ...], Wei]]] = [[] for _ in range(self.num_shards)]
+        self.shard_skills: List[set] = [set() for _ in range(self.num_shards)]
+
+        self.task_ids: List[str] = []
+        self.tasks: List[Tuple[str, Tuple[str, ...], float, Optional[str]]] = []  # consumer, skills, budget, bbllc
+        self.winners: Dict[int, Tuple[int, Wei]] = {}  # Task -> (agent, price)
+        self._queued: List[int] = []  # Tasks posted since the last block
+        self.block_height = 0
+        self.volume_by_bbllc: Dict[Optional[str], Wei] = {}
+
+        self._shards: List[Shard] = []
+        self._workers = []
+        self._inboxes = []
+        self._outbox = None
+        self.started = False
+        self.closed = False  # Shards cannot be restarted: their agents and balances are gone
+
+    # Setup
+
+    def add_agents(self, specs: Iterable[Tuple[str, Sequence[str], float, Optional[str]]]) -> int:
+        """Register (agent_id, capabilities, initial_funds, bbllc_name) agents before start()"""
+        if self.started or self.closed:
+            raise RuntimeError("Agents must be added before the shards start")
+        added = 0
+        for agent_id, capabilities, initial_funds, bbllc_name in specs:
+            capabilities = tuple(capabilities)
+            if self.partition == "bbllc":
+                key = bbllc_name or agent_id
+            else:
+                key = min(capabilities) if capabilities else agent_id
+            shard = shard_of(key, self.num_shards)
+            index = len(self.agent_ids)
+            self.agent_ids.append(agent_id)
+            self.agent_shard.append(shard)
+            self._pending_agents[shard].append((index, capabilities, to_wei(initial_funds)))
+            self.shard_skills[shard].update(capabilities)
+            added += 1
+        return added
+
+    def start(self):
+        """Hand each shard its agents (worker processes, or in-process shards)"""
+        if self.started:
+            return
+        if self.closed:
+            raise RuntimeError("ShardedMarketplace is closed; create a new one to run more blocks")
+        spec = None
+        if self.shared_memory:
+            spec = self._build_table()
+        if self.processes:
+            context = multiprocessing.get_context(self.mp_context)
+            self._outbox = context.Queue()
+            for shard_id, agents in enumerate(self._pending_agents):
+                inbox = context.Queue()
+                if spec is not None:
+                    agents = ()  # Workers attach to the shared table instead
+                worker = context.Process(target=_shard_worker,
+                                         args=(shard_id, agents, self.seed, inbox, self._outbox, spec),
+                                         daemon=True)
+                worker.start()
+                self._inboxes.append(inbox)
+                self._workers.append(worker)
+        elif spec is not None:
+            self._shards = [Shard.from_table(shard_id, self.table, self.seed) for shard_id in range(self.num_shards)]
+        else:
+            self._shards = [Shard(shard_id, agents, self.seed) for shard_id, agents in enumerate(self._pending_agents)]
+        self._pending_agents = []
+        self.started = True
+
+    def _build_table(self) -> Dict:
+        """Copy the registered agents into a SharedAgentTable; returns its spec for the workers"""
+        from shared_tables import SharedAgentTable
+
+        vocabulary = sorted(set().union(*self.shard_skills))
+        self.table = SharedAgentTable.create(len(self.agent_ids), vocabulary)
+        columns = self.table.columns
+        self._balances = [0] * len(self.agent_ids)
+        for shard_id, agents in enumerate(self._pending_agents):
+            for agent, capabilities, funds_wei in agents:
+                columns["capabilities"][agent] = self.table.mask(capabilities)
+                columns["funds"][agent] = from_wei(funds_wei)
+                columns["shard"][agent] = shard_id
+                self._balances[agent] = funds_wei
+        return self.table.spec
+
+    def close(self) -> Dict[str, Wei]:
+        """Stop the shards and return every agent's final balance (the marketplace cannot be restarted)"""
+        if not self.started:
+            return {}
+        funds: Dict[int, Wei] = {}
+        try:
+            if self.processes:
+                self._stop_workers(funds)
+            elif self.table is None:
+                for shard in self._shards:
+                    funds.update(shard.funds)
+            if self.table is not None:
+                funds = dict(enumerate(self._balances))
+        finally:
+            if self.table is not None:
+                self.table.close()
+                self.table = None
+            self._shards = []
+            self.started = False
+            self.closed = True
+        return {self.agent_ids[agent]: amount for agent, amount in sorted(funds.items())}
+
+    def _stop_workers(self, funds: Dict[int, Wei]):
+        """Collect each worker's final balances into `funds` and reap the processes"""
+        for inbox in self._inboxes:
+            inbox.put(("stop",))
+        try:
+            for _, _, shard_funds in self._gather(range(len(self._workers))):
+                funds.update(shard_funds)
+        except RuntimeError:
+            for worker in self._workers:
+                worker.terminate()  # A partial result is no result: stop the survivors too
+            raise
+        finally:
+            for worker in self._workers:
+                worker.join()
+            self._workers, self._inboxes = [], []
+
+    def _gather(self, shards: Iterable[int]) -> List[Tuple]:
+        """One reply from each of the given shard processes; RuntimeError if one exits without replying"""
+        waiting = set(shards)
+        replies = []
+        while waiting:
+            try:
+                reply = self._outbox.get(timeout=LIVENESS_POLL)
+            except queue.Empty:
+                dead = {shard: self._workers[shard].exitcode for shard in sorted(waiting)
+                        if not self._workers[shard].is_alive()}
+                if not dead:
+                    continue
+                try:
+                    reply = self._outbox.get(timeout=LIVENESS_POLL)  # Sent just before exiting
+                except queue.Empty:
+                    raise RuntimeError(f"Shard process(es) exited without replying "
+                                       f"(shard: exit code): {dead}") from None
+            waiting.discard(reply[1])
+            replies.append(reply)
+        return replies
+
+    def __enter__(self) -> 'ShardedMarketplace':
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # Blocks
+
+    def post_tasks(self, specs: Iterable[Tuple[str, Sequence[str], float, Optional[str]]]) -> List[str]:
+        """Queue (consumer_id, required_skills, budget, bbllc_name) tasks for the next block"""
+        task_ids = []
+        for consumer_id, required_skills, budget, bbllc_name in specs:
+            index = len(self.tasks)
+            task_id = f"task_{index:08x}"
+            self.tasks.append((consumer_id, tuple(required_skills), budget, bbllc_name))
+            self.task_ids.append(task_id)
+            self._queued.append(index)
+            task_ids.append(task_id)
+        return task_ids
+
+    def run_block(self) -> Dict:
+        """Collect bids for the queued tasks from every shard, award them and settle"""
+        self.start()
+        started = time.perf_counter()
+        self.block_height += 1
+        block = self.block_height
+        queued, self._queued = self._queued, []
+
+        # Scatter: each shard gets only the tasks it has skills for
+        batches: List[List[Tuple[int, Tuple[str, ...], float]]] = [[] for _ in range(self.num_shards)]
+        for task in queued:
+            _, required, budget, _ = self.tasks[task]
+            for shard, skills in enumerate(self.shard_skills):
+                if not skills.isdisjoint(required):
+                    batches[shard].append((task, required, budget))
+
+        # Gather: one bid batch per shard, stored by shard so arrival order is irrelevant
+        replies: List[List[Tuple[int, Wei, int]]] = [[] for _ in range(self.num_shards)]
+        if self.processes:
+            sent = [shard for shard, batch in enumerate(batches) if batch]
+            for shard in sent:
+                self._inboxes[shard].put(("block", block, batches[shard]))
+            for _, shard, _, bids in self._gather(sent):
+                replies[shard] = bids
+        else:
+            for shard, batch in enumerate(batches):
+                if batch:
+                    replies[shard] = self._shards[shard].bid(batch)
+
+        # Deterministic merge: lowest bid per task wins, ties broken by agent index
+        bids = sorted(bid for shard_bids in replies for bid in shard_bids)
+        credits: List[List[Tuple[int, Wei]]] = [[] for _ in range(self.num_shards)]
+        awarded = 0
+        settled: Wei = 0
+        for task, amount, agent in bids:
+            if task in self.winners:
+                continue
+            self.winners[task] = (agent, amount)
+            credits[self.agent_shard[agent]].append((agent, amount))
+            bbllc_name = self.tasks[task][3]
+            self.volume_by_bbllc[bbllc_name] = self.volume_by_bbllc.get(bbllc_name, 0) + amount
+            awarded += 1
+            settled += amount
+
+        # Settlement batches back to the shards owning the winners (or straight into the shared funds column)
+        for shard, shard_credits in enumerate(credits):
+            if not shard_credits:
+                continue
+            if self.table is not None:
+                funds = self.table.columns["funds"]
+                for agent, amount in shard_credits:
+                    self._balances[agent] += amount
+                    funds[agent] = from_wei(self._balances[agent])
+            elif self.processes:
+                self._inboxes[shard].put(("settle", shard_credits))
+            else:
+                self._shards[shard].settle(shard_credits)
+
+        return {
+            "block": block,
+            "tasks": len(queued),
+            "bids": len(bids),
+            "awarded": awarded,
+            "settled_wei": settled,
+            "seconds": time.perf_counter() - started
+        }
+
+    def winner(self, task_id: str) -> Optional[Tuple[str, float]]:
+        """(agent_id, price) that won a task, if any"""
+        result = self.winners.get(int(task_id.split("_")[1], 16))
+        if result is None:
+            return None
+        agent, amount = result
+        return self.agent_ids[agent], from_wei(amount)
+
+
+def _demo_market(num_shards: int, processes: bool, num_agents: int, num_tasks: int, blocks: int,
+                 partition: str = "bbllc", shared_memory: bool = False):
+    import random
+
+    capabilities = ["data_analysis", "research", "reporting", "machine_learning",
+                    "web_development", "frontend", "backend", "writing"]
+    rng = random.Random(7)
+    market = ShardedMarketplace(num_shards, partition=partition, seed=7, processes=processes,
+                                shared_memory=shared_memory)
+    market.add_agents((f"Agent_{i}", rng.sample(capabilities, 3), rng.uniform(20.0, 200.0), f"BBLLC_{i % 64}")
+                      for i in range(num_agents))
+    specs = [[(f"Consumer_{b}_{t}", rng.sample(capabilities, 2), rng.uniform(100.0, 1000.0), f"BBLLC_{t % 64}")
+              for t in range(num_tasks)] for b in range(blocks)]
+    with market:
+        started = time.perf_counter()
+        bids = 0
+        for block_specs in specs:
+            market.post_tasks(block_specs)
+            bids += market.run_block()["bids"]
+        elapsed = time.perf_counter() - started
+        balances = market.close()
+    return bids, elapsed, market.winners, sum(balances.values())
+
+
+if __name__ == "__main__":
+    print("🧮 Sharded Marketplace")
+    print("=" * 50)
+    num_agents, num_tasks, blocks = 10000, 50, 4
+    _, _, reference, reference_funds = _demo_market(1, False, num_agents, num_tasks, blocks)
+    cores = os.cpu_count() or 1
+    for shards, shared in [(count, False) for count in sorted({1, 2, 4, cores})] + [(max(2, cores), True)]:
+        bids, elapsed, winners, funds = _demo_market(shards, True, num_agents, num_tasks, blocks, shared_memory=shared)
+        same = winners == reference and funds == reference_funds
+        label = " shared-memory" if shared else ""
+        print(f"{shards:>2}{label} shard(s): {bids:,} bids in {elapsed:.2f}s ({bids / elapsed:,.0f} bids/s), "
+              f"matches single-process result: {same}")
+    print(f"({cores} CPU core(s) available)")
@@ -0,0 +1,193 @@
+"""
+Multi-Tenant BB LLC Hosting
+
+Partitions a BlockchainSimulator's state by BB LLC so hundreds of LLCs can
+share one process. Each Tenant owns the indexes of its tasks, wallets
+(treasury included), authorizations and agents; the flat BlockchainSimulator
+dicts stay as the global view. The TenantRegistry keeps the cross-tenant
+indexes (task/wallet/agent -> tenant, skill -> tenants with open tasks), so
+cross-tenant queries visit only the tenants that can match instead of
+scanning all of them.
+
+Hot tenants are isolated with a per-block operation quota: work beyond a
+tenant's quota is deferred to its backlog and replayed in later blocks, so
+one busy LLC cannot crowd out the others.
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set
+
+
+class Tenant:
+    """State partition of one BB LLC"""
+
+    def __init__(self, name: str, record: dict, ops_per_block: Optional[int] = None):
+        self.name = name
+        self.record = record  # The BlockchainSimulator.bbllcs entry
+        self.ops_per_block = ops_per_block  # None: unlimited
+        self.tasks: Dict[str, object] = {}
+        self.wallets: Dict[str, object] = {}
+        self.auths: Dict[str, object] = {}
+        self.agents: Set[str] = set()
+        self.open_by_skill: Dict[str, Set[str]] = {}  # Skill -> ids of tasks posted needing it (pruned lazily)
+        self.ops_this_block = 0
+        self.backlog = deque()  # Deferred (task_id, *task spec) entries, replayed in later blocks
+        self.deferred = 0
+
+    @property
+    def treasury(self):
+        return self.record["treasury_wallet"]
+
+    def quota_left(self) -> Optional[int]:
+        if self.ops_per_block is None:
+            return None
+        return max(0, self.ops_per_block - self.ops_this_block)
+
+    def open_tasks(self, skill: Optional[str] = None) -> List:
+        """Tasks still open for bids, optionally only those needing a skill"""
+        if skill is None:
+            return [task for task in self.tasks.values() if task.status == "posted"]
+        return [self.tasks[task_id] for task_id in self._prune(skill)]
+
+    def wallet_total_wei(self) -> int:
+        return sum(wallet.funds_wei for wallet in self.wallets.values())
+
+    def stats(self) -> Dict:
+        return {
+            "tasks": len(self.tasks),
+            "open_tasks": sum(1 for task in self.tasks.values() if task.status == "posted"),
+            "agents": len(self.agents),
+            "wallets": len(self.wallets),
+            "treasury": self.treasury.funds,
+            "backlog": len(self.backlog),
+            "deferred": self.deferred
+        }
+
+    def _prune(self, skill: str) -> Set[str]:
+        """Drop tasks that left "posted" from a skill's open set"""
+        open_ids = self.open_by_skill.get(skill, set())
+        closed = [task_id for task_id in open_ids if self.tasks[task_id].status != "posted"]
+        open_ids.difference_update(closed)
+        return open_ids
+
+
+class TenantRegistry:
+    """Tenants by name plus the indexes that route cross-tenant queries"""
+
+    def __init__(self, ops_per_block: Optional[int] = None):
+        self.ops_per_block = ops_per_block  # Default per-tenant quota
+        self.tenants: Dict[str, Tenant] = {}
+        self.task_tenant: Dict[str, str] = {}
+        self.wallet_tenant: Dict[str, str] = {}
+        self.agent_tenant: Dict[str, str] = {}
+        self.skill_tenants: Dict[str, Set[str]] = {}  # Skill -> tenants that may have open tasks needing it
+        self.active: Set[str] = set()  # Tenants with operations in the current block
+        self.hot: Set[str] = set()  # Tenants that hit their quota (or still have a backlog)
+
+    def __len__(self) -> int:
+        return len(self.tenants)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.tenants
+
+    def add(self, name: str, record: dict, ops_per_block: Optional[int] = None) -> Tenant:
+        tenant = Tenant(name, record, ops_per_block if ops_per_block is not None else self.ops_per_block)
+        self.tenants[name] = tenant
+        self.add_wallet(name, record["treasury_wallet"])
+        return tenant
+
+    def get(self, name: str) -> Optional[Tenant]:
+        return self.tenants.get(name)
+
+    # Index maintenance
+
+    def add_task(self, name: str, task):
+        tenant = self.tenants[name]
+        tenant.tasks[task.task_id] = task
+        self.task_tenant[task.task_id] = name
+        for skill in task.required_skills:
+            tenant.open_by_skill.setdefault(skill, set()).add(task.task_id)
+            self.skill_tenants.setdefault(skill, set()).add(name)
+
+    def add_wallet(self, name: str, wallet, auth=None):
+        tenant = self.tenants[name]
+        tenant.wallets[wallet.address] = wallet
+        self.wallet_tenant[wallet.address] = name
+        if auth is not None:
+            tenant.auths[wallet.address] = auth
+
+    def add_agent(self, name: str, agent_id: str, wallet=None):
+        self.tenants[name].agents.add(agent_id)
+        self.agent_tenant[agent_id] = name
+        if wallet is not None:
+            self.add_wallet(name, wallet)
+
+    # Hot-tenant isolation
+
+    def admit(self, name: str, count: int = 1) -> int:
+        """How many of `count` operations the tenant may run this block (the rest are deferred)"""
+        tenant = self.tenants[name]
+        self.active.add(name)
+        left = tenant.quota_left()
+        allowed = count if left is None else min(count, left)
+        tenant.ops_this_block += allowed
+        if allowed < count:
+            tenant.deferred += count - allowed
+            self.hot.add(name)
+        return allowed
+
+    def end_block(self) -> Dict[str, List]:
+        """Reset quotas of tenants active this block; returns backlog specs due in the next block"""
+        for name in self.active:
+            self.tenants[name].ops_this_block = 0
+        self.active = set()
+
+        due: Dict[str, List] = {}
+        for name in list(self.hot):
+            tenant = self.tenants[name]
+            take = len(tenant.backlog) if tenant.ops_per_block is None else min(len(tenant.backlog), tenant.ops_per_block)
+            if take:
+                due[name] = [tenant.backlog.popleft() for _ in range(take)]
+            if not tenant.backlog:
+                self.hot.discard(name)
+        return due
+
+    # Cross-tenant queries
+
+    def tenant_of_task(self, task_id: str) -> Optional[Tenant]:
+        name = self.task_tenant.get(task_id)
+        return self.tenants[name] if name is not None else None
+
+    def tenant_of_wallet(self, address: str) -> Optional[Tenant]:
+        name = self.wallet_tenant.get(address)
+        return self.tenants[name] if name is not None else None
+
+    def tenant_of_agent(self, agent_id: str) -> Optional[Tenant]:
+        name = self.agent_tenant.get(agent_id)
+        return self.tenants[name] if name is not None else None
+
+    def tenants_needing(self, skill: str) -> List[str]:
+        """Tenants with at least one open task needing the skill"""
+        names = self.skill_tenants.get(skill, set())
+        emptied = [name for name in names if not self.tenants[name]._prune(skill)]
+        names.difference_update(emptied)
+        return sorted(names)
+
+    def open_tasks(self, skills: Iterable[str], limit: Optional[int] = None) -> List:
+        """Open tasks needing any of the skills, across tenants, visiting only tenants that have some"""
+        found = []
+        seen: Set[str] = set()
+        for skill in skills:
+            for name in self.tenants_needing(skill):
+                tenant = self.tenants[name]
+                for task_id in tenant.open_by_skill[skill]:
+                    if task_id not in seen:
+                        seen.add(task_id)
+                        found.append(tenant.tasks[task_id])
+                        if limit is not None and len(found) >= limit:
+                            return found
+        return found
+
+    def treasury_total_wei(self, names: Optional[Iterable[str]] = None) -> int:
+        names = self.tenants if names is None else names
+        return sum(self.tenants[name].treasury.funds_wei for name in names)
@@ -0,0 +1,6 @@
+"""Put the simulation modules (imported flat, e.g. `from dao_simulation import ...`) on sys.path"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
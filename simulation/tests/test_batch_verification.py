@@ -0,0 +1,71 @@
+from collections import Counter
+
+from oracle_integration import MissionVerificationOracle, VerificationStatus
+
+
+class CountingOracle(MissionVerificationOracle):
+    """Deterministic probes that count how often each (probe, deliverable) pair is checked"""
+
+    def __init__(self, oracle_id, **params):
+        super().__init__(oracle_id, **params)
+        self.checked = Counter()
+
+    def _probe(self, name, value):
+        self.checked[(name, repr(value))] += 1
+        return 0.5 + (sum(map(ord, repr(value))) + len(name)) % 50 / 100
+
+    def _check_website_accessibility(self, url):
+        return self._probe("accessibility", url)
+
+    def _check_responsive_design(self, url):
+        return self._probe("responsive", url)
+
+    def _check_performance_metrics(self, url):
+        return self._probe("performance", url)
+
+    def _check_security_vulnerabilities(self, url):
+        return self._probe("security", url)
+
+    def _check_code_quality(self, repository):
+        return self._probe("code_quality", repository)
+
+    def _assess_visualizations(self, charts):
+        return self._probe("visualizations", charts)
+
+
+def _web_missions():
+    return [(f"mission_{i}", {"url": f"https://site-{i % 2}.example.com", "repository": "https://git/dao"})
+            for i in range(6)]
+
+
+def test_duplicate_checks_run_once_per_batch():
+    oracle = CountingOracle("batch")
+    reports = oracle.verify_web_development_missions(_web_missions())
+    oracle.shutdown()
+
+    assert len(reports) == 6
+    assert set(oracle.checked.values()) == {1}
+    assert len(oracle.checked) == 2 * 4 + 1  # Four URL probes per site, one shared repository check
+
+    charts = ["bar", "line"]  # Unhashable deliverables are deduplicated by content
+    oracle.verify_data_analysis_missions([("a", {"charts": charts}), ("b", {"charts": list(charts)})])
+    assert oracle.checked[("visualizations", repr(charts))] == 1
+
+
+def test_batch_reports_match_single_verifications():
+    single = CountingOracle("single", max_workers=1)
+    batch = CountingOracle("batch")
+    missions = _web_missions()
+
+    expected = [single.verify_web_development_mission(mission_id, deliverables)
+                for mission_id, deliverables in missions]
+    reports = batch.verify_web_development_missions(missions)
+    batch.shutdown()
+
+    for one, many in zip(expected, reports):
+        assert many.data["mission_id"] == one.data["mission_id"]
+        assert many.data["checks"] == one.data["checks"]
+        assert many.data["overall_score"] == one.data["overall_score"]
+        assert many.verification_status == one.verification_status
+    assert any(report.verification_status == VerificationStatus.VERIFIED for report in reports)
+    assert len(batch.verification_history) == len(missions)
@@ -0,0 +1,43 @@
+import random
+
+import pytest
+
+from dao_simulation import DAOSimulation, MissionStatus
+from entity_store import ColumnarStore
+from population import PopulationGenerator
+
+
+def test_views_read_and_write_their_columns():
+    store = ColumnarStore()
+    agent = store.new_agent(address="agent_1", name="Ada", capabilities={"research"}, reputation=120.0)
+    agent.reputation += 5.0
+    assert store.agents.column("reputation")[agent._slot] == 125.0
+    assert store.total_reputation() == 125.0
+
+    member = store.new_member(address="member_1", name="Grace", token_balance=200.0, reputation=150.0)
+    assert store.voting_power_sum() == pytest.approx(member.token_balance * member.reputation / 100.0)
+
+
+def test_columnar_dao_matches_object_dao():
+    results = []
+    for columnar in (False, True):
+        random.seed(9)
+        dao = DAOSimulation(columnar=columnar)
+        PopulationGenerator(seed=4).populate_dao(dao, agents=200, members=50, missions=20)
+        dao.enable_mission_scheduler()
+        staffed = dao.dispatch_missions()
+        assert staffed
+        for mission_id in staffed:
+            dao.simulate_mission_execution(mission_id, days_to_simulate=10)
+
+        statuses = [mission.status.value for mission in dao.missions.values()]
+        reputation = [agent.reputation for agent in dao.agents.values()]
+        earnings = [agent.total_earnings for agent in dao.agents.values()]
+        results.append((statuses, reputation, earnings, dao.get_summary_stats()))
+        if columnar:
+            counts = dao.store.status_counts()["missions"]
+            assert sum(counts.values()) == len(dao.missions)
+            for status in MissionStatus:
+                assert counts[status.value] == statuses.count(status.value)
+    assert results[0] == results[1]
+    assert any(status != MissionStatus.CREATED.value for status in results[1][0])
@@ -0,0 +1,33 @@
+import pytest
+
+from ids import DenseIndex, IdAllocator, SequentialIdAllocator
+
+
+def test_sequential_keys_are_unique_and_parse_back():
+    for allocator in (SequentialIdAllocator(), SequentialIdAllocator(scramble=True)):
+        numbers = list(allocator.allocate_block("agent", 1000)) + [allocator.allocate("agent")]
+        assert numbers == list(range(1, 1002))
+        keys = [allocator.render("agent", number) for number in numbers]
+        assert len(set(keys)) == len(keys)
+        assert [allocator.parse("agent", key) for key in keys] == numbers
+        assert allocator.parse("mission", keys[0]) is None
+    assert SequentialIdAllocator().next_id("mission") == "mission_00000001"
+
+
+def test_allocators_must_draw_and_render():
+    class Partial(IdAllocator):
+        def allocate(self, kind):
+            return 1
+
+    with pytest.raises(TypeError):
+        IdAllocator()
+    with pytest.raises(TypeError):
+        Partial()
+
+
+def test_dense_index_slots_are_stable():
+    index = DenseIndex(["a", "b"])
+    assert index.intern_all(["b", "c", "a", "c"]) == [1, 2, 0, 2]
+    assert len(index) == 3
+    assert index.slot("d") is None
+    assert [index.key(slot) for slot in range(3)] == ["a", "b", "c"]
@@ -0,0 +1,86 @@
+import random
+
+import pytest
+
+from dao_simulation import DAOSimulation
+from message_bus import MessageBus
+
+
+def _bus(policy):
+    bus = MessageBus(queue_size=3, policy=policy)
+    for agent in ("a", "b", "c"):
+        bus.subscribe("mission", agent)
+    return bus
+
+
+def test_drop_oldest_keeps_latest_messages():
+    bus = _bus("drop_oldest")
+    assert bus.publish_batch("mission", "a", [("plan", i) for i in range(5)]) == 5
+    assert [message.payload for message in bus.drain("mission", "b")] == [2, 3, 4]
+    assert bus.pending("mission", "a") == 0  # Senders do not receive their own messages
+    assert bus.stats()["dropped"] == 4
+
+
+def test_drop_newest_keeps_earliest_messages():
+    bus = _bus("drop_newest")
+    bus.publish_batch("mission", "a", [("plan", i) for i in range(5)])
+    assert [message.payload for message in bus.drain("mission", "c", max_messages=2)] == [0, 1]
+    assert bus.pending("mission", "c") == 1
+    assert bus.stats()["delivered"] == 6
+
+
+def test_block_refuses_what_the_fullest_inbox_cannot_take():
+    bus = _bus("block")
+    assert bus.publish_batch("mission", "a", [("plan", 0), ("plan", 1)]) == 2
+    bus.drain("mission", "b")
+    assert bus.publish_batch("mission", "a", [("plan", i) for i in range(2, 5)]) == 1
+    assert not bus.publish("mission", "a", "plan", 5)
+    assert bus.pending("mission", "b") == 1
+    assert bus.pending("mission", "c") == 3
+    assert bus.stats()["refused"] == 3
+
+
+def test_unknown_policy_is_rejected():
+    with pytest.raises(ValueError):
+        MessageBus(policy="spill")
+    with pytest.raises(ValueError):
+        MessageBus().open("mission", policy="spill")
+
+
+def _mission_run(**bus_params):
+    dao = DAOSimulation()
+    dao.enable_message_bus(messages_per_agent=4, **bus_params)
+    for name in ("A", "B", "C"):
+        dao.add_agent(name, ["research"])
+    mission_id = dao.create_mission("Survey", "", {"research"}, budget=100.0, max_agents=3)
+    assert len(dao.assign_agents_to_mission(mission_id)) == 3
+    results = dao.simulate_mission_execution(mission_id, days_to_simulate=5)
+    return dao, dao.missions[mission_id], results
+
+
+def test_mission_traffic_flows_over_the_bus_and_the_topic_is_closed():
+    random.seed(1)
+    dao, mission, results = _mission_run()
+
+    assert mission.id not in dao.message_bus.topics  # Closed when the mission finished
+    stats = dao.message_bus.stats()
+    assert stats["published"] == 4 * 3 * len(results["daily_progress"])
+    assert stats["dropped"] == 0 and stats["queued"] == 0
+    assert len(mission.coordination_messages) == min(32, stats["published"])
+    assert {message["topic"] for message in mission.coordination_messages} == {mission.id}
+    events = results["coordination_events"]
+    assert len(events) == len(results["daily_progress"])
+    for event in events:
+        assert sorted(event["participants"]) == sorted(mission.assigned_agents)  # Every agent was subscribed
+        assert event["messages"] == 4 * 3 * 2 and 0.5 <= event["effectiveness"] <= 1.0
+
+
+def test_small_inboxes_scale_down_coordination_effectiveness():
+    random.seed(1)
+    _, _, results = _mission_run(queue_size=2, policy="drop_newest")
+
+    events = results["coordination_events"]
+    assert events
+    for event in events:
+        assert event["messages"] == 3 * 2  # Each agent reads the two messages its inbox kept
+        assert event["effectiveness"] <= 0.25  # 6 of the 24 messages sent got through
@@ -0,0 +1,40 @@
+from dao_simulation import DAOSimulation
+from metrics_recorder import MetricsRecorder
+
+
+def _dao(agents):
+    dao = DAOSimulation()
+    addresses = dao.add_agents((f"Agent{i}", ["research"], 1000.0) for i in range(agents))
+    for i, address in enumerate(addresses):
+        dao.agents[address].reputation = float(i)
+    return dao
+
+
+def test_quantiles_are_opt_in():
+    recorder = MetricsRecorder()
+    recorder.record_tick(_dao(10))
+
+    assert "reputation_p50" not in recorder.columns
+    assert list(recorder.columns["tick"]) == [0.0]
+
+
+def test_quantiles_exact_below_sample_size_and_sampled_above():
+    exact = MetricsRecorder(reputation_quantiles=True, quantile_sample=100)
+    exact.record_tick(_dao(100))
+    assert [exact.columns[f"reputation_{q}"][0] for q in ("min", "p50", "max")] == [0.0, 50.0, 99.0]
+
+    sampled = MetricsRecorder(reputation_quantiles=True, quantile_sample=500, seed=1)
+    sampled.record_tick(_dao(5000))
+    assert 2000.0 < sampled.columns["reputation_p50"][0] < 3000.0
+    assert sampled.columns["reputation_min"][0] <= sampled.columns["reputation_p10"][0]
+
+
+def test_every_row_carries_the_same_columns():
+    dao = _dao(10)
+    recorder = MetricsRecorder(reputation_quantiles=True)
+    recorder.record_tick(dao)
+    dao.agents[dao._agent_order[0]].reputation = 50.0
+    recorder.record_tick(dao)
+
+    assert len(recorder) == 2
+    assert list(recorder.columns["reputation_min"]) == [0.0, 1.0]
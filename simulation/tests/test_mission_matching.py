@@ -0,0 +1,66 @@
+from dao_simulation import DAOSimulation, MissionStatus
+from mission_matching import AuctionMatcher
+
+
+def _dao(agents):
+    dao = DAOSimulation()
+    for i in range(agents):
+        dao.add_agent(f"Agent{i}", ["research"])
+    return dao
+
+
+def _missions(dao, count):
+    return [dao.create_mission(f"M{i}", "", {"research"}, 100, max_agents=1) for i in range(count)]
+
+
+def test_agents_never_exceed_capacity():
+    dao = _dao(agents=1)
+    missions = _missions(dao, 3)
+    matcher = AuctionMatcher(capacity=2)
+
+    matcher.solve(dao, missions)
+    assigned = matcher.commit(dao)
+
+    assert len(assigned) == 2
+    assert len(next(iter(dao.agents.values())).active_missions) == 2
+    assert sum(dao.missions[m].status == MissionStatus.CREATED for m in missions) == 1
+
+
+def test_eviction_moves_slot_to_next_agent():
+    dao = _dao(agents=2)
+    missions = _missions(dao, 2)
+    matcher = AuctionMatcher(capacity=1)
+
+    matcher.solve(dao, missions)
+    assigned = matcher.commit(dao)
+
+    assert sorted(agent for agents in assigned.values() for agent in agents) == sorted(dao.agents)
+
+
+def test_agent_filled_outside_the_auction_is_not_bid_for():
+    dao = _dao(agents=1)
+    pending, elsewhere = _missions(dao, 2)
+    matcher = AuctionMatcher(capacity=1)
+    matcher.solve(dao, [pending], time_budget=0)  # Candidates collected, no bids yet
+    dao.assign_agents_to_mission(elsewhere)
+
+    stats = matcher.solve(dao, [])
+
+    assert stats["completed"] and stats["filled"] == 0
+    assert matcher.commit(dao) == {}
+    assert dao.missions[pending].status == MissionStatus.CREATED
+
+
+def test_commit_skips_stale_missions_and_full_agents():
+    dao = _dao(agents=1)
+    stale, full, elsewhere = _missions(dao, 3)
+    matcher = AuctionMatcher(capacity=1)
+    matcher.solve(dao, [stale])
+    dao.missions[stale].status = MissionStatus.FAILED
+    assert matcher.commit(dao) == {}
+
+    matcher.solve(dao, [full])
+    dao.assign_agents_to_mission(elsewhere)
+    assert matcher.commit(dao) == {}
+    assert dao.missions[full].status == MissionStatus.CREATED
+    assert len(next(iter(dao.agents.values())).active_missions) == 1
@@ -0,0 +1,104 @@
+from datetime import timedelta
+
+from dao_simulation import DAOSimulation, MissionStatus, ProposalState
+
+
+def _dao(agents=2, **params):
+    dao = DAOSimulation()
+    for i in range(agents):
+        dao.add_agent(f"Agent{i}", ["research"])
+    dao.enable_mission_scheduler(**params)
+    return dao
+
+
+def _passed_proposal(dao, member):
+    proposal_id = dao.create_proposal(member, "Research", "More research", {
+        "title": "Research", "description": "More research", "required_capabilities": ["research"],
+        "budget": 1000, "deadline_days": 30, "max_agents": 1
+    })
+    dao.vote_on_proposal(proposal_id, member, True)
+    return proposal_id
+
+
+def test_dispatch_staffs_most_urgent_first():
+    dao = _dao(agents=1)
+    late = dao.create_mission("Late", "", {"research"}, 5000, deadline_days=20, max_agents=1)
+    urgent = dao.create_mission("Urgent", "", {"research"}, 100, deadline_days=5, max_agents=1)
+
+    assert list(dao.dispatch_missions()) == [urgent]
+    assert dao.missions[late].status == MissionStatus.CREATED
+    assert dao.get_mission_queue_metrics()["queue_depth"] == 1
+
+
+def test_overdue_missions_expire():
+    dao = _dao(agents=0)
+    mission_id = dao.create_mission("Soon", "", {"research"}, 100, deadline_days=1)
+
+    dao.advance_time(timedelta(days=2))
+
+    assert dao.missions[mission_id].status == MissionStatus.FAILED
+    metrics = dao.get_mission_queue_metrics()
+    assert metrics["expired"] == 1 and metrics["queue_depth"] == 0
+
+
+def test_freed_agent_is_staffed_again():
+    dao = _dao(agents=1)
+    first = dao.create_mission("First", "", {"research"}, 100, deadline_days=5, max_agents=1)
+    second = dao.create_mission("Second", "", {"research"}, 100, deadline_days=9, max_agents=1)
+    dao.dispatch_missions()
+    assert dao.missions[second].status == MissionStatus.CREATED
+
+    agent = dao.agents[dao.missions[first].assigned_agents[0]]
+    dao._release_agent(agent, first)
+    dao.missions[first].status = MissionStatus.COMPLETED
+
+    assert list(dao.dispatch_missions()) == [second]
+
+
+def test_create_mission_refused_under_backpressure():
+    dao = _dao(agents=1, saturation=0.5, saturated_backlog=0)
+    dao.create_mission("Busy", "", {"research"}, 100, max_agents=1)
+    dao.dispatch_missions()
+
+    assert dao.create_mission("Refused", "", {"research"}, 100) is None
+    assert dao.create_missions([("Refused", "", {"research"}, 100, 30, 1)]) == []
+    assert dao.get_mission_queue_metrics()["rejected"] == 2
+
+
+def test_backpressured_proposal_is_executed_once_agents_free_up():
+    dao = _dao(agents=1, saturation=0.5, saturated_backlog=0)
+    member = dao.add_member("Alice", 1000)
+    busy = dao.create_mission("Busy", "", {"research"}, 100, max_agents=1)
+    dao.dispatch_missions()
+    proposal_id = _passed_proposal(dao, member)
+
+    dao.advance_time(timedelta(days=dao.voting_period_days))
+    assert dao.proposals[proposal_id].state == ProposalState.SUCCEEDED
+    assert dao.get_mission_queue_metrics()["deferred_proposals"] == 1
+
+    agent = dao.agents[dao.missions[busy].assigned_agents[0]]
+    dao._release_agent(agent, busy)
+    dao.missions[busy].status = MissionStatus.COMPLETED
+    dao.advance_time(timedelta(days=1))
+
+    assert dao.proposals[proposal_id].state == ProposalState.EXECUTED
+    assert dao.get_mission_queue_metrics()["deferred_proposals"] == 0
+    staffed = [m for m in dao.missions.values() if m.title == "Research"]
+    assert len(staffed) == 1 and staffed[0].status == MissionStatus.IN_PROGRESS
+
+
+def test_ranking_follows_reputation_changes_of_released_agents():
+    dao = _dao(agents=2)
+    first, second = dao._agent_order
+    dao.agents[first].reputation, dao.agents[second].reputation = 90.0, 10.0
+    mission_id = dao.create_mission("One", "", {"research"}, 100, max_agents=1)
+    assert dao.dispatch_missions() == {mission_id: [first]}
+    assert [address for _, _, address in dao.mission_scheduler.idle["research"]] == [second]
+
+    dao._release_agent(dao.agents[first], mission_id)
+    dao.missions[mission_id].status = MissionStatus.COMPLETED
+    dao.agents[first].reputation = 5.0
+    dao.dispatch_missions()
+    ranked = [address for _, _, address in dao.mission_scheduler.idle["research"]]
+
+    assert ranked == [second, first]
@@ -0,0 +1,39 @@
+import math
+
+import pytest
+
+from money import WEI, bulk_transfer, split_proportional, to_wei
+
+
+def test_to_wei_is_exact_for_decimal_inputs():
+    assert to_wei(3) == 3 * WEI
+    assert to_wei(0.1) == 10 ** 17
+    assert to_wei("1.5") == 15 * 10 ** 17
+    assert to_wei("-2.25e1") == -225 * 10 ** 17
+    assert to_wei("0.0000000000000000005") == 1  # Rounds half away from zero
+
+
+@pytest.mark.parametrize("amount", [math.inf, -math.inf, math.nan, "inf", "-Infinity", "nan"])
+def test_to_wei_rejects_non_finite_amounts(amount):
+    with pytest.raises(ValueError, match="non-finite"):
+        to_wei(amount)
+
+
+def test_split_proportional_sums_to_total():
+    total = to_wei(100) + 7
+    parts = split_proportional(total, [1 / 3, 1 / 3, 1 / 3, 0.0])
+    assert sum(parts) == total
+    assert parts[3] == 0
+    assert max(parts[:3]) - min(parts[:3]) <= 1
+    assert split_proportional(total, [0.0, 0.0]) == [0, 0]
+
+
+def test_bulk_transfer_is_atomic():
+    balances = {"a": 100, "b": 10}
+    assert not bulk_transfer(balances, ["a", "b"], ["c", "c"], [50, 11])
+    assert balances == {"a": 100, "b": 10}
+    assert not bulk_transfer(balances, ["a"], ["c"], [-1])
+    assert balances == {"a": 100, "b": 10}
+
+    assert bulk_transfer(balances, ["a", "a", "b"], ["c", "b", "c"], [60, 40, 10])
+    assert balances == {"a": 0, "b": 40, "c": 70}
@@ -0,0 +1,29 @@
+from datetime import datetime
+
+from oracle_integration import OracleCache, OracleData, OracleType
+
+
+def _data(value):
+    return OracleData(oracle_id="market", oracle_type=OracleType.MARKET_DATA, data={"value": value},
+                      timestamp=datetime.now(), confidence_score=1.0, source="test")
+
+
+def test_stale_entries_are_served_while_refreshed_once():
+    now = [0.0]
+    cache = OracleCache(default_ttl=10.0, ttls={OracleType.MARKET_DATA: 10.0}, stale_ttl=10.0,
+                        clock=lambda: now[0])
+    fetched = []
+
+    def fetch():
+        fetched.append(now[0])
+        return _data(len(fetched))
+
+    assert cache.get_or_fetch("market", "price", ("ETH",), OracleType.MARKET_DATA, fetch).data["value"] == 1
+    now[0] = 15.0
+    stale = cache.get_or_fetch("market", "price", ("ETH",), OracleType.MARKET_DATA, fetch)
+    cache.shutdown()  # Waits for the background refresh
+
+    assert stale.data["value"] == 1
+    assert cache.get_or_fetch("market", "price", ("ETH",), OracleType.MARKET_DATA, fetch).data["value"] == 2
+    stats = cache.get_stats()
+    assert (stats["misses"], stats["stale_hits"], stats["hits"], stats["refreshes"]) == (1, 1, 1, 1)
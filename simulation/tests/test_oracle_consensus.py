@@ -0,0 +1,88 @@
+from datetime import datetime
+
+from oracle_consensus import OracleReport, StreamingConsensus
+from oracle_integration import OracleAggregator, OracleData, OracleType, VerificationStatus
+
+
+class FixedOracle:
+    """Verification oracle with a fixed verdict, taking part through the capability protocol"""
+
+    def __init__(self, oracle_id, verified, role="automated"):
+        self.oracle_id = oracle_id
+        self.verified = verified
+        self.verification_role = role
+
+    def verification_call(self, mission_id, deliverables, mission_type):
+        return lambda: OracleData(
+            oracle_id=self.oracle_id, oracle_type=OracleType.PERFORMANCE_VERIFICATION, data={},
+            timestamp=datetime.now(), confidence_score=0.9, source="test",
+            verification_status=VerificationStatus.VERIFIED if self.verified else VerificationStatus.FAILED)
+
+
+def test_verdict_without_excludes_the_oracle_itself():
+    consensus = StreamingConsensus(threshold=0.7)
+    reports = [OracleReport(f"o{i}", verified=i < 4, confidence=0.9, weight=1.0) for i in range(5)]
+    for report in reports:
+        consensus.add(report)
+
+    assert consensus.result()["consensus"]
+    assert [consensus.verdict_without(r) for r in reports] == [True] * 5
+    lone = StreamingConsensus()
+    lone.add(reports[0])
+    assert lone.verdict_without(reports[0]) is None
+
+
+def test_accuracy_is_learned_leave_one_out():
+    aggregator = OracleAggregator()
+    aggregator.consensus_threshold = 0.5
+    aggregator.register_oracle("a", FixedOracle("a", True))
+    aggregator.register_oracle("b", FixedOracle("b", False))
+
+    aggregator.get_consensus_verification("m1", {}, "web_development")
+    aggregator.shutdown()
+
+    # Each oracle is judged by the other one alone, so both disagree; a dissenter
+    # is never credited for agreeing with itself
+    assert aggregator.accuracy.agreements == {}
+    assert aggregator.accuracy.observations == {"a": 1.0, "b": 1.0}
+
+
+def test_oracles_take_part_by_verification_role():
+    aggregator = OracleAggregator()
+    aggregator.register_oracle("human", FixedOracle("human", True, role="human"))
+    assert aggregator.get_consensus_verification("m1", {}, "web_development")["verifications"] == []
+
+    aggregator.register_oracle("auto", FixedOracle("auto", True))
+    aggregator.register_oracle("other", object())
+    result = aggregator.get_consensus_verification("m1", {}, "web_development")
+    aggregator.shutdown()
+
+    assert set(result["weights"]) <= {"auto", "human"} and result["consensus"]
+
+
+def test_excluded_outliers_keep_an_early_exit_open():
+    consensus = StreamingConsensus(threshold=0.7)
+    for i, score in enumerate([0.80, 0.81, 0.82, 0.83]):
+        consensus.add(OracleReport(f"v{i}", verified=True, confidence=0.9, weight=1.0, score=score))
+    for i in range(2):
+        consensus.add(OracleReport(f"f{i}", verified=False, confidence=0.9, weight=1.0, score=0.3))
+    assert consensus.result()["consensus"] and len(consensus.result()["outliers"]) == 2
+
+    # The failed reports could still count once more scores arrive
+    assert not consensus.is_settled(0.25)
+    for i, score in enumerate([0.35, 0.40, 0.45, 0.50, 0.55]):
+        consensus.add(OracleReport(f"late{i}", verified=False, confidence=0.9, weight=0.05, score=score))
+    assert consensus.result()["outliers"] == []
+    assert not consensus.result()["consensus"]
+
+
+def test_unscored_or_too_few_reports_still_settle_early():
+    consensus = StreamingConsensus(threshold=0.7)
+    for i in range(4):
+        consensus.add(OracleReport(f"u{i}", verified=True, confidence=0.9, weight=1.0))
+    assert consensus.is_settled(1.0)
+
+    small = StreamingConsensus(threshold=0.7)
+    small.add(OracleReport("s", verified=False, confidence=0.9, weight=1.0, score=0.2))
+    assert small.is_settled(0.3, outstanding_reports=1)
+    assert not small.is_settled(0.3, outstanding_reports=2)
@@ -0,0 +1,76 @@
+import threading
+import time
+from datetime import datetime
+
+from oracle_integration import OracleAggregator, OracleData, OracleType, VerificationStatus
+
+
+class ScriptedOracle:
+    """Verification oracle whose call verifies, raises or blocks until released"""
+
+    verification_role = "automated"
+
+    def __init__(self, oracle_id, raises=False, release=None):
+        self.oracle_id = oracle_id
+        self.raises = raises
+        self.release = release
+        self.calls = 0
+
+    def verification_call(self, mission_id, deliverables, mission_type):
+        return self._verify
+
+    def _verify(self):
+        self.calls += 1
+        if self.release is not None:
+            self.release.wait(5.0)
+        if self.raises:
+            raise RuntimeError("oracle down")
+        return OracleData(
+            oracle_id=self.oracle_id, oracle_type=OracleType.PERFORMANCE_VERIFICATION, data={},
+            timestamp=datetime.now(), confidence_score=0.9, source="test",
+            verification_status=VerificationStatus.VERIFIED)
+
+
+def _aggregator(**oracles):
+    aggregator = OracleAggregator()
+    aggregator.learn_from_consensus = False
+    for oracle_id, (oracle, timeout) in oracles.items():
+        aggregator.register_oracle(oracle_id, oracle, timeout=timeout)
+    return aggregator
+
+
+def test_slow_oracle_times_out_and_raising_oracle_is_isolated():
+    release = threading.Event()
+    aggregator = _aggregator(fast=(ScriptedOracle("fast"), None),
+                             slow=(ScriptedOracle("slow", release=release), 0.05),
+                             broken=(ScriptedOracle("broken", raises=True), None))
+    try:
+        started = time.monotonic()
+        result = aggregator.get_consensus_verification("m1", {}, "web_development")
+        assert time.monotonic() - started < 2.0
+    finally:
+        release.set()
+        aggregator.shutdown()
+
+    assert result["timed_out"] == ["slow"]
+    assert result["failed"] == ["broken"]
+    assert len(result["verifications"]) == 1 and result["consensus"]
+    assert not result["early_exit"]
+
+
+def test_quorum_exits_without_waiting_for_a_straggler():
+    release = threading.Event()
+    oracles = {f"v{i}": (ScriptedOracle(f"v{i}"), None) for i in range(4)}
+    straggler = ScriptedOracle("straggler", release=release)
+    aggregator = _aggregator(straggler=(straggler, 5.0), **oracles)
+    try:
+        started = time.monotonic()
+        result = aggregator.get_consensus_verification("m1", {}, "web_development")
+        assert time.monotonic() - started < 2.0
+    finally:
+        release.set()
+        aggregator.shutdown()
+
+    assert result["early_exit"] and result["consensus"]
+    assert len(result["verifications"]) == 4
+    assert result["timed_out"] == [] and result["failed"] == []
@@ -0,0 +1,30 @@
+import pytest
+
+from oracle_history import ObservationSeries, RetentionPolicy
+
+
+def test_ring_buffer_keeps_the_newest_observations_in_order():
+    series = ObservationSeries(RetentionPolicy(capacity=5, max_age=None))
+    for t in range(12):
+        series.append(float(t), t * 10.0, volume=t + 1.0)
+
+    assert len(series) == 5
+    assert series.dropped == 7
+    assert [row[0] for row in series.window(0.0)] == [7.0, 8.0, 9.0, 10.0, 11.0]
+    assert [row[1] for row in series.window(9.5)] == [100.0, 110.0]
+    assert series.latest() == (11.0, 110.0, 1.0, 12.0)
+    assert series.rolling_mean(3.0, now=11.0) == pytest.approx((80.0 + 90.0 + 100.0 + 110.0) / 4)
+    assert series.vwap(1.0, now=11.0) == pytest.approx((100.0 * 11 + 110.0 * 12) / 23)
+
+
+def test_age_retention_and_downsampling():
+    series = ObservationSeries(RetentionPolicy(capacity=100, max_age=10.0))
+    for t in range(30):
+        series.append(float(t), float(t), volume=1.0)
+    assert [row[0] for row in series.window(float('-inf'))][0] == 19.0  # 29 - max_age
+    series.apply_retention(now=35.0)
+    assert len(series) == 5
+
+    rollup = series.downsample(2.0)
+    assert [(row[0], row[1], row[3]) for row in rollup.window(float('-inf'))] == [
+        (24.0, 25.0, 1.0), (26.0, 26.5, 2.0), (28.0, 28.5, 2.0)]
@@ -0,0 +1,77 @@
+import random
+
+from org_graph import OrganizationGraph
+
+
+def _edges(graph, agents, relation="connects"):
+    return {(source, target) for source in agents for target in graph.neighbors(source, relation)}
+
+
+def _incoming(graph, agents, relation="connects"):
+    return {(source, target) for target in agents for source in graph.neighbors(target, relation, "in")}
+
+
+def test_incremental_updates_match_a_rebuilt_graph():
+    rng = random.Random(3)
+    agents = [f"agent_{i}" for i in range(40)]
+    expected = {(rng.choice(agents), rng.choice(agents)) for _ in range(150)}
+    graph = OrganizationGraph()
+    graph.add_nodes(agents)
+    graph.bulk_load("connects", sorted(expected))
+
+    for step in range(600):
+        edge = (rng.choice(agents), rng.choice(agents))
+        if rng.random() < 0.5:
+            assert graph.add_edge("connects", *edge) == (edge not in expected)
+            expected.add(edge)
+        else:
+            assert graph.remove_edge("connects", *edge) == (edge in expected)
+            expected.discard(edge)
+        if step % 150 == 149:
+            graph.compact()
+            assert not graph.out["connects"].delta
+
+        assert graph.edge_count() == len(expected)
+    assert _edges(graph, agents) == expected
+    assert _incoming(graph, agents) == expected
+
+    rebuilt = OrganizationGraph()
+    rebuilt.add_nodes(agents)
+    rebuilt.bulk_load("connects", expected)
+    graph.compact()
+    for agent in agents:
+        assert graph.neighbors(agent) == rebuilt.neighbors(agent)
+        assert graph.neighbors(agent, direction="in") == rebuilt.neighbors(agent, direction="in")
+
+
+def test_removed_then_re_added_edge_and_new_nodes():
+    graph = OrganizationGraph.from_connections({"a": ["b", "c"], "b": ["c"]})
+    assert graph.remove_edge("connects", "a", "b")
+    assert not graph.remove_edge("connects", "a", "b")
+    assert not graph.remove_edge("connects", "a", "unknown")
+    assert graph.neighbors("a") == ["c"]
+    assert graph.add_edge("connects", "a", "b")
+    assert sorted(graph.neighbors("a")) == ["b", "c"]
+
+    assert graph.add_edge("connects", "d", "a")  # Nodes beyond the CSR arrays
+    assert graph.neighbors("d") == ["a"]
+    assert sorted(graph.neighbors("a", direction="in")) == ["d"]
+    graph.compact()
+    assert graph.neighbors("a") == ["b", "c"]
+    assert graph.neighbors("d") == ["a"]
+    assert graph.edge_count() == 4
+
+
+def test_chains_follow_updates():
+    graph = OrganizationGraph()
+    graph.bulk_load("reports_to", [("c", "b"), ("b", "a")])
+    assert graph.reporting_chain("c") == ["b", "a"]
+    graph.set_manager("b", "d")
+    assert graph.reporting_chain("c") == ["b", "d"]
+    assert graph.direct_reports("a") == []
+    assert sorted(graph.subordinates("d")) == ["b", "c"]
+
+    graph.add_edge("delegates_to", "x", "y")
+    graph.add_edge("delegates_to", "y", "x")  # Cycles stop the walk
+    assert graph.delegation_chain("x") == ["y"]
+    assert graph.final_delegate("z") == "z"
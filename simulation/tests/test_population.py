@@ -0,0 +1,25 @@
+from dao_simulation import DAOSimulation
+from population import DEFAULT_CAPABILITIES, PopulationGenerator
+
+
+def test_same_seed_builds_the_same_population():
+    daos = []
+    for _ in range(2):
+        dao = DAOSimulation()
+        PopulationGenerator(seed=21).populate_dao(dao, agents=100, members=40, missions=10)
+        daos.append(dao)
+    first, second = daos
+    assert [agent.capabilities for agent in first.agents.values()] == \
+        [agent.capabilities for agent in second.agents.values()]
+    assert [member.token_balance for member in first.members.values()] == \
+        [member.token_balance for member in second.members.values()]
+    assert [mission.budget for mission in first.missions.values()] == \
+        [mission.budget for mission in second.missions.values()]
+
+
+def test_specs_follow_the_configured_distributions():
+    generator = PopulationGenerator(seed=2, capabilities_per_agent=(2, 3), min_balance=100.0)
+    for _, capabilities, _ in generator.agent_specs(200):
+        assert 2 <= len(capabilities) <= 3
+        assert set(capabilities) <= set(DEFAULT_CAPABILITIES)
+    assert all(balance >= 100.0 for _, balance in generator.member_specs(200))
@@ -0,0 +1,34 @@
+import time
+
+import profiling
+
+
+@profiling.profiled("test.outer")
+def _outer():
+    with profiling.span("test.inner"):
+        time.sleep(0.002)
+    return "done"
+
+
+def test_profiled_records_calls_time_and_nesting():
+    profiler = profiling.enable()
+    try:
+        assert [_outer() for _ in range(3)] == ["done"] * 3
+    finally:
+        assert profiling.disable() is profiler
+
+    report = profiler.report()
+    assert report["test.outer"]["count"] == report["test.inner"]["count"] == 3
+    assert report["test.outer"]["total_seconds"] >= report["test.inner"]["total_seconds"] >= 0.006
+    assert 0 < report["test.inner"]["p50_seconds"] <= report["test.inner"]["max_seconds"]
+    assert [line.split()[0] for line in profiler.collapsed_stacks()] == ["test.outer", "test.outer;test.inner"]
+
+
+def test_nothing_is_recorded_while_disabled():
+    profiler = profiling.enable()
+    profiling.disable()
+    assert _outer() == "done"
+    assert profiling.span("test.inner") is profiling.NULL_SPAN
+    assert profiling.traced("test.call", _outer) is _outer
+    assert profiling.get_profiler() is None
+    assert profiler.report() == {}
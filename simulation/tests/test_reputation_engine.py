@@ -0,0 +1,58 @@
+import pytest
+
+from reputation_engine import ReputationEngine
+
+
+def _engine(**params):
+    engine = ReputationEngine(**params)
+    for address in ("a", "b", "c"):
+        slot = engine.slot(address)
+        engine.table.columns["reputation"][slot] = 100.0
+        engine.table.columns["staked_amount"][slot] = 1000.0
+    return engine
+
+
+def _reputation(engine, address):
+    return engine.table.columns["reputation"][engine.table.index.slot(address)]
+
+
+def test_epoch_applies_buffered_results_only_once():
+    engine = _engine(grace_epochs=10)
+    engine.record_performance("a", 1.0, True, ["research"])
+    engine.record_performance("a", 0.9, False, ["research"])
+    engine.record_performance("b", 0.0, False)
+    assert _reputation(engine, "a") == 100.0  # Nothing moves before the epoch
+
+    report = engine.run_epoch()
+    assert report["agents_updated"] == 2
+    assert _reputation(engine, "a") == pytest.approx(100.0 + (0.5 + 0.4) * 0.1 * 10.0)
+    assert _reputation(engine, "b") == pytest.approx(99.5)
+    assert engine.success_rate("a") == 0.5
+    assert engine.skill_rating("a", "research") == pytest.approx((50.0 * 0.8 + 100.0 * 0.2) * 0.8 + 90.0 * 0.2)
+    assert engine.skill_rating("c", "research") == 50.0
+    assert engine.pending_events() == 0
+
+    engine.run_epoch()
+    assert _reputation(engine, "a") == pytest.approx(100.9)
+
+
+def test_reputation_is_clamped_and_inactive_agents_decay():
+    engine = _engine(grace_epochs=0, decay_half_life=1.0, high=100.2)
+    engine.record_performance("a", 1.0, True)
+    engine.run_epoch()
+    assert _reputation(engine, "a") == 100.2  # Clamped to high, active so not decayed
+    assert _reputation(engine, "b") == 100.0  # At the decay target already
+
+    engine.table.columns["reputation"][engine.table.index.slot("c")] = 40.0
+    engine.run_epoch()
+    assert _reputation(engine, "c") == pytest.approx(70.0)
+    assert _reputation(engine, "a") == pytest.approx(100.1)
+
+
+def test_violations_slash_stake_and_reputation():
+    engine = _engine()
+    engine.record_violation("b", severity=2.0)
+    report = engine.run_epoch()
+    assert report["stake_slashed"] == pytest.approx(200.0)
+    assert engine.table.columns["staked_amount"][engine.table.index.slot("b")] == pytest.approx(800.0)
+    assert _reputation(engine, "b") == pytest.approx(80.0)
@@ -0,0 +1,50 @@
+import pytest
+
+from sharded_simulation import ShardedMarketplace, _demo_market
+
+
+def test_in_process_shards_match_single_shard():
+    reference = _demo_market(1, False, num_agents=300, num_tasks=20, blocks=3)
+    for partition in ("bbllc", "capability"):
+        bids, _, winners, funds = _demo_market(4, False, num_agents=300, num_tasks=20, blocks=3,
+                                               partition=partition)
+        assert (bids, winners, funds) == (reference[0], reference[2], reference[3])
+
+
+@pytest.mark.parametrize("shared_memory", [False, True])
+def test_worker_processes_match_serial_run(shared_memory):
+    reference = _demo_market(1, False, num_agents=300, num_tasks=20, blocks=3)
+    bids, _, winners, funds = _demo_market(3, True, num_agents=300, num_tasks=20, blocks=3,
+                                           shared_memory=shared_memory)
+    assert (bids, winners, funds) == (reference[0], reference[2], reference[3])
+
+
+def test_dead_shard_raises_instead_of_hanging():
+    market = ShardedMarketplace(2, partition="capability", seed=1)
+    market.add_agents([("a", ["research"], 10.0, None), ("b", ["writing"], 10.0, None)])
+    market.start()
+    for worker in market._workers:
+        worker.terminate()
+        worker.join()
+    market.post_tasks([("consumer", ["research", "writing"], 100.0, None)])
+
+    with pytest.raises(RuntimeError, match="exited without replying"):
+        market.run_block()
+    with pytest.raises(RuntimeError):
+        market.close()
+    assert not market.started and market._workers == []
+
+
+@pytest.mark.parametrize("processes", [False, True])
+def test_closed_marketplace_refuses_to_restart(processes):
+    market = ShardedMarketplace(2, seed=1, processes=processes)
+    market.add_agents([("a", ["research"], 10.0, None)])
+    market.post_tasks([("consumer", ["research"], 5.0, None)])
+    market.run_block()
+    assert set(market.close()) == {"a"} and market.closed
+
+    with pytest.raises(RuntimeError, match="closed"):
+        market.run_block()
+    with pytest.raises(RuntimeError):
+        market.add_agents([("b", ["research"], 10.0, None)])
+    assert market.close() == {}
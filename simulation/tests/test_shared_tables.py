@@ -0,0 +1,23 @@
+import heapq
+
+from dao_simulation import DAOSimulation
+from population import PopulationGenerator
+from shared_tables import ParallelScorer, SharedAgentTable
+
+
+def test_parallel_scores_match_serial_scoring():
+    dao = DAOSimulation()
+    PopulationGenerator(seed=6).populate_dao(dao, agents=300, missions=12)
+    missions = list(dao.missions.values())
+
+    with SharedAgentTable.from_dao(dao) as table, ParallelScorer(table, processes=2) as scorer:
+        assert table.capabilities_of(0) == sorted(dao.agents[dao._agent_order[0]].capabilities)
+        results = scorer.score([(mission.required_capabilities, mission.max_agents) for mission in missions]
+                               + [(["unknown_skill"], 3)])
+
+    assert results[-1] == []
+    for mission, top in zip(missions, results):
+        qualified = [(dao._agent_mission_score(agent, mission), agent.address) for agent in dao.agents.values()
+                     if agent.can_perform_mission(mission.required_capabilities)]
+        assert [dao._agent_order[slot] for slot, _ in top] == \
+            [address for _, address in heapq.nlargest(mission.max_agents, qualified)]
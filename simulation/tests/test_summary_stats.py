@@ -0,0 +1,29 @@
+import pytest
+
+from dao_simulation import DAOSimulation
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_direct_reputation_assignment_keeps_the_average(columnar):
+    dao = DAOSimulation(columnar=columnar)
+    addresses = dao.add_agents((f"Agent{i}", ["research"], 1000.0) for i in range(10))
+    for i, address in enumerate(addresses):
+        dao.agents[address].reputation = float(i)
+    assert dao.get_summary_stats()["avg_agent_reputation"] == pytest.approx(4.5)
+
+    dao.agents[dao.add_agent("Late", ["research"])].reputation += 10.0
+    assert dao.get_summary_stats()["avg_agent_reputation"] == pytest.approx((45.0 + 110.0) / 11)
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_reputation_epochs_keep_the_average(columnar):
+    dao = DAOSimulation(columnar=columnar)
+    addresses = dao.add_agents((f"Agent{i}", ["research"], 1000.0) for i in range(5))
+    dao.enable_reputation_engine(grace_epochs=0)
+    dao.agents[addresses[0]].reputation = 40.0
+    dao.run_reputation_epoch()
+    dao.run_reputation_epoch()
+
+    assert dao.agents[addresses[0]].reputation > 40.0  # Decayed toward the target
+    expected = sum(agent.reputation for agent in dao.agents.values()) / len(dao.agents)
+    assert dao.get_summary_stats()["avg_agent_reputation"] == pytest.approx(expected)
@@ -0,0 +1,57 @@
+from bbllcDeploymentSim import AgentManagementSystem, BlockchainSimulator
+from money import to_wei
+
+
+def _chain(quota):
+    chain = BlockchainSimulator(tenant_ops_per_block=quota)
+    chain.create_bbllc("Acme", "Initiator", {"voting_threshold": 0.6})
+    chain.create_bbllc("Quiet", "Initiator", {"voting_threshold": 0.6})
+    return chain
+
+
+def test_deferred_task_keeps_its_id_and_is_encrypted_on_replay():
+    chain = _chain(quota=1)
+    posted = chain.post_task("Consumer", "First", ["research"], 100.0, 0, "secret-1", bbllc_name="Acme")
+    deferred = chain.post_task("Consumer", "Second", ["research"], 100.0, 0, "secret-2", bbllc_name="Acme")
+
+    assert posted in chain.tasks and deferred not in chain.tasks
+    assert chain.deferred_tasks == {deferred: "Acme"}
+
+    chain.advance_block()
+
+    task = chain.tasks[deferred]
+    assert task.description == "Second" and task.encrypted_details is not None
+    assert chain.encrypted_on_chain_data[deferred] == task.encrypted_details
+    assert chain.tenants.tenant_of_task(deferred).name == "Acme"
+    assert chain.deferred_tasks == {}
+
+
+def test_batch_replay_respects_quota_and_order():
+    chain = _chain(quota=2)
+    ids = chain.post_tasks([("Consumer", f"Task {i}", ["research"], 100.0, 0) for i in range(5)], "Acme")
+    quiet = chain.post_tasks([("Consumer", "Quiet", ["writing"], 100.0, 0)], "Quiet")
+
+    assert [task_id in chain.tasks for task_id in ids] == [True, True, False, False, False]
+    assert quiet[0] in chain.tasks  # The hot tenant does not use up other tenants' quota
+
+    chain.advance_block()
+    assert [task_id in chain.tasks for task_id in ids] == [True, True, True, True, False]
+    chain.advance_block()
+    assert all(task_id in chain.tasks for task_id in ids)
+    assert [chain.tasks[task_id].description for task_id in ids] == [f"Task {i}" for i in range(5)]
+    assert chain.tenants.get("Acme").stats()["backlog"] == 0
+    assert chain.tenants.get("Acme").deferred == 3
+
+
+def test_single_and_bulk_provisioning_register_with_the_tenant():
+    chain = _chain(quota=None)
+    ams = AgentManagementSystem(chain)
+    ams.provision_agent("Solo", "AI_LLM", ["research"], initial_funds=10.0, bbllc_name="Acme")
+    ams.provision_agents([("Bulk", "AI_LLM", ["research"], False, 5.0)], bbllc_name="Acme")
+    ams.provision_agent("Free", "AI_LLM", ["research"])
+
+    acme = chain.tenants.get("Acme")
+    assert chain.tenants.tenant_of_agent("Solo") is acme
+    assert chain.tenants.tenant_of_agent("Free") is None
+    assert acme.agents == {"Solo", "Bulk"}
+    assert acme.wallet_total_wei() == acme.treasury.funds_wei + to_wei(15.0)
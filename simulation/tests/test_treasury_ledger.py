@@ -0,0 +1,62 @@
+import pytest
+
+from dao_simulation import DAOSimulation
+from money import to_wei
+from treasury_ledger import TreasuryLedger
+
+
+def test_settlement_balances_every_account():
+    ledger = TreasuryLedger(opening_balance=to_wei(1000))
+    ledger.queue_reward("agent_1", to_wei(250), memo="mission_1")
+    ledger.queue_reward("agent_2", to_wei(100))
+    ledger.queue_reward("agent_1", to_wei(50))
+
+    paid = ledger.settle(timestamp=1.0)
+
+    assert paid == {"agent_1": to_wei(300), "agent_2": to_wei(100)}
+    assert ledger.balance(TreasuryLedger.TREASURY) == to_wei(600)
+    assert ledger.balance(TreasuryLedger.EXTERNAL) == -to_wei(1000)
+    assert ledger.total_received("agent_1") == to_wei(300)
+    assert ledger.check_invariants()
+    assert {entry["batch"] for entry in ledger.history("agent_1")} == {2}
+
+
+def test_overdrawing_or_negative_batch_is_refused_intact():
+    ledger = TreasuryLedger(opening_balance=to_wei(100))
+    ledger.queue_reward("agent_1", to_wei(150))
+    assert ledger.settle(timestamp=1.0) is None
+    assert ledger.pending_total() == to_wei(150)
+
+    ledger.pending_rewards = [("agent_1", -1, None)]
+    assert ledger.settle(timestamp=1.0) is None
+    assert len(ledger) == 1 and ledger.check_invariants()
+
+
+def test_reward_to_treasury_raises_before_posting():
+    ledger = TreasuryLedger(opening_balance=to_wei(100))
+    ledger.queue_reward("agent_1", to_wei(10))
+    ledger.queue_reward(TreasuryLedger.TREASURY, to_wei(10))
+
+    with pytest.raises(ValueError, match="out of balance"):
+        ledger.settle(timestamp=1.0)
+    assert len(ledger) == 1
+    assert ledger.balance("agent_1") == 0 and len(ledger.pending_rewards) == 2
+
+
+def test_overdrawn_auto_settlement_is_counted_and_retried():
+    dao = DAOSimulation()
+    agent = dao.add_agent("Ada", ["research"])
+    mission_id = dao.create_mission("Survey", "", {"research"}, budget=500.0)
+    dao.missions[mission_id].assigned_agents = [agent]
+    dao.treasury_balance = 100.0
+
+    dao._distribute_mission_rewards(mission_id, {"final_outcome": "success",
+                                                 "performance_scores": {agent: [1.0]}})
+    stats = dao.get_summary_stats()
+    assert stats["failed_settlements"] == 1 and stats["pending_rewards"] == 1
+    assert dao.treasury_balance == 100.0 and dao.agents[agent].total_earnings == 0.0
+
+    dao.treasury_balance = 1000.0
+    assert dao.settle_rewards()
+    assert dao.get_summary_stats()["pending_rewards"] == 0
+    assert dao.agents[agent].total_earnings == 500.0
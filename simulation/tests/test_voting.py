@@ -0,0 +1,82 @@
+from dao_simulation import DAOSimulation
+from voting_power import DelegatedVoting
+
+
+def _setup():
+    dao = DAOSimulation()
+    alice = dao.add_member("Alice", 1000)
+    bob = dao.add_member("Bob", 500)
+    proposal_id = dao.create_proposal(alice, "Proposal", "", {
+        "title": "Mission", "description": "", "required_capabilities": ["research"], "budget": 100
+    })
+    return dao, alice, bob, proposal_id
+
+
+def _tallies(dao, proposal_id):
+    proposal = dao.proposals[proposal_id]
+    return proposal.for_votes, proposal.against_votes
+
+
+def test_bulk_revote_replaces_single_vote():
+    dao, alice, _, proposal_id = _setup()
+    dao.vote_on_proposal(proposal_id, alice, True)
+    dao.cast_votes([proposal_id], [alice], [False])
+
+    assert _tallies(dao, proposal_id) == (0.0, 1000.0)
+    assert [vote["support"] for vote in dao.get_voting_history(alice)] == [True, False]
+
+
+def test_single_revote_replaces_bulk_vote():
+    dao, alice, bob, proposal_id = _setup()
+    dao.cast_votes([proposal_id, proposal_id], [alice, bob], [False, True])
+    dao.vote_on_proposal(proposal_id, alice, True)
+
+    assert _tallies(dao, proposal_id) == (1500.0, 0.0)
+    assert [vote["support"] for vote in dao.get_voting_history(alice)] == [False, True]
+    assert len(dao.get_voting_history(bob)) == 1
+
+
+def test_last_ballot_in_a_batch_wins():
+    dao, alice, bob, proposal_id = _setup()
+    counted = dao.cast_votes([proposal_id] * 3, [bob, bob, alice], [True, False, True])
+
+    assert counted == 2
+    assert _tallies(dao, proposal_id) == (1000.0, 500.0)
+    assert dao.proposals[proposal_id].votes[bob]["support"] is False
+
+
+def test_votes_on_closed_proposals_are_ignored():
+    dao, alice, bob, proposal_id = _setup()
+    dao.vote_on_proposal(proposal_id, alice, True)
+    dao.finalize_proposal(proposal_id)
+
+    assert dao.cast_votes([proposal_id], [bob], [False]) == 0
+    assert not dao.vote_on_proposal(proposal_id, bob, False)
+    assert dao.get_voting_history(bob) == []
+
+
+def test_direct_holding_changes_refresh_cached_power():
+    for columnar in (False, True):
+        dao = DAOSimulation(voting_strategy=DelegatedVoting(), columnar=columnar)
+        alice = dao.add_member("Alice", 1000)
+        bob = dao.add_member("Bob", 500)
+        dao.delegate_votes(bob, alice)
+
+        dao.members[bob].token_balance = 2000
+        dao.members[alice].reputation = 50.0
+
+        assert dao.get_voting_power(alice) == 2500.0
+        assert dao.members[alice].get_voting_power() == 2500.0
+        assert dao.members[bob].get_voting_power() == 0.0
+        assert dao.voting_strategy.total_power == 2500.0
+
+
+def test_member_voting_history_reads_the_vote_log():
+    dao, alice, bob, proposal_id = _setup()
+    dao.vote_on_proposal(proposal_id, alice, True)
+    dao.cast_votes([proposal_id], [alice], [False])
+
+    history = dao.members[alice].voting_history
+    assert [(vote["proposal_id"], vote["support"]) for vote in history] == [(proposal_id, True), (proposal_id, False)]
+    assert history == dao.get_voting_history(alice)
+    assert dao.members[bob].voting_history == []
@@ -0,0 +1,44 @@
+import random
+
+import pytest
+
+from dao_simulation import DAOSimulation
+from voting_power import DelegatedVoting, QuadraticVoting
+
+
+def test_delegated_power_stays_equal_to_a_rebuild():
+    rng = random.Random(8)
+    strategy = DelegatedVoting(QuadraticVoting())
+    dao = DAOSimulation(voting_strategy=strategy)
+    members = [dao.add_member(f"member_{i}", rng.uniform(10, 1000)) for i in range(60)]
+    for _ in range(300):
+        choice = rng.random()
+        if choice < 0.4:
+            dao.delegate_votes(rng.choice(members), rng.choice(members))
+        elif choice < 0.6:
+            strategy.undelegate(rng.choice(members))
+        else:
+            dao.update_member(rng.choice(members), token_balance=rng.uniform(0, 2000),
+                              reputation=rng.uniform(50, 150))
+
+    cached = {member: strategy.get_power(member) for member in members}
+    total = strategy.total_power
+    strategy.rebuild(dao.members)
+    assert cached == pytest.approx({member: strategy.get_power(member) for member in members})
+    assert total == pytest.approx(strategy.total_power)
+    assert sum(cached.values()) == pytest.approx(total)
+
+
+def test_delegation_cycles_are_refused():
+    strategy = DelegatedVoting()
+    dao = DAOSimulation(voting_strategy=strategy)
+    a, b, c = (dao.add_member(name, 100) for name in ("A", "B", "C"))
+    assert dao.delegate_votes(a, b)
+    assert dao.delegate_votes(b, c)
+    assert not dao.delegate_votes(c, a)
+    assert strategy.get_power(c) == pytest.approx(300.0)
+    assert strategy.get_power(a) == 0.0
+
+    strategy.remove_member(b)
+    assert strategy.get_power(a) == pytest.approx(100.0)
+    assert strategy.get_power(c) == pytest.approx(100.0)
@@ -0,0 +1,171 @@
+"""
+Treasury Ledger for the DAO Simulation
+
+Append-only double-entry ledger: every entry moves an amount from one account
+to another, so the balances of all accounts always sum to zero (money enters
+through the external account, which goes negative). Entries live in array
+columns, and each account keeps an index of the rows that touch it, so
+balances, earnings and account histories never scan the whole ledger.
+
+Amounts are integer smallest units (see money.py), so every balance is exact.
+"""
+
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from money import Wei
+
+
+class TreasuryLedger:
+    """Double-entry, array-backed treasury ledger with batched reward settlement"""
+
+    EXTERNAL = "external"  # Source of deposits into the DAO
+    TREASURY = "treasury"
+    ENTRY_KINDS = ("deposit", "reward", "adjustment")
+
+    def __init__(self, opening_balance: Wei = 0, timestamp: float = 0.0):
+        self.accounts: List[str] = []
+        self._account_index: Dict[str, int] = {}
+        self.balances: List[Wei] = []  # Lists of ints: 18-decimal amounts overflow int64 arrays
+        self.received: List[Wei] = []  # Lifetime inflows per account
+        self._postings: List[array] = []  # Per account: rows that touch it
+
+        # Entry columns
+        self.from_column = array('l')
+        self.to_column = array('l')
+        self.amount_column: List[Wei] = []
+        self.kind_column = array('b')
+        self.batch_column = array('l')
+        self.timestamp_column = array('d')
+        self.memos: Dict[int, str] = {}  # Sparse: only rows that carry a memo
+
+        self.batches = 0
+        self.pending_rewards: List[Tuple[str, Wei, Optional[str]]] = []
+
+        self.open_account(self.EXTERNAL)
+        self.open_account(self.TREASURY)
+        if opening_balance:
+            self.post(self.EXTERNAL, self.TREASURY, opening_balance, "deposit", timestamp)
+
+    def __len__(self) -> int:
+        return len(self.amount_column)
+
+    def open_account(self, name: str) -> int:
+        """Get an account's index, creating the account if needed"""
+        idx = self._account_index.get(name)
+        if idx is None:
+            idx = self._account_index[name] = len(self.accounts)
+            self.accounts.append(name)
+            self.balances.append(0)
+            self.received.append(0)
+            self._postings.append(array('l'))
+        return idx
+
+    def post(self, from_account: str, to_account: str, amount: Wei, kind: str,
+             timestamp: float, memo: Optional[str] = None) -> int:
+        """Append a single entry outside any reward batch; returns its row"""
+        self.batches += 1
+        return self._append(self.open_account(from_account), self.open_account(to_account),
+                            amount, self.ENTRY_KINDS.index(kind), self.batches, timestamp, memo)
+
+    def queue_reward(self, agent: str, amount: Wei, memo: Optional[str] = None):
+        """Queue a treasury-to-agent reward for the next settlement"""
+        self.pending_rewards.append((agent, amount, memo))
+
+    def pending_total(self) -> Wei:
+        """Sum of queued, unsettled rewards"""
+        return sum(amount for _, amount, _ in self.pending_rewards)
+
+    def settle(self, timestamp: float) -> Optional[Dict[str, Wei]]:
+        """Pay every queued reward in one batch.
+
+        Returns {agent: amount paid} or None (leaving the queue intact) when a
+        reward is negative or the batch would overdraw the treasury. Raises
+        ValueError, also leaving the queue intact, if a reward targets the treasury.
+        """
+        if not self.pending_rewards:
+            return {}
+
+        total = self.pending_total()
+        treasury = self._account_index[self.TREASURY]
+        if total > self.balances[treasury] or any(amount < 0 for _, amount, _ in self.pending_rewards):
+            return None
+        # A reward to the treasury itself would debit and credit the same account, so the
+        # batch would not move what it reports as paid; refused before any balance changes
+        if any(agent == self.TREASURY for agent, _, _ in self.pending_rewards):
+            raise ValueError("treasury settlement out of balance")
+
+        self.batches += 1
+        paid: Dict[str, Wei] = {}
+        reward_kind = self.ENTRY_KINDS.index("reward")
+        for agent, amount, memo in self.pending_rewards:
+            self._append(treasury, self.open_account(agent), amount, reward_kind,
+                         self.batches, timestamp, memo)
+            paid[agent] = paid.get(agent, 0) + amount
+        self.pending_rewards = []
+        return paid
+
+    def balance(self, account: str) -> Wei:
+        """Current balance of an account"""
+        idx = self._account_index.get(account)
+        return self.balances[idx] if idx is not None else 0
+
+    def total_received(self, account: str) -> Wei:
+        """Lifetime inflows of an account (an agent's earnings)"""
+        idx = self._account_index.get(account)
+        return self.received[idx] if idx is not None else 0
+
+    def history(self, account: str, limit: Optional[int] = None) -> List[Dict]:
+        """Entries touching an account, oldest first (most recent `limit` if given)"""
+        idx = self._account_index.get(account)
+        if idx is None:
+            return []
+        rows = self._postings[idx]
+        if limit is not None:
+            rows = rows[-limit:]
+        return [self.entry(row) for row in rows]
+
+    def entry(self, row: int) -> Dict:
+        """Materialize one ledger row"""
+        return {
+            'row': row,
+            'from': self.accounts[self.from_column[row]],
+            'to': self.accounts[self.to_column[row]],
+            'amount': self.amount_column[row],
+            'kind': self.ENTRY_KINDS[self.kind_column[row]],
+            'batch': self.batch_column[row],
+            'timestamp': self.timestamp_column[row],
+            'memo': self.memos.get(row)
+        }
+
+    def check_invariants(self) -> bool:
+        """Verify that all balances net to zero and match the entry columns"""
+        if sum(self.balances) != 0:
+            return False
+        treasury = self._account_index[self.TREASURY]
+        inflow = sum(self.amount_column[row] for row in self._postings[treasury]
+                     if self.to_column[row] == treasury)
+        outflow = sum(self.amount_column[row] for row in self._postings[treasury]
+                      if self.from_column[row] == treasury)
+        return inflow - outflow == self.balances[treasury]
+
+    def _append(self, from_idx: int, to_idx: int, amount: Wei, kind: int,
+                batch: int, timestamp: float, memo: Optional[str]) -> int:
+        """Write one entry and update balances and per-account indexes"""
+        row = len(self.amount_column)
+        self.from_column.append(from_idx)
+        self.to_column.append(to_idx)
+        self.amount_column.append(amount)
+        self.kind_column.append(kind)
+        self.batch_column.append(batch)
+        self.timestamp_column.append(timestamp)
+        if memo is not None:
+            self.memos[row] = memo
+
+        self.balances[from_idx] -= amount
+        self.balances[to_idx] += amount
+        self.received[to_idx] += amount
+        self._postings[from_idx].append(row)
+        if to_idx != from_idx:
+            self._postings[to_idx].append(row)
+        return row